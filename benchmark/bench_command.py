@@ -0,0 +1,83 @@
+"""Measures the client CPU cost per call of device requests and compiled commands.
+
+The socket is replaced by an in-process responder that answers every request as soon
+as it is sent, so no time is spent waiting on the network or a remote server and the
+measurement contains the client side encoding, sending and decoding plus the small
+fixed cost of the responder. Usage:
+
+    python benchmark/bench_command.py --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_device import PearyDevice
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Buffer
+
+RESPONSE = b"1.2"
+
+
+class _ResponderSocket:
+    """Socket stand-in answering each request frame with a fixed response."""
+
+    def __init__(self) -> None:
+        """Initializes the responder without queued responses."""
+        self._pending = bytearray()
+
+    def settimeout(self, value: float | None) -> None:
+        """Ignores the timeout since no call blocks."""
+
+    def sendmsg(self, buffers: Iterable[Buffer], *_: object) -> int:
+        """Queues a response with the tag of every sent request frame."""
+        data = b"".join(buffers)
+        offset = 0
+        while offset < len(data):  # pylint: disable=while-used
+            length, tag, _ = PearyProtocol.STRUCT_PREFIX.unpack_from(data, offset)
+            self._pending += PearyProtocol.encode(RESPONSE, tag, 0)
+            offset += PearyProtocol.STRUCT_LENGTH.size + length
+        return len(data)
+
+    def recv_into(self, buffer: WriteableBuffer, *_: object) -> int:
+        """Copies the queued responses into the buffer."""
+        with memoryview(buffer) as view:
+            size = min(len(view), len(self._pending))
+            view[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+
+def _cost(call: Callable[[], object], calls: int) -> float:
+    """Returns the process CPU time per call in microseconds."""
+    start = time.process_time()
+    for _ in range(calls):
+        call()
+    return (time.process_time() - start) / calls * 1e6
+
+
+def main() -> None:
+    """Compares the per call cost of a device method and its compiled command."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200000)
+    args = parser.parse_args()
+    protocol = PearyProtocol(_ResponderSocket(), checks=PearyProtocol.Checks.CHECK_NONE)
+    device = PearyDevice(0, protocol)
+    command = device.compile("get_voltage", "PWR_OUT_1")
+    results = {
+        "device.get_voltage": lambda: device.get_voltage("PWR_OUT_1"),
+        "compiled command": lambda: float(command()),
+    }
+    for name, call in results.items():
+        print(f"{name:>20s}: {_cost(call, args.calls):6.2f} us/call")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
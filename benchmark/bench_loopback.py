@@ -0,0 +1,135 @@
+"""Measures PearyProtocol round trips per second over a loopback connection.
+
+The remote peary server is replaced by a minimal responder thread that answers every
+request with a fixed payload, so the measurement is dominated by the client side of
+the protocol. Usage:
+
+    python benchmark/bench_loopback.py --requests 20000 --payload-size 16 65536
+
+Requests are pipelined in bursts when a window larger than one is given, and a fixed
+response latency can be added to emulate the round trip time of a test stand.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import queue
+import socket
+import threading
+import time
+
+from peary.peary_protocol import PearyProtocol
+
+VERSION_REQUEST = b"protocol_version"
+
+
+def _recv_exactly(connection: socket.socket, view: memoryview) -> bool:
+    """Fills a view from a connection and returns False once the peer has closed."""
+    while view:  # pylint: disable=while-used
+        if not (size := connection.recv_into(view)):
+            return False
+        view = view[size:]
+    return True
+
+
+def _send_delayed(
+    connection: socket.socket, frames: queue.SimpleQueue[tuple[float, bytes] | None]
+) -> None:
+    """Sends queued frames once their due time has passed."""
+    with contextlib.suppress(OSError):
+        while (item := frames.get()) is not None:  # pylint: disable=while-used
+            due, frame = item
+            time.sleep(max(0.0, due - time.perf_counter()))
+            connection.sendall(frame)
+
+
+def _respond(listener: socket.socket, payload_size: int, latency: float) -> None:
+    """Answers every request of a single connection with a fixed size payload."""
+    connection, _ = listener.accept()
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    frames: queue.SimpleQueue[tuple[float, bytes] | None] = queue.SimpleQueue()
+    sender = threading.Thread(target=_send_delayed, args=(connection, frames))
+    if latency > 0:
+        sender.start()
+    version = bytearray(PearyProtocol.encode(PearyProtocol.VERSION, 0, 0))
+    response = bytearray(PearyProtocol.encode(bytes(payload_size), 0, 0))
+    prefix = memoryview(bytearray(PearyProtocol.STRUCT_LENGTH.size))
+    with connection, contextlib.suppress(OSError):
+        while _recv_exactly(connection, prefix):  # pylint: disable=while-used
+            (length,) = PearyProtocol.STRUCT_LENGTH.unpack(prefix)
+            request = memoryview(bytearray(length))
+            if not _recv_exactly(connection, request):
+                break
+            tag, _ = PearyProtocol.STRUCT_HEADER.unpack_from(request)
+            frame = version if bytes(request[4:]) == VERSION_REQUEST else response
+            PearyProtocol.STRUCT_HEADER.pack_into(frame, 4, tag, 0)
+            if latency > 0:
+                frames.put((time.perf_counter() + latency, bytes(frame)))
+            else:
+                connection.sendall(frame)
+    if latency > 0:
+        frames.put(None)
+        sender.join()
+
+
+def _check(payload: bytes, payload_size: int) -> None:
+    """Raises if a response payload does not have the expected size."""
+    if len(payload) != payload_size:
+        raise PearyProtocol.DecodeError("Truncated response payload.")
+
+
+def benchmark(
+    requests: int, payload_size: int, *, window: int = 1, latency: float = 0.0
+) -> float:
+    """Returns the number of round trips per second for a response payload size."""
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        responder = threading.Thread(
+            target=_respond, args=(listener, payload_size, latency), daemon=True
+        )
+        responder.start()
+        with socket.create_connection(listener.getsockname()) as connection:
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            protocol = PearyProtocol(connection, timeout=10)
+            start = time.perf_counter()
+            if window == 1:
+                for _ in range(requests):
+                    _check(
+                        protocol.request("device.get_register", "0", "r"), payload_size
+                    )
+            else:
+                for burst in range(0, requests, window):
+                    tags = [
+                        protocol.send_request("device.get_register", "0", "r")
+                        for _ in range(min(window, requests - burst))
+                    ]
+                    for tag in tags:
+                        _check(protocol.recv_response(tag), payload_size)
+            elapsed = time.perf_counter() - start
+            connection.shutdown(socket.SHUT_RDWR)
+        responder.join()
+    return requests / elapsed
+
+
+def main() -> None:
+    """Runs the benchmark for each requested payload size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--payload-size", type=int, nargs="+", default=[16, 65536])
+    parser.add_argument("--window", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    args = parser.parse_args()
+    for payload_size in args.payload_size:
+        try:
+            rate = benchmark(
+                args.requests, payload_size, window=args.window, latency=args.latency
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+            result = f"failed ({type(e).__name__}: {e})"
+        else:
+            result = f"{rate:12.0f} round trips/s"
+        print(f"payload {payload_size:>8d} bytes: {result}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Runs the protocol and end-to-end benchmarks and writes the results to a JSON file.
+
+The end-to-end benchmarks connect a `PearyClient` over loopback to a `PearyEmulator`
+running in a background thread, so they include the client, the kernel socket path and
+the small fixed cost of the emulator but no hardware. The round trip is also measured
+over a Unix domain socket and in-process, which separates the cost of the transport
+from the cost of the client. Usage:
+
+    python benchmark/bench_suite.py --output benchmark.json --repeat 5
+
+Each benchmark is repeated and the fastest repetition is reported, which is the least
+disturbed by other processes. The output holds the environment next to the results so
+files written by different releases can be compared directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import importlib.metadata
+import json
+import platform
+import socket
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from caribou.caribou_board import CaribouBoard
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+from peary.peary_transport import PearyInProcessTransport, PearyUnixTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from peary.peary_proxy import PearyProxy
+
+REQUEST = b"device.get_register 0 register_0"
+
+
+async def _close(server: asyncio.Server) -> None:
+    """Stops accepting connections and waits for the open connections to close."""
+    server.close()
+    await server.wait_closed()
+    await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+
+@contextlib.contextmanager
+def _emulator(path: Path | None = None) -> Iterator[int]:
+    """Runs an emulated peary server in a background thread and yields its port.
+
+    The server also listens on the Unix domain socket at the path, if given.
+    """
+    emulator = PearyEmulator()
+    loop = asyncio.new_event_loop()
+    servers = [loop.run_until_complete(emulator.start("127.0.0.1", 0))]
+    if path is not None:
+        servers.append(loop.run_until_complete(emulator.start_unix(str(path))))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield servers[0].sockets[0].getsockname()[1]
+    finally:
+        for server in servers:
+            asyncio.run_coroutine_threadsafe(_close(server), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _best(call: Callable[[], object], repeat: int) -> float:
+    """Returns the shortest wall clock time in seconds of repeated calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_encode(count: int, repeat: int) -> dict[str, float]:
+    """Measures the rate of encoding request frames."""
+
+    def _encode() -> None:
+        for tag in range(count):
+            PearyProtocol.encode(REQUEST, tag & PearyProtocol.TAG_MAX, 0)
+
+    return {"frames_per_s": count / _best(_encode, repeat)}
+
+
+def bench_decode(count: int, repeat: int) -> dict[str, float]:
+    """Measures the rate of decoding response frames."""
+    frame = PearyProtocol.encode(REQUEST, 1, 0)
+
+    def _decode() -> None:
+        for _ in range(count):
+            PearyProtocol.decode(frame)
+
+    return {"frames_per_s": count / _best(_decode, repeat)}
+
+
+def bench_round_trip(proxy: PearyProxy, count: int, repeat: int) -> dict[str, float]:
+    """Measures the latency of sequential keep alive requests over loopback."""
+    stats = PearyStats()
+    proxy.protocol.stats = stats
+
+    def _round_trips() -> None:
+        for _ in range(count):
+            proxy.keep_alive()
+
+    elapsed = _best(_round_trips, repeat)
+    proxy.protocol.stats = None
+    summary = stats.snapshot()[""]
+    return {
+        "round_trips_per_s": count / elapsed,
+        "mean_us": summary.mean * 1e6,
+        "p50_us": summary.p50 * 1e6,
+        "p99_us": summary.p99 * 1e6,
+    }
+
+
+def bench_register_readout(
+    proxy: PearyProxy, registers: int, repeat: int
+) -> dict[str, float]:
+    """Measures the time to read a block of registers one by one and in a batch."""
+    device = proxy.add_device("Readout")
+    names = [f"register_{index}" for index in range(registers)]
+    with device.batch() as batch:
+        for value, name in enumerate(names):
+            batch.set_register(name, value)
+
+    def _sequential() -> None:
+        for name in names:
+            device.get_register(name)
+
+    def _batched() -> None:
+        with device.batch() as batch:
+            for name in names:
+                batch.get_register(name)
+
+    return {
+        "registers": registers,
+        "sequential_ms": _best(_sequential, repeat) * 1e3,
+        "batched_ms": _best(_batched, repeat) * 1e3,
+    }
+
+
+def bench_caribou_board(proxy: PearyProxy, count: int, repeat: int) -> dict[str, float]:
+    """Measures the time to construct a caribou board including its I2C setup."""
+    index = int(proxy.protocol.request("add_device", "Caribou"))
+
+    def _construct() -> None:
+        for _ in range(count):
+            CaribouBoard(index, proxy.protocol)
+
+    return {"construction_us": _best(_construct, repeat) / count * 1e6}
+
+
+def run(*, count: int, registers: int, repeat: int) -> dict[str, dict[str, float]]:
+    """Runs all benchmarks.
+
+    Args:
+        count: Number of operations timed by the rate and latency benchmarks.
+        registers: Number of registers read by the readout benchmark.
+        repeat: Number of repetitions of each benchmark.
+
+    Returns:
+        dict[str, dict[str, float]]: The metrics of each benchmark by its name.
+
+    """
+    results = {
+        "encode": bench_encode(count, repeat),
+        "decode": bench_decode(count, repeat),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "peary.sock" if hasattr(socket, "AF_UNIX") else None
+        with _emulator(path) as port:
+            with PearyClient("127.0.0.1", port) as proxy:
+                results["round_trip"] = bench_round_trip(proxy, count // 10, repeat)
+                results["register_readout"] = bench_register_readout(
+                    proxy, registers, repeat
+                )
+                results["caribou_board"] = bench_caribou_board(
+                    proxy, count // 100, repeat
+                )
+            if path is not None:
+                with PearyClient(PearyUnixTransport(path)) as proxy:
+                    results["round_trip_unix"] = bench_round_trip(
+                        proxy, count // 10, repeat
+                    )
+    with PearyClient(PearyInProcessTransport(PearyEmulator())) as proxy:
+        results["round_trip_in_process"] = bench_round_trip(proxy, count // 10, repeat)
+    return results
+
+
+def main() -> None:
+    """Runs the benchmark suite and writes the results with their environment."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark.json"))
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--registers", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    results = run(count=args.count, registers=args.registers, repeat=args.repeat)
+    report = {
+        "environment": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "version": importlib.metadata.version("peary-client"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            print(f"{name:>21s} {metric:>18s}: {value:14.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,12 @@ def build_venv(session):
             task(session, *session.posargs[1:])
 
 
+@nox.session(reuse_venv=True, default=False)
+def benchmark(session):
+    """Runs the benchmark suite."""
+    session.notify("build_venv", posargs=([_benchmark], *session.posargs))
+
+
 @nox.session(reuse_venv=True, default=False, python=False)
 def clean(session):
     """Cleans the virtual environments."""
@@ -52,6 +58,11 @@ def test(session):
     session.notify("build_venv", posargs=([_test], *session.posargs))
 
 
+def _benchmark(session, *args):
+    """Executes the environment command for the benchmark suite."""
+    session.run("python", "benchmark/bench_suite.py", *args)
+
+
 def _cli(session, *args):
     """Executes the environment command for the CLI."""
     if session.posargs:
@@ -1 +1,3 @@
+from .async_peary_client import AsyncPearyClient, AsyncPearyProxy  # noqa: F401
 from .peary_client import PearyClient, PearyProxy  # noqa: F401
+from .peary_client_pool import PearyClientPool  # noqa: F401
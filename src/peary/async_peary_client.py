@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+
+from peary.async_peary_protocol import AsyncPearyProtocol
+from peary.async_peary_proxy import AsyncPearyProxy
+from peary.peary_client import PearyClient
+
+
+class AsyncPearyClient:
+    """Connect to a remote peary server instance using asyncio.
+
+    The client supports the asynchronous context manager protocol and should be used in
+    an async with statement for automatic connection closing on errors, i.e.
+
+        async with AsyncPearyClient(host='localhost') as client:
+            # await something with the client
+
+    Many clients can be driven concurrently by a single event loop.
+
+    """
+
+    PearySockerError = PearyClient.PearySockerError
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 12345,
+        *,
+        protocol_class: type[AsyncPearyProtocol] = AsyncPearyProtocol,
+    ) -> None:
+        """Initializes a new asyncio peary client.
+
+        Args:
+            host: Hostname of the remote peary server.
+            port: Port number of the remote peary server. Defaults to 12345.
+            protocol_class: Class used for the protocol. Defaults to
+                AsyncPearyProtocol.
+
+        """
+        self._host = host
+        self._port = port
+        self._protocol_class = protocol_class
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def __aenter__(self) -> AsyncPearyProxy:
+        """Enters a connection with a peary server.
+
+        Returns:
+            AsyncPearyProxy: Proxy connected to the remote peary server.
+
+        Raises:
+            PearySockerError: If client cannot not connect to remote host.
+
+        """
+        try:
+            reader, self._writer = await asyncio.open_connection(self._host, self._port)
+        except Exception as e:
+            raise PearyClient.PearySockerError(
+                f"Unable to connect to host {self._host} using port {self._port}."
+            ) from e
+
+        protocol = self._protocol_class(reader, self._writer)
+        await protocol.verify()
+        return AsyncPearyProxy(protocol)
+
+    async def __aexit__(self, *_: object) -> None:
+        """Exits a context block.
+
+        Args:
+            _: Catches the usued arguments required for the __aexit__ function.
+
+        """
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
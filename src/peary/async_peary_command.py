@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from peary.async_peary_protocol import AsyncPearyProtocol
+
+
+class AsyncPearyCommand:
+    """An asyncio request whose payload is encoded once and reused for every call.
+
+    The asyncio counterpart of `PearyCommand`, i.e.
+
+        voltage = device.compile("get_voltage", "PWR_OUT_1")
+        while True:
+            print(float(await voltage()))
+
+    """
+
+    def __init__(self, protocol: AsyncPearyProtocol, msg: str, *args: str) -> None:
+        """Initializes a new compiled command.
+
+        Args:
+            protocol: Protocol connected to the remote peary server.
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        """
+        self._protocol = protocol
+        self._request = (msg, PearyProtocol.encode_message(msg, args))
+
+    @property
+    def msg(self) -> str:
+        """Returns the request message."""
+        return self._request[0]
+
+    @property
+    def payload(self) -> bytes:
+        """Returns the encoded request payload."""
+        return self._request[1]
+
+    async def send(self) -> int:
+        """Sends the request without waiting for its response.
+
+        Returns:
+            int: The request tag used to collect the response with `recv_response`.
+
+        """
+        return await self._protocol.send_payload(*self._request)
+
+    async def __call__(self) -> bytes:
+        """Sends the request and returns the response payload.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return await self._protocol.request_payload(*self._request)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from peary.async_peary_client import AsyncPearyClient
+from peary.async_peary_protocol import AsyncPearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from typing_extensions import Self
+
+    from peary.async_peary_proxy import AsyncPearyProxy
+
+T = TypeVar("T")
+
+
+class PearyFanoutResult(Generic[T]):
+    """Outcome of an operation performed on the peary server of a single host."""
+
+    def __init__(
+        self, host: str, elapsed: float, value: T | None, error: Exception | None
+    ) -> None:
+        """Initializes a new fan-out result.
+
+        Args:
+            host: The name of the host.
+            elapsed: Time in seconds the operation took on the host.
+            value: The value returned by the operation, if it succeeded.
+            error: The exception raised by the operation, if it failed.
+
+        """
+        self._host = host
+        self._elapsed = elapsed
+        self._value = value
+        self._error = error
+
+    @property
+    def host(self) -> str:
+        """Returns the name of the host."""
+        return self._host
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the time in seconds the operation took on the host."""
+        return self._elapsed
+
+    @property
+    def error(self) -> Exception | None:
+        """Returns the exception raised by the operation, if it failed."""
+        return self._error
+
+    def result(self) -> T:
+        """Returns the value returned by the operation.
+
+        Returns:
+            T: The value returned by the operation.
+
+        Raises:
+            Exception: The exception of the operation if it failed.
+
+        """
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore[return-value]
+
+
+class AsyncPearyFanout:
+    """Performs the same operation on the peary servers of many hosts concurrently.
+
+    All connections are driven by a single event loop, so dozens of hosts need no
+    thread per host. Each operation returns the result, error and timing per host, i.e.
+
+        async with AsyncPearyFanout(["stand1", ("stand2", 12346)]) as fanout:
+            results = await fanout.run(lambda proxy: proxy.keep_alive())
+            for host, result in results.items():
+                print(host, result.elapsed, result.error)
+
+    Hosts are named by their hostname, or by hostname and port if a port is given.
+    Hosts failing to connect are kept, and their connection error is the result of
+    every operation.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str | tuple[str, int]],
+        *,
+        protocol_class: type[AsyncPearyProtocol] = AsyncPearyProtocol,
+    ) -> None:
+        """Initializes a new fan-out controller without connecting.
+
+        Args:
+            hosts: Hostnames of the remote peary servers, or their hostnames and ports.
+            protocol_class: Class used for the protocols. Defaults to
+                AsyncPearyProtocol.
+
+        """
+        self._clients = {
+            (host if isinstance(host, str) else f"{host[0]}:{host[1]}"): (
+                AsyncPearyClient(host, protocol_class=protocol_class)
+                if isinstance(host, str)
+                else AsyncPearyClient(*host, protocol_class=protocol_class)
+            )
+            for host in hosts
+        }
+        self._proxies: dict[str, AsyncPearyProxy] = {}
+        self._errors: dict[str, Exception] = {}
+
+    @property
+    def hosts(self) -> list[str]:
+        """Returns the names of all hosts."""
+        return [*self._clients]
+
+    @property
+    def proxies(self) -> dict[str, AsyncPearyProxy]:
+        """Returns the proxies of the connected hosts by their name."""
+        return dict(self._proxies)
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Returns the connection errors of the hosts failing to connect."""
+        return dict(self._errors)
+
+    async def run(
+        self,
+        operation: Callable[[AsyncPearyProxy], Awaitable[T]],
+        *,
+        timeout: float | None = None,
+    ) -> dict[str, PearyFanoutResult[T]]:
+        """Performs an operation on all connected hosts concurrently.
+
+        Args:
+            operation: Function performing the operation with the proxy of a host.
+            timeout: Time in seconds each host has to complete the operation, or None
+                to wait for the protocol timeouts only. Defaults to None.
+
+        Returns:
+            dict[str, PearyFanoutResult[T]]: The result of each host by its name, in
+                the order of the hosts.
+
+        """
+        results = await asyncio.gather(
+            *(self._run(host, operation, timeout) for host in self._clients)
+        )
+        return {result.host: result for result in results}
+
+    async def _run(
+        self,
+        host: str,
+        operation: Callable[[AsyncPearyProxy], Awaitable[T]],
+        timeout: float | None,
+    ) -> PearyFanoutResult[T]:
+        """Performs an operation on a single host and records its outcome.
+
+        Args:
+            host: The name of the host.
+            operation: Function performing the operation with the proxy of the host.
+            timeout: Time in seconds the host has to complete the operation, or None.
+
+        Returns:
+            PearyFanoutResult[T]: The result of the host.
+
+        """
+        if (proxy := self._proxies.get(host)) is None:
+            return PearyFanoutResult(host, 0.0, None, self._errors[host])
+        start = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(operation(proxy), timeout)
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+            return PearyFanoutResult(host, time.perf_counter() - start, None, e)
+        return PearyFanoutResult(host, time.perf_counter() - start, value, None)
+
+    async def _connect(self, host: str, client: AsyncPearyClient) -> None:
+        """Connects to a single host and records its proxy or connection error.
+
+        Args:
+            host: The name of the host.
+            client: The client of the host.
+
+        """
+        try:
+            # pylint: disable-next=unnecessary-dunder-call
+            self._proxies[host] = await client.__aenter__()
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+            self._errors[host] = e
+
+    async def __aenter__(self) -> Self:
+        """Connects to all hosts concurrently.
+
+        Returns:
+            Self: The fan-out controller.
+
+        """
+        await asyncio.gather(
+            *(self._connect(host, client) for host, client in self._clients.items())
+        )
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Closes the connections of all hosts.
+
+        Args:
+            _: Catches the unused arguments required for the __aexit__ function.
+
+        """
+        await asyncio.gather(
+            *(client.__aexit__(None, None, None) for client in self._clients.values())
+        )
+        self._proxies.clear()
+        self._errors.clear()
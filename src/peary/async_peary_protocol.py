@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from peary.peary_frame_decoder import PearyFrameDecoder
+from peary.peary_protocol import PearyProtocol, PearyRequestTracker
+from peary.peary_request_tracking import PearyRequestTracking
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from peary.peary_frame_decoder import DecodedBytes
+
+
+class AsyncPearyProtocol(PearyRequestTracking):
+    """Asyncio protocol for communication with a remote peary server.
+
+    The wire encoding is shared with `PearyProtocol` and the same exceptions are
+    raised. Requests from concurrent tasks are pipelined over the connection and their
+    responses are matched by tag, i.e.
+
+        voltages = await asyncio.gather(
+            protocol.request("device.get_voltage", "0", "PWR_OUT_1"),
+            protocol.request("device.get_voltage", "0", "PWR_OUT_2"),
+        )
+
+    """
+
+    READ_SIZE = 65536
+
+    Checks = PearyProtocol.Checks
+    DecodeError = PearyProtocol.DecodeError
+    ResponseReceiveError = PearyProtocol.ResponseReceiveError
+    ResponseSequenceError = PearyProtocol.ResponseSequenceError
+    ResponseStatusError = PearyProtocol.ResponseStatusError
+    VersionError = PearyProtocol.VersionError
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        *,
+        timeout: float = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+        max_in_flight: int = 32,
+    ) -> None:
+        """Initializes a new asyncio peary protocol.
+
+        The initialization checks are performed by awaiting `verify`.
+
+        Args:
+            reader: Stream reader connected to the remote peary server.
+            writer: Stream writer connected to the remote peary server.
+            timeout: Response timeout value in seconds. Defaults to 1.
+            checks: Checks performed by `verify`. Defaults to CHECK_VERSION.
+            max_in_flight: Maximum number of pipelined requests awaiting a response
+                before sending waits on receiving responses. Defaults to 32.
+
+        """
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._checks = checks
+        self._tracker = PearyRequestTracker(max_in_flight)
+        self._decoder = PearyFrameDecoder()
+        self._read_lock = asyncio.Lock()
+
+    async def verify(self) -> None:
+        """Performs the initialization checks.
+
+        Raises:
+            VersionError: If protocol version doesn match with remote host.
+
+        """
+        if PearyProtocol.Checks.CHECK_VERSION not in self._checks:
+            return
+        if (version := await self.request("protocol_version")) != PearyProtocol.VERSION:
+            raise PearyProtocol.VersionError(
+                f"Unsupported protocol version: {version!r}"
+            )
+
+    async def request(self, msg: str, *args: str) -> bytes:
+        """Initiates a requst to the connected peary server.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return await self.recv_response(await self.send_request(msg, *args))
+
+    async def send_request(self, msg: str, *args: str) -> int:
+        """Sends a request without waiting for its response.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            int: The request tag used to collect the response.
+
+        """
+        return await self.send_payload(msg, PearyProtocol.encode_message(msg, args))
+
+    async def request_payload(self, msg: str, payload: bytes) -> bytes:
+        """Initiates a request from an already encoded payload.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `PearyProtocol.encode_message`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return await self.recv_response(await self.send_payload(msg, payload))
+
+    async def send_payload(self, msg: str, payload: bytes) -> int:
+        """Sends a request from an already encoded payload without waiting.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `PearyProtocol.encode_message`.
+
+        Returns:
+            int: The request tag used to collect the response.
+
+        """
+        return (await self._send_requests([(msg, payload)]))[0]
+
+    async def request_many(
+        self, requests: Iterable[tuple[str, Sequence[str]]]
+    ) -> list[bytes | Exception]:
+        """Initiates many independent requests and returns all of their responses.
+
+        Args:
+            requests: Sequence of request messages and their additional arguments.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
+
+        """
+        tags = await self._send_requests(
+            (msg, PearyProtocol.encode_message(msg, args)) for msg, args in requests
+        )
+        await self._wait_responses(tags)
+        return [self._tracker.collect_response(tag) for tag in tags]
+
+    async def recv_response(self, tag: int) -> bytes:
+        """Receives the response of a previously sent request.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        await self._wait_responses([tag])
+        return self._tracker.pop_response(tag)
+
+    async def _wait_responses(self, tags: Sequence[int]) -> None:
+        """Receives responses until the responses of pending requests have arrived.
+
+        Args:
+            tags: The request tags returned by `send_request`.
+
+        Raises:
+            CancelledError: If waiting is cancelled, i.e. by a timeout of the caller,
+                in which case all of the requests are abandoned.
+            TimeoutError: If no data arrives within the timeout, in which case all of
+                the requests are abandoned.
+
+        """
+        try:
+            await self._receive_responses(tags)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            for tag in tags:
+                self._tracker.abandon(tag)
+            raise
+
+    async def _receive_responses(self, tags: Iterable[int]) -> None:
+        """Receives responses until the responses of pending requests have arrived.
+
+        Only one task reads from the stream at a time. Responses read by another task
+        are held by the tracker until they are collected.
+
+        Args:
+            tags: The request tags returned by `send_request`.
+
+        """
+        for tag in tags:
+            async with self._read_lock:
+                while not self._tracker.has_response(tag):  # pylint: disable=W0149
+                    await self._receive_response(tag)
+
+    async def _receive_response(self, tag: int) -> None:
+        """Receives a single response and holds it for its pending request.
+
+        Args:
+            tag: The request tag being waited on, used for error reporting.
+
+        """
+        self._tracker.add_response(await self._recv(), tag)
+
+    async def _send_requests(self, requests: Iterable[tuple[str, bytes]]) -> list[int]:
+        """Encodes and writes requests while respecting the in-flight window.
+
+        Args:
+            requests: Sequence of request messages and their encoded payloads.
+
+        Returns:
+            list[int]: The request tags used to collect the responses.
+
+        Raises:
+            CancelledError: If sending is cancelled, i.e. by a timeout of the caller,
+                in which case all of the sent requests are abandoned.
+            TimeoutError: If no response arrives within the timeout while the window
+                is full, in which case all of the sent requests are abandoned.
+
+        """
+        tags: list[int] = []
+        try:
+            await self._write_requests(requests, tags)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            for tag in tags:
+                self._tracker.abandon(tag)
+            raise
+        return tags
+
+    async def _write_requests(
+        self, requests: Iterable[tuple[str, bytes]], tags: list[int]
+    ) -> None:
+        """Encodes and writes requests, receiving responses while the window is full.
+
+        Frames are written before any await, so every pending request has been written
+        whenever another task reads responses.
+
+        Args:
+            requests: Sequence of request messages and their encoded payloads.
+            tags: List receiving the tags of the written requests.
+
+        """
+        buffers: list[bytes] = []
+        for msg, payload in requests:
+            while self._tracker.is_full():  # pylint: disable=while-used
+                self._writer.writelines(buffers)
+                buffers.clear()
+                async with self._read_lock:
+                    if self._tracker.is_full():
+                        await self._receive_response(self._tracker.oldest())
+            tag, frame = self._tracker.encode_request(msg, payload)
+            buffers.extend(frame)
+            tags.append(tag)
+        self._writer.writelines(buffers)
+        await self._writer.drain()
+
+    async def _recv(self) -> DecodedBytes:
+        """Receive a single response frame from the connected stream.
+
+        Returns:
+            DecodedBytes: The decoded response frame.
+
+        Raises:
+            ResponseReceiveError: If the connection closes before a frame is received.
+
+        """
+        while (frame := self._decoder.next_frame()) is None:  # pylint: disable=W0149
+            data = await asyncio.wait_for(
+                self._reader.read(self.READ_SIZE), self._timeout
+            )
+            if not data:
+                raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
+            self._decoder.feed(data)
+        return frame
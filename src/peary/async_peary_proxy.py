@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.async_peary_device import AsyncPearyDevice
+from peary.peary_proxy import PearyProxy
+
+if TYPE_CHECKING:
+    from peary.async_peary_protocol import AsyncPearyProtocol
+
+
+class AsyncPearyProxy:
+    """Asyncio proxy for the remote peary server."""
+
+    PearyProxyAddDeviceError = PearyProxy.PearyProxyAddDeviceError
+    PearyProxyGetDeviceError = PearyProxy.PearyProxyGetDeviceError
+
+    def __init__(self, protocol: AsyncPearyProtocol) -> None:
+        """Initializes a new asyncio peary proxy.
+
+        Args:
+            protocol: Protocol connected to the remote peary server.
+
+        """
+        self._devices: dict[str, AsyncPearyDevice] = {}
+        self._protocol = protocol
+
+    @property
+    def protocol(self) -> AsyncPearyProtocol:
+        """Returns the connected protocol."""
+        return self._protocol
+
+    async def keep_alive(self) -> bytes:
+        """Send a keep-alive message to test the connection."""
+        return await self._protocol.request("")
+
+    async def add_device(
+        self, name: str, device_class: type[AsyncPearyDevice] = AsyncPearyDevice
+    ) -> AsyncPearyDevice:
+        """Add a new device.
+
+        Args:
+            name: Name of device to add.
+            device_class: Class used to construct the device. Defaults to
+                AsyncPearyDevice.
+
+        Returns:
+            AsyncPearyDevice: Instance of the added device.
+
+        Raises:
+            PearyProxyAddDeviceError: If device already exists
+
+        """
+        if name in self._devices:
+            raise PearyProxy.PearyProxyAddDeviceError(f"Device already exists: {name}")
+        index = int(await self._protocol.request("add_device", name))
+        device = self._devices[name] = device_class(index, self._protocol)
+        return device
+
+    def get_device(self, name: str) -> AsyncPearyDevice:
+        """Get an existing device.
+
+        Args:
+            name: Name of device to get.
+
+        Returns:
+            AsyncPearyDevice: Instance of the device.
+
+        Raises:
+            PearyProxyGetDeviceError: If name is unknown.
+
+        """
+        if name not in self._devices:
+            raise PearyProxy.PearyProxyGetDeviceError(f"Unknown device: {name}")
+        return self._devices[name]
+
+    async def clear_devices(self) -> None:
+        """Clear and close all configured devices."""
+        _ = await self._protocol.request("clear_devices")
+        self._devices.clear()
+
+    def list_devices(self) -> list[str]:
+        """List all the added devices."""
+        return [*self._devices]
+
+    async def list_remote_devices(self) -> bytes:
+        """List devices known to the remote server."""
+        return await self._protocol.request("list_devices")
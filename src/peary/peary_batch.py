@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import Self
+
+    from peary.peary_device import PearyDevice
+
+T = TypeVar("T")
+
+
+class PearyBatchResult(Generic[T]):
+    """Handle to the result of a request queued in a batch."""
+
+    class PendingResultError(Exception):
+        """Exception for accessing a result before the batch was flushed."""
+
+    def __init__(self, decode: Callable[[bytes], T]) -> None:
+        """Initializes a new pending result.
+
+        Args:
+            decode: Function decoding the response payload into the result value.
+
+        """
+        self._decode = decode
+        self._response: bytes | Exception | None = None
+
+    def done(self) -> bool:
+        """Returns true once the response has been received."""
+        return self._response is not None
+
+    def result(self) -> T:
+        """Returns the decoded result of the request.
+
+        Returns:
+            T: The decoded response payload.
+
+        Raises:
+            PendingResultError: If the batch has not been flushed yet.
+            Exception: The exception of the request if it failed.
+
+        """
+        if self._response is None:
+            raise PearyBatchResult.PendingResultError("Batch has not been flushed.")
+        if isinstance(self._response, Exception):
+            raise self._response
+        return self._decode(self._response)
+
+    def set_response(self, response: bytes | Exception) -> None:
+        """Sets the response payload or exception of the request.
+
+        Args:
+            response: The response payload or the exception of the failed request.
+
+        """
+        self._response = response
+
+
+class PearyBatch:
+    """Collects device requests and sends them together in a single pipelined burst.
+
+    A batch is used as a context manager and flushes the queued requests when the block
+    exits without an exception, i.e.
+
+        with device.batch() as batch:
+            batch.set_voltage("PWR_OUT_1", 1.2)
+            voltage = batch.get_voltage("PWR_OUT_1")
+        print(voltage.result())
+
+    """
+
+    def __init__(self, device: PearyDevice) -> None:
+        """Initializes a new empty batch.
+
+        Args:
+            device: Device the batched requests are sent to.
+
+        """
+        self._device = device
+        self._commands: list[tuple[str, ...]] = []
+        self._results: list[PearyBatchResult] = []
+
+    def flush(self) -> None:
+        """Sends all queued requests and resolves their results.
+
+        Settings changed by successful requests are recorded by the device for
+        `restore`.
+        """
+        responses = self._device.request_commands(self._commands)
+        for result, response in zip(self._results, responses):
+            result.set_response(response)
+        self.clear()
+
+    def clear(self) -> None:
+        """Discards all queued requests without sending them."""
+        self._commands = []
+        self._results = []
+
+    def power_on(self) -> PearyBatchResult[bytes]:
+        """Power on the device."""
+        return self._queue(bytes, "power_on")
+
+    def power_off(self) -> PearyBatchResult[bytes]:
+        """Power off the device."""
+        return self._queue(bytes, "power_off")
+
+    def reset(self) -> PearyBatchResult[bytes]:
+        """Reset the device."""
+        return self._queue(bytes, "reset")
+
+    def configure(self) -> PearyBatchResult[bytes]:
+        """Initialize and configure the device."""
+        return self._queue(bytes, "configure")
+
+    def get_register(self, name: str) -> PearyBatchResult[int]:
+        """Get the value of a named register."""
+        self._device.validate_registers(name)
+        return self._queue(int, "get_register", name)
+
+    def set_register(self, name: str, value: int) -> PearyBatchResult[bytes]:
+        """Set the value of a named register."""
+        self._device.validate_registers(name)
+        return self._queue(bytes, "set_register", name, str(value))
+
+    def get_memory(self, name: str) -> PearyBatchResult[int]:
+        """Get the value of a named memory."""
+        return self._queue(int, "get_memory", name)
+
+    def set_memory(self, name: str, value: int) -> PearyBatchResult[bytes]:
+        """Set the value of a named memory."""
+        return self._queue(bytes, "set_memory", name, str(value))
+
+    def get_current(self, name: str) -> PearyBatchResult[float]:
+        """Get the measured current of a named periphery port."""
+        return self._queue(float, "get_current", name)
+
+    def set_current(self, name: str, value: float) -> PearyBatchResult[bytes]:
+        """Set the current of a named periphery port."""
+        return self._queue(bytes, "set_current", name, str(value))
+
+    def get_voltage(self, name: str) -> PearyBatchResult[float]:
+        """Get the measured voltage of a named periphery port."""
+        return self._queue(float, "get_voltage", name)
+
+    def set_voltage(self, name: str, value: float) -> PearyBatchResult[bytes]:
+        """Set the voltage of a named periphery port."""
+        return self._queue(bytes, "set_voltage", name, str(value))
+
+    def switch_on(self, name: str) -> PearyBatchResult[bytes]:
+        """Switch on a periphery port."""
+        return self._queue(bytes, "switch_on", name)
+
+    def switch_off(self, name: str) -> PearyBatchResult[bytes]:
+        """Switch off a periphery port."""
+        return self._queue(bytes, "switch_off", name)
+
+    def _queue(
+        self, decode: Callable[[bytes], T], cmd: str, *args: str
+    ) -> PearyBatchResult[T]:
+        """Queues a per-device request and returns the handle to its result.
+
+        Args:
+            decode: Function decoding the response payload into the result value.
+            cmd: The device command to be performed by the host.
+            args: Additional device command arguments sent to host.
+
+        Returns:
+            PearyBatchResult: Handle to the result of the request.
+
+        """
+        result = PearyBatchResult(decode)
+        self._commands.append((cmd, *args))
+        self._results.append(result)
+        return result
+
+    def __enter__(self) -> Self:
+        """Enters a batch block.
+
+        Returns:
+            Self: The batch collecting the requests.
+
+        """
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        """Flushes the queued requests unless the block raised an exception.
+
+        Args:
+            exc_type: Type of the exception raised in the block, if any.
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        if exc_type is None:
+            self.flush()
+        else:
+            self.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of queued requests.
+
+        Returns:
+            int: The number of queued requests.
+
+        """
+        return len(self._commands)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+
+    from typing_extensions import Self
+
+
+class PearyCaptureRecord(NamedTuple):
+    """A single frame of a capture."""
+
+    timestamp: float
+    direction: PearyCaptureWriter.Direction
+    tag: int
+    status: int
+    payload: bytes
+
+
+class PearyCaptureWriter:
+    """Appends the frames sent and received by a protocol to a binary capture file.
+
+    A capture starts with a file header followed by one record per frame. Each record
+    holds the timestamp, direction, tag, status and payload size of the frame followed
+    by the payload, i.e.
+
+        with PearyCaptureWriter("bring_up.pcap") as capture:
+            proxy.protocol.capture = capture
+            # do something with the proxy
+
+    Appending to an existing capture continues it.
+    """
+
+    class Direction(IntEnum):
+        """Direction of a captured frame."""
+
+        SENT = 0
+        RECEIVED = 1
+
+    MAGIC = b"PEARYCAP"
+    VERSION = 1
+    STRUCT_FILE_HEADER = struct.Struct("!8sH")
+    STRUCT_RECORD = struct.Struct("!dBHHL")
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Opens a capture file for appending.
+
+        Args:
+            path: Path of the capture file, created if it does not exist.
+
+        """
+        # pylint: disable-next=consider-using-with
+        self._file: BinaryIO = Path(path).open("ab")  # noqa: SIM115
+        if self._file.tell() == 0:
+            self._file.write(self.STRUCT_FILE_HEADER.pack(self.MAGIC, self.VERSION))
+
+    def write(
+        self, direction: Direction, tag: int, status: int, payload: bytes
+    ) -> None:
+        """Appends a frame to the capture.
+
+        Args:
+            direction: Whether the frame was sent or received.
+            tag: The tag of the frame.
+            status: The status of the frame.
+            payload: The payload of the frame.
+
+        """
+        self._file.write(
+            self.STRUCT_RECORD.pack(time.time(), direction, tag, status, len(payload))
+        )
+        self._file.write(payload)
+
+    def flush(self) -> None:
+        """Writes all buffered records to the capture file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the capture file."""
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        """Enters a capture block.
+
+        Returns:
+            Self: The capture writer.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Closes the capture file when exiting a capture block.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.close()
+
+
+class PearyCaptureReader:
+    """Streams the records of a capture file through a memory map.
+
+    Records are decoded one at a time while iterating, so captures larger than the
+    available memory can be read, i.e.
+
+        with PearyCaptureReader("bring_up.pcap") as capture:
+            for record in capture:
+                print(record.direction.name, record.tag, record.payload)
+
+    """
+
+    class CaptureFormatError(Exception):
+        """Exception for files that are not valid captures."""
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Opens and memory maps a capture file.
+
+        Args:
+            path: Path of the capture file.
+
+        Raises:
+            CaptureFormatError: If the file does not start with a capture header.
+
+        """
+        with Path(path).open("rb") as file:
+            if (size := file.seek(0, 2)) < PearyCaptureWriter.STRUCT_FILE_HEADER.size:
+                raise PearyCaptureReader.CaptureFormatError(
+                    f"Capture file is too short: {size} bytes"
+                )
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = PearyCaptureWriter.STRUCT_FILE_HEADER.unpack_from(self._mmap)
+        if (magic, version) != (PearyCaptureWriter.MAGIC, PearyCaptureWriter.VERSION):
+            self._mmap.close()
+            raise PearyCaptureReader.CaptureFormatError(
+                f"Unsupported capture header: {magic!r} version {version}"
+            )
+
+    def close(self) -> None:
+        """Closes the memory map of the capture file."""
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Enters a capture block.
+
+        Returns:
+            Self: The capture reader.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Closes the capture file when exiting a capture block.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[PearyCaptureRecord]:
+        """Decodes the records of the capture in order.
+
+        Yields:
+            PearyCaptureRecord: The captured frames.
+
+        Raises:
+            CaptureFormatError: If the last record is truncated.
+
+        """
+        offset = PearyCaptureWriter.STRUCT_FILE_HEADER.size
+        record_size = PearyCaptureWriter.STRUCT_RECORD.size
+        while offset < len(self._mmap):  # pylint: disable=while-used
+            if offset + record_size > len(self._mmap):
+                raise PearyCaptureReader.CaptureFormatError(
+                    f"Truncated capture record at offset {offset}"
+                )
+            timestamp, direction, tag, status, size = (
+                PearyCaptureWriter.STRUCT_RECORD.unpack_from(self._mmap, offset)
+            )
+            offset += record_size
+            if offset + size > len(self._mmap):
+                raise PearyCaptureReader.CaptureFormatError(
+                    f"Truncated capture record at offset {offset - record_size}"
+                )
+            yield PearyCaptureRecord(
+                timestamp,
+                PearyCaptureWriter.Direction(direction),
+                tag,
+                status,
+                self._mmap[offset : offset + size],
+            )
+            offset += size
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import socket as socket_module
+from typing import TYPE_CHECKING
 
 from peary.peary_protocol import PearyProtocol
 from peary.peary_proxy import PearyProxy
+from peary.peary_reconnecting_protocol import PearyReconnectingProtocol
+from peary.peary_transport import PearyTcpTransport
+
+if TYPE_CHECKING:
+    from peary.peary_transport import PearyTransport, PearyTransportSocket
 
 
 class PearyClient:
@@ -15,6 +21,11 @@ class PearyClient:
         with PearyClient(host='localhost') as client:
             # do something with the client
 
+    The client connects over TCP to the host, or through any other transport, i.e.
+
+        with PearyClient(PearyUnixTransport("/run/peary.sock")) as client:
+            # do something with the client
+
     """
 
     class PearySockerError(Exception):
@@ -22,7 +33,7 @@ class PearyClient:
 
     def __init__(
         self,
-        host: str,
+        host: str | PearyTransport,
         port: int = 12345,
         *,
         protocol_class: type[PearyProtocol] = PearyProtocol,
@@ -30,23 +41,47 @@ class PearyClient:
     ) -> None:
         """Initializes a new peary client.
 
+        The port and socket class are only used for connections over TCP to a host.
+
         Args:
-            host: Hostname of the remote peary server.
+            host: Hostname of the remote peary server, or the transport used to
+                connect to it.
             port: Port number of the remote peary server. Defaults to 12345.
             socket_class: Class used for the remote socket. Defaults to socket.
             protocol_class: Class used for the protocol. Defaults to PearyProtocol.
 
         """
-        self._host = host
-        self._port = port
+        self._transport = (
+            PearyTcpTransport(host, port, socket_class=socket_class)
+            if isinstance(host, str)
+            else host
+        )
         self._protocol_class = protocol_class
-        self._socket = socket_class(socket_module.AF_INET, socket_module.SOCK_STREAM)
+        self._socket = self._transport.create_socket()
+        self._protocol: PearyProtocol | None = None
+
+    @property
+    def transport(self) -> PearyTransport:
+        """Returns the transport used to connect to the remote peary server."""
+        return self._transport
 
     @property
-    def socket(self) -> socket_module.socket:
+    def socket(self) -> PearyTransportSocket:
         """Returns the socket."""
         return self._socket
 
+    def _reconnect(self) -> PearyTransportSocket:
+        """Replaces the socket with a new connection to the remote peary server.
+
+        Returns:
+            PearyTransportSocket: The newly connected socket.
+
+        """
+        self._socket.close()
+        self._socket = self._transport.create_socket()
+        self._socket.connect(self._transport.address)
+        return self._socket
+
     def __enter__(self) -> PearyProxy:
         """Enters a connection with a peary server.
 
@@ -58,13 +93,16 @@ class PearyClient:
 
         """
         try:
-            self.socket.connect((self._host, self._port))
+            self.socket.connect(self._transport.address)
         except Exception as e:
             raise PearyClient.PearySockerError(
-                f"Unable to connect to host {self._host} using port {self._port}."
+                f"Unable to connect to {self._transport}."
             ) from e
 
-        return PearyProxy(self._protocol_class(self.socket))
+        protocol = self._protocol = self._protocol_class(self.socket)
+        if isinstance(protocol, PearyReconnectingProtocol):
+            protocol.connect = self._reconnect
+        return PearyProxy(protocol)
 
     def __exit__(self, *_: object) -> None:
         """Exits a context block.
@@ -73,5 +111,7 @@ class PearyClient:
             _: Catches the usued arguments required for the __exit__ function.
 
         """
+        if self._protocol is not None:
+            self._protocol.close()
         self.socket.shutdown(socket_module.SHUT_RDWR)
         self.socket.close()
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_client import PearyClient
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from peary.peary_proxy import PearyProxy
+    from peary.peary_transport import PearyTransport
+
+
+class PearyPooledConnection:
+    """A connection of a pool to the remote peary server."""
+
+    def __init__(self, proxy: PearyProxy, exit_stack: contextlib.ExitStack) -> None:
+        """Initializes a new pooled connection.
+
+        Args:
+            proxy: Proxy connected to the remote peary server.
+            exit_stack: Exit stack closing the connection.
+
+        """
+        self._proxy = proxy
+        self._exit_stack = exit_stack
+        self._acquisitions = 0
+        self._idle_since = time.monotonic()
+
+    @property
+    def proxy(self) -> PearyProxy:
+        """Returns the proxy connected to the remote peary server."""
+        return self._proxy
+
+    @property
+    def acquisitions(self) -> int:
+        """Returns the number of times the connection was acquired."""
+        return self._acquisitions
+
+    @property
+    def idle_since(self) -> float:
+        """Returns the monotonic time the connection was last released."""
+        return self._idle_since
+
+    @property
+    def stats(self) -> PearyStats | None:
+        """Returns the request statistics of the connection, if collected."""
+        return self._proxy.protocol.stats
+
+    def acquire(self) -> PearyProxy:
+        """Marks the connection as acquired.
+
+        Returns:
+            PearyProxy: Proxy connected to the remote peary server.
+
+        """
+        self._acquisitions += 1
+        return self._proxy
+
+    def release(self) -> None:
+        """Marks the connection as idle."""
+        self._idle_since = time.monotonic()
+
+    def close(self) -> None:
+        """Closes the connection, ignoring errors of already broken connections."""
+        with contextlib.suppress(OSError):
+            self._exit_stack.close()
+
+
+class PearyClientPool:  # pylint: disable=too-many-instance-attributes
+    """Pool of connections to a single remote peary server shared by many threads.
+
+    Connections are opened on demand up to the pool size, and each acquired proxy is
+    used by a single workload until it is released, so independent workloads run in
+    parallel over separate connections, i.e.
+
+        with PearyClientPool("localhost", size=4) as pool:
+            with pool.acquire() as proxy:
+                # do something with the proxy
+
+    Connections idle for longer than the idle timeout are closed, idle connections are
+    checked with a keep alive request before they are handed out again, and
+    connections failing while acquired are discarded instead of being reused.
+    """
+
+    class PoolClosedError(Exception):
+        """Exception for acquiring from a closed pool."""
+
+    class PoolTimeoutError(Exception):
+        """Exception for acquire timeouts while all connections are in use."""
+
+    BROKEN_CONNECTION_ERRORS = (
+        OSError,
+        PearyProtocol.DecodeError,
+        PearyProtocol.RequestSendError,
+        PearyProtocol.ResponseReceiveError,
+        PearyProtocol.ResponseSequenceError,
+    )
+
+    def __init__(
+        self,
+        host: str | PearyTransport,
+        port: int = 12345,
+        *,
+        size: int = 4,
+        acquire_timeout: float | None = None,
+        protocol_class: type[PearyProtocol] = PearyProtocol,
+    ) -> None:
+        """Initializes a new connection pool without opening connections.
+
+        Args:
+            host: Hostname of the remote peary server, or the transport used to
+                connect to it.
+            port: Port number of the remote peary server. Defaults to 12345.
+            size: Maximum number of open connections. Defaults to 4.
+            acquire_timeout: Maximum time in seconds to wait for a connection, or None
+                to wait indefinitely. Defaults to None.
+            protocol_class: Class used for the protocols. Defaults to PearyProtocol.
+
+        """
+        self._host = host
+        self._port = port
+        self._size = max(1, size)
+        self._acquire_timeout = acquire_timeout
+        self._protocol_class = protocol_class
+        self._condition = threading.Condition()
+        self._idle: list[PearyPooledConnection] = []
+        self._connections: list[PearyPooledConnection] = []
+        self._opening = 0
+        self._closed = False
+        self.idle_timeout: float | None = 300.0
+        self.health_check_interval: float | None = 10.0
+        self.collect_stats = False
+
+    @property
+    def size(self) -> int:
+        """Returns the maximum number of open connections."""
+        return self._size
+
+    @property
+    def acquire_timeout(self) -> float | None:
+        """Returns the maximum time in seconds to wait for a connection."""
+        return self._acquire_timeout
+
+    @property
+    def connections(self) -> list[PearyPooledConnection]:
+        """Returns the open connections."""
+        with self._condition:
+            return list(self._connections)
+
+    @property
+    def in_use(self) -> int:
+        """Returns the number of acquired connections."""
+        with self._condition:
+            return len(self._connections) - len(self._idle)
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[PearyProxy]:
+        """Acquires a connection for the duration of a with block.
+
+        Yields:
+            PearyProxy: Proxy connected to the remote peary server.
+
+        Raises:
+            PoolClosedError: If the pool has been closed.
+            PoolTimeoutError: If no connection becomes available within the timeout.
+            PearySockerError: If a new connection cannot be opened.
+
+        """
+        connection = self._checkout()
+        broken = False
+        try:
+            yield connection.acquire()
+        except PearyClientPool.BROKEN_CONNECTION_ERRORS:
+            broken = True
+            raise
+        finally:
+            if broken:
+                self._discard(connection)
+            else:
+                self._checkin(connection)
+
+    def close(self) -> None:
+        """Closes the idle connections and closes the others once they are released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for connection in idle:
+                self._connections.remove(connection)
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def _checkout(self) -> PearyPooledConnection:
+        """Takes a healthy idle connection or opens a new one.
+
+        An idle connection failing its health check in any other way than a broken
+        connection is discarded as well before the error is raised, so its slot is
+        freed.
+
+        Returns:
+            PearyPooledConnection: The acquired connection.
+
+        """
+        while True:  # pylint: disable=while-used
+            if (connection := self._take_idle()) is None:
+                return self._open()
+            try:
+                healthy = self._is_healthy(connection)
+            except BaseException:
+                self._discard(connection)
+                raise
+            if healthy:
+                return connection
+            self._discard(connection)
+
+    def _take_idle(self) -> PearyPooledConnection | None:
+        """Takes the most recently released connection or reserves a new connection.
+
+        Returns:
+            PearyPooledConnection | None: An idle connection, or None if a connection
+                should be opened.
+
+        Raises:
+            PoolClosedError: If the pool has been closed.
+            PoolTimeoutError: If no connection becomes available within the timeout.
+
+        """
+        for connection in self._reap_idle():
+            connection.close()
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._closed
+                or bool(self._idle)
+                or len(self._connections) + self._opening < self._size,
+                self._acquire_timeout,
+            ):
+                raise PearyClientPool.PoolTimeoutError(
+                    f"No connection available within {self._acquire_timeout}s."
+                )
+            if self._closed:
+                raise PearyClientPool.PoolClosedError("Connection pool is closed.")
+            if self._idle:
+                return self._idle.pop()
+            self._opening += 1
+        return None
+
+    def _reap_idle(self) -> list[PearyPooledConnection]:
+        """Removes the connections idle for longer than the idle timeout.
+
+        Returns:
+            list[PearyPooledConnection]: The removed connections to be closed.
+
+        """
+        if self.idle_timeout is None:
+            return []
+        deadline = time.monotonic() - self.idle_timeout
+        with self._condition:
+            reaped = [c for c in self._idle if c.idle_since < deadline]
+            for connection in reaped:
+                self._idle.remove(connection)
+                self._connections.remove(connection)
+            self._condition.notify_all()
+        return reaped
+
+    def _is_healthy(self, connection: PearyPooledConnection) -> bool:
+        """Checks a connection idle for longer than the health check interval.
+
+        Args:
+            connection: The idle connection.
+
+        Returns:
+            bool: False if the connection fails a keep alive request.
+
+        """
+        interval = self.health_check_interval
+        if interval is None or time.monotonic() - connection.idle_since < interval:
+            return True
+        try:
+            connection.proxy.keep_alive()
+        except PearyClientPool.BROKEN_CONNECTION_ERRORS:
+            return False
+        return True
+
+    def _open(self) -> PearyPooledConnection:
+        """Opens a new connection in a reserved slot.
+
+        Returns:
+            PearyPooledConnection: The opened connection.
+
+        """
+        try:
+            connection = self._connect()
+        finally:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+        with self._condition:
+            self._connections.append(connection)
+        return connection
+
+    def _connect(self) -> PearyPooledConnection:
+        """Connects a new client to the remote peary server.
+
+        Returns:
+            PearyPooledConnection: The connected client.
+
+        """
+        with contextlib.ExitStack() as exit_stack:
+            client = PearyClient(
+                self._host, self._port, protocol_class=self._protocol_class
+            )
+            exit_stack.callback(client.socket.close)
+            proxy = exit_stack.enter_context(client)
+            if self.collect_stats:
+                proxy.protocol.stats = PearyStats()
+            return PearyPooledConnection(proxy, exit_stack.pop_all())
+
+    def _checkin(self, connection: PearyPooledConnection) -> None:
+        """Returns an acquired connection to the pool.
+
+        Connections with unanswered pipelined requests are discarded, since their
+        responses would be received by the next workload.
+
+        Args:
+            connection: The acquired connection.
+
+        """
+        if connection.proxy.protocol.in_flight:
+            self._discard(connection)
+            return
+        connection.release()
+        with self._condition:
+            if not self._closed:
+                self._idle.append(connection)
+                self._condition.notify()
+                return
+            self._connections.remove(connection)
+        connection.close()
+
+    def _discard(self, connection: PearyPooledConnection) -> None:
+        """Closes a connection and frees its slot.
+
+        Args:
+            connection: The acquired connection.
+
+        """
+        with self._condition:
+            self._connections.remove(connection)
+            self._condition.notify()
+        connection.close()
+
+    def __enter__(self) -> Self:
+        """Enters a pool block.
+
+        Returns:
+            Self: The connection pool.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Closes the pool when exiting a pool block.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.close()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from peary.peary_protocol import PearyProtocol
+
+
+class PearyCommand:
+    """A request whose payload is encoded once and reused for every call.
+
+    The payload is cached when the command is compiled, so each call only packs the
+    8-byte prefix holding the request tag, i.e.
+
+        voltage = device.compile("get_voltage", "PWR_OUT_1")
+        while True:
+            print(float(voltage()))
+
+    """
+
+    def __init__(self, protocol: PearyProtocol, msg: str, *args: str) -> None:
+        """Initializes a new compiled command.
+
+        Args:
+            protocol: Protocol connected to the remote peary server.
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        """
+        self._protocol = protocol
+        self._msg = msg
+        self._payload = PearyProtocol.encode_message(msg, args)
+
+    @property
+    def msg(self) -> str:
+        """Returns the request message."""
+        return self._msg
+
+    @property
+    def payload(self) -> bytes:
+        """Returns the encoded request payload."""
+        return self._payload
+
+    def send(self) -> int:
+        """Sends the request without waiting for its response.
+
+        Returns:
+            int: The request tag used to collect the response with `recv_response`.
+
+        """
+        return self._protocol.send_payload(self._msg, self._payload)
+
+    def __call__(self) -> bytes:
+        """Sends the request and returns the response payload.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return self._protocol.request_payload(self._msg, self._payload)
@@ -1,14 +1,43 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import array
+from typing import TYPE_CHECKING, ClassVar, TypeVar, cast
+
+from peary.peary_batch import PearyBatch
+from peary.peary_command import PearyCommand
+from peary.peary_register_map import PearyRegisterMap
+from peary.peary_register_snapshot import PearyRegisterSnapshot
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    import numpy as np
+    from _typeshed import WriteableBuffer
+    from numpy.typing import NDArray
+
     from peary.peary_protocol import PearyProtocol
+    from peary.peary_shadow import PearyRegisterShadow
+
+
+T = TypeVar("T", bound="np.generic")
 
 
-class PearyDevice:
+class PearyDevice:  # pylint: disable=too-many-public-methods
     """A Peary device."""
 
+    RESTORED_COMMANDS: ClassVar[dict[str, str]] = {
+        "set_register": "register",
+        "set_memory": "memory",
+        "set_voltage": "voltage",
+        "set_current": "current",
+        "switch_on": "switch",
+        "switch_off": "switch",
+    }
+    INVALIDATING_COMMANDS: ClassVar[frozenset[str]] = frozenset(
+        {"reset", "configure", "power_off"}
+    )
+    SHADOWED_COMMANDS: ClassVar[frozenset[str]] = frozenset({"set_register"})
+
     def __init__(self, index: int, protocol: PearyProtocol) -> None:
         """Initializes a remote peary device.
 
@@ -20,6 +49,9 @@ class PearyDevice:
         self._index = index
         self._protocol = protocol
         self._name: None | str = None
+        self._settings: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._shadow: PearyRegisterShadow | None = None
+        self._register_map: PearyRegisterMap | None = None
 
     @property
     def index(self) -> int:
@@ -38,6 +70,52 @@ class PearyDevice:
         """Returns the connected protocol."""
         return self._protocol
 
+    @property
+    def settings(self) -> list[tuple[str, ...]]:
+        """Returns the last setting of each register, memory and port in replay order.
+
+        Each setting is the device command followed by its arguments. A setting keeps
+        its position when it is changed, so supplies are set before being switched on.
+        """
+        return list(self._settings.values())
+
+    @property
+    def shadow(self) -> PearyRegisterShadow | None:
+        """Returns the shadow caching the register values, if any."""
+        return self._shadow
+
+    @shadow.setter
+    def shadow(self, shadow: PearyRegisterShadow | None) -> None:
+        """Sets the shadow caching the register values, or None to disable."""
+        self._shadow = shadow
+
+    @property
+    def register_map(self) -> PearyRegisterMap | None:
+        """Returns the loaded register map validating register names, if any."""
+        return self._register_map
+
+    def batch(self) -> PearyBatch:
+        """Returns a new batch collecting requests to be sent together.
+
+        Returns:
+            PearyBatch: An empty batch for this device.
+
+        """
+        return PearyBatch(self)
+
+    def compile(self, cmd: str, *args: str) -> PearyCommand:
+        """Returns a per-device request encoded once for repeated calls.
+
+        Args:
+            cmd: The device command to be performed by the host.
+            args: Additional device command arguments sent to host.
+
+        Returns:
+            PearyCommand: Callable command returning the response payload.
+
+        """
+        return PearyCommand(self._protocol, f"device.{cmd}", str(self.index), *args)
+
     # fixed device functionality is added explicitly with
     # additional return value decoding where appropriate
     def power_on(self) -> bytes:
@@ -68,12 +146,46 @@ class PearyDevice:
         """List all available registers by name."""
         return self._request("list_registers").decode("utf-8").split()
 
+    def load_register_map(self) -> PearyRegisterMap:
+        """Fetches the register names once and validates them locally from now on.
+
+        Loading the register map again refreshes it.
+
+        Returns:
+            PearyRegisterMap: The register map of the device.
+
+        """
+        self._register_map = PearyRegisterMap(self.list_registers())
+        return self._register_map
+
+    def validate_registers(self, *names: str) -> None:
+        """Checks register names against the register map once it is loaded.
+
+        Args:
+            names: The names of the registers.
+
+        Raises:
+            UnknownRegisterError: If a register is not in the loaded register map.
+
+        """
+        if self._register_map is not None:
+            self._register_map.validate(*names)
+
     def get_register(self, name: str) -> int:
-        """Get the value of a named register."""
-        return int(self._request("get_register", name))
+        """Get the value of a named register, from the shadow if it is cached."""
+        self.validate_registers(name)
+        if self._shadow is None:
+            return int(self._request("get_register", name))
+        if (value := self._shadow.lookup(name)) is None:
+            value = int(self._request("get_register", name))
+            self._shadow.record(name, value)
+        return value
 
     def set_register(self, name: str, value: int) -> bytes:
         """Set the value of a named register."""
+        self.validate_registers(name)
+        if self._shadow is not None:
+            self._shadow.invalidate(name)
         return self._request("set_register", name, str(value))
 
     def get_memory(self, name: str) -> int:
@@ -100,6 +212,132 @@ class PearyDevice:
         """Set the voltage of a named periphery port."""
         return self._request("set_voltage", name, str(value))
 
+    def get_registers(
+        self, names: Sequence[str], *, out: NDArray[np.int64] | None = None
+    ) -> NDArray[np.int64]:
+        """Get the values of named registers with pipelined requests.
+
+        Requires NumPy, which is installed with the `numpy` extra.
+
+        Args:
+            names: Names of the registers.
+            out: Array receiving the values. Defaults to a new array.
+
+        Returns:
+            NDArray[np.int64]: The values in the order of the names.
+
+        """
+        self.validate_registers(*names)
+        return self._request_array("get_register", names, "int64", out)
+
+    def get_memories(
+        self, names: Sequence[str], *, out: NDArray[np.int64] | None = None
+    ) -> NDArray[np.int64]:
+        """Get the values of named memories with pipelined requests.
+
+        Requires NumPy, which is installed with the `numpy` extra.
+
+        Args:
+            names: Names of the memories.
+            out: Array receiving the values. Defaults to a new array.
+
+        Returns:
+            NDArray[np.int64]: The values in the order of the names.
+
+        """
+        return self._request_array("get_memory", names, "int64", out)
+
+    def read_memories(self, names: Sequence[str]) -> array.array[int]:
+        """Read the values of named memories with pipelined requests into an array.
+
+        Unlike `get_memories`, NumPy is not required.
+
+        Args:
+            names: Names of the memories.
+
+        Returns:
+            array.array[int]: The 64-bit values in the order of the names.
+
+        """
+        values = array.array("q", bytes(8 * len(names)))
+        self.read_memories_into(names, values)
+        return values
+
+    def read_memories_into(self, names: Sequence[str], buffer: WriteableBuffer) -> None:
+        """Read the values of named memories with pipelined requests into a buffer.
+
+        Each value is decoded straight into the buffer provided by the caller, e.g. an
+        `array.array`, a NumPy array or a `memoryview` of integers.
+
+        Args:
+            names: Names of the memories.
+            buffer: One-dimensional integer buffer receiving the values.
+
+        Raises:
+            ValueError: If the length of the buffer differs from the number of names.
+
+        """
+        with memoryview(buffer) as view:
+            if view.ndim != 1 or len(view) != len(names):
+                raise ValueError(
+                    f"Buffer of shape {view.shape} cannot hold {len(names)} values."
+                )
+            payloads = self._request_many(
+                ("device.get_memory", (str(self.index), name)) for name in names
+            )
+            for i, payload in enumerate(payloads):
+                view[i] = int(payload)
+
+    def write_memories(self, names: Sequence[str], values: Iterable[int]) -> None:
+        """Write the values of named memories with pipelined requests.
+
+        Args:
+            names: Names of the memories.
+            values: The values in the order of the names, e.g. an array returned by
+                `read_memories`.
+
+        Raises:
+            ValueError: If the number of values differs from the number of names.
+
+        """
+        if len(values := list(values)) != len(names):
+            raise ValueError(f"Got {len(values)} values for {len(names)} memories.")
+        self._write_many("set_memory", dict(zip(names, values)))
+
+    def get_currents(
+        self, names: Sequence[str], *, out: NDArray[np.float64] | None = None
+    ) -> NDArray[np.float64]:
+        """Get the measured currents of named periphery ports with pipelined requests.
+
+        Requires NumPy, which is installed with the `numpy` extra.
+
+        Args:
+            names: Names of the periphery ports.
+            out: Array receiving the currents. Defaults to a new array.
+
+        Returns:
+            NDArray[np.float64]: The currents in the order of the names.
+
+        """
+        return self._request_array("get_current", names, "float64", out)
+
+    def get_voltages(
+        self, names: Sequence[str], *, out: NDArray[np.float64] | None = None
+    ) -> NDArray[np.float64]:
+        """Get the measured voltages of named periphery ports with pipelined requests.
+
+        Requires NumPy, which is installed with the `numpy` extra.
+
+        Args:
+            names: Names of the periphery ports.
+            out: Array receiving the voltages. Defaults to a new array.
+
+        Returns:
+            NDArray[np.float64]: The voltages in the order of the names.
+
+        """
+        return self._request_array("get_voltage", names, "float64", out)
+
     def switch_on(self, name: str) -> bytes:
         """Switch on a periphery port."""
         return self._request("switch_on", name)
@@ -108,9 +346,123 @@ class PearyDevice:
         """Switch off a periphery port."""
         return self._request("switch_off", name)
 
+    def snapshot_registers(
+        self, names: Iterable[str] | None = None
+    ) -> PearyRegisterSnapshot:
+        """Reads registers with pipelined requests and captures their values.
+
+        Args:
+            names: Names of the registers, or None for all registers of the loaded
+                register map or else of `list_registers`. Defaults to None.
+
+        Returns:
+            PearyRegisterSnapshot: The register values in the order of the names.
+
+        Raises:
+            UnknownRegisterError: If a register is not in the loaded register map.
+            ResponseStatusError: If a register read fails on the remote server.
+
+        """
+        if names is None:
+            names = self._register_map or self.list_registers()
+        names = list(names)
+        self.validate_registers(*names)
+        return PearyRegisterSnapshot(dict(zip(names, self._read_registers(names))))
+
+    def apply_registers(self, config: Mapping[str, int]) -> dict[str, int]:
+        """Writes the registers of a configuration differing from their current values.
+
+        Current values cached in the shadow are not read again, all other registers of
+        the configuration are read with pipelined requests. The differing registers
+        are then written in a single pipelined burst and recorded like `set_register`.
+
+        Args:
+            config: The register values by name, e.g. a `PearyRegisterSnapshot`.
+
+        Returns:
+            dict[str, int]: The written register values.
+
+        Raises:
+            UnknownRegisterError: If a register is not in the loaded register map.
+            ResponseStatusError: If a register read or write fails on the remote server.
+
+        """
+        if not isinstance(config, PearyRegisterSnapshot):
+            config = PearyRegisterSnapshot(config)
+        self.validate_registers(*config)
+        current: dict[str, int] = {}
+        if self._shadow is not None:
+            for name in config:
+                if (value := self._shadow.lookup(name)) is not None:
+                    current[name] = value
+        if unknown := [name for name in config if name not in current]:
+            current.update(zip(unknown, self._read_registers(unknown)))
+        if delta := config.diff(current):
+            self._write_many("set_register", delta)
+        return delta
+
+    def request_commands(
+        self, commands: Sequence[tuple[str, ...]]
+    ) -> list[bytes | Exception]:
+        """Sends device commands as pipelined requests and records their settings.
+
+        Settings changed by successful commands are recorded for `restore`, and the
+        shadow is kept in sync like for single requests. Written registers are
+        invalidated before sending and record their values once written, commands
+        changing the state of the registers invalidate the whole shadow.
+
+        Args:
+            commands: The device command and arguments of each request.
+
+        Returns:
+            list[bytes | Exception]: The response payloads in command order, or the
+                `ResponseStatusError` of each failed command.
+
+        """
+        if self._shadow is not None:
+            for cmd, *args in commands:
+                if cmd in self.INVALIDATING_COMMANDS:
+                    self._shadow.invalidate()
+                elif cmd in self.SHADOWED_COMMANDS:
+                    self._shadow.invalidate(args[0])
+        responses = self._protocol.request_many(
+            (f"device.{cmd}", (str(self.index), *args)) for cmd, *args in commands
+        )
+        for command, response in zip(commands, responses):
+            if not isinstance(response, Exception):
+                self._record_command(*command)
+        return responses
+
+    def restore(self, index: int, *, replay_settings: bool = True) -> None:
+        """Rebinds the device to a new index after it was added again.
+
+        Compiled commands hold the index they were compiled with and have to be
+        compiled again when the index changes. The shadow is invalidated, since the
+        registers of the device added again hold their initial values.
+
+        Args:
+            index: Numerical identifier assigned by the remote server.
+            replay_settings: Replay the recorded settings in order. Defaults to True.
+
+        Raises:
+            ResponseStatusError: If a replayed setting fails on the remote server.
+
+        """
+        self._index = index
+        if self._shadow is not None:
+            self._shadow.invalidate()
+        if replay_settings:
+            self._request_many(
+                (f"device.{cmd}", (str(index), *args)) for cmd, *args in self.settings
+            )
+
     def _request(self, cmd: str, *args: str) -> bytes:
         """Send a per-device request to the host and returns response payload.
 
+        Settings changed by successful requests are recorded for `restore`, and written
+        register values in the shadow. Commands changing the state of the registers
+        invalidate the shadow before being sent.
+
         Args:
             cmd: The device command to be performed by the host.
             args: Additional device command arguments sent to host.
@@ -119,7 +471,132 @@ class PearyDevice:
             bytes: response payload.
 
         """
-        return self._protocol.request(f"device.{cmd}", str(self.index), *args)
+        if self._shadow is not None and cmd in self.INVALIDATING_COMMANDS:
+            self._shadow.invalidate()
+        response = self._protocol.request(f"device.{cmd}", str(self.index), *args)
+        self._record_command(cmd, *args)
+        return response
+
+    def _request_many(
+        self, requests: Iterable[tuple[str, Sequence[str]]]
+    ) -> list[bytes]:
+        """Sends pipelined requests and returns their response payloads.
+
+        Args:
+            requests: Sequence of request messages and their additional arguments.
+
+        Returns:
+            list[bytes]: The response payloads in request order.
+
+        Raises:
+            ResponseStatusError: If any of the requests fails.
+
+        """
+        responses = self._protocol.request_many(requests)
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+        return cast("list[bytes]", responses)
+
+    def _read_registers(self, names: Sequence[str]) -> list[int]:
+        """Reads registers with pipelined requests and records them in the shadow.
+
+        Args:
+            names: The names of the registers.
+
+        Returns:
+            list[int]: The register values in the order of the names.
+
+        """
+        values = [
+            int(payload)
+            for payload in self._request_many(
+                ("device.get_register", (str(self.index), name)) for name in names
+            )
+        ]
+        if self._shadow is not None:
+            for name, value in zip(names, values):
+                self._shadow.record(name, value)
+        return values
+
+    def _write_many(self, cmd: str, values: Mapping[str, int]) -> None:
+        """Sends pipelined writes and records the written values.
+
+        Args:
+            cmd: The device command writing a single value.
+            values: The values by name.
+
+        Raises:
+            ResponseStatusError: If any of the writes fails, after all successful
+                writes have been recorded.
+
+        """
+        responses = self.request_commands(
+            [(cmd, name, str(value)) for name, value in values.items()]
+        )
+        if errors := [e for e in responses if isinstance(e, Exception)]:
+            raise errors[0]
+
+    def _record_command(self, cmd: str, *args: str) -> None:
+        """Records the setting and register value changed by a successful command.
+
+        Args:
+            cmd: The device command performed by the host.
+            args: Additional device command arguments sent to host.
+
+        """
+        if (kind := self.RESTORED_COMMANDS.get(cmd)) is not None:
+            self._settings[kind, args[0]] = (cmd, *args)
+        if self._shadow is None:
+            return
+        if cmd in self.INVALIDATING_COMMANDS:
+            self._shadow.invalidate()
+        elif cmd in self.SHADOWED_COMMANDS:
+            self._shadow.record(args[0], int(args[1]))
+
+    def _request_array(
+        self, cmd: str, names: Sequence[str], dtype: str, out: NDArray[T] | None
+    ) -> NDArray[T]:
+        """Sends a pipelined request per name and parses the values into an array.
+
+        Each response payload is parsed as a whole, so the array is filled without
+        intermediate lists and partially valid payloads are rejected.
+
+        Args:
+            cmd: The device command reading a single value.
+            names: The names passed to each request.
+            dtype: The data type of the values.
+            out: Array receiving the values, or None for a new array.
+
+        Returns:
+            NDArray[T]: The parsed values in the order of the names.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If a response is not a single value of the data type.
+
+        """
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import numpy as np  # noqa: PLC0415
+        except ImportError as e:
+            raise ImportError(
+                "NumPy is required for bulk readouts, install peary-client[numpy]."
+            ) from e
+        payloads = self._request_many(
+            (f"device.{cmd}", (str(self.index), name)) for name in names
+        )
+        parse = int if np.issubdtype(dtype, np.integer) else float
+        try:
+            values = np.fromiter(
+                (parse(payload) for payload in payloads), dtype, len(payloads)
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid {cmd} responses: {payloads!r}") from e
+        if out is None:
+            return values
+        out[:] = values
+        return out
 
     def _request_name(self) -> str:
         """Requests the name of the device."""
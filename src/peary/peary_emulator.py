@@ -0,0 +1,404 @@
+"""Local stand-in peary server for load and latency testing.
+
+The emulator speaks the peary wire format and keeps the state of its devices in
+memory, so clients can be exercised on any machine without hardware. Usage:
+
+    python -m peary.peary_emulator --port 12345 --latency 0.001 --jitter 0.0005
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+from functools import partial
+from typing import TYPE_CHECKING
+
+from peary.peary_frame_decoder import PearyFrameDecoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class PearyEmulatedDevice:
+    """In-memory model of a device attached to the emulated peary server.
+
+    Registers and memories hold integers and default to 0. Voltages and currents are
+    only measured on switched on ports and are 0 otherwise.
+    """
+
+    class CommandError(Exception):
+        """Exception for device commands failing on the emulated device."""
+
+    KINDS = ("register", "memory", "voltage", "current")
+    MEASURED = ("voltage", "current")
+
+    def __init__(self, name: str) -> None:
+        """Initializes a new emulated device.
+
+        Args:
+            name: The device type reported by the `name` command.
+
+        """
+        self._name = name
+        self._values: dict[str, dict[str, int | float]] = {k: {} for k in self.KINDS}
+        self._states: dict[str, bool] = {}
+        self._switched_on: set[str] = set()
+        self._i2c: dict[tuple[int, ...], int] = {}
+        self._commands: dict[str, Callable[..., bytes]] = {
+            "name": lambda: self._name.encode("utf-8"),
+            "power_on": partial(self._set_state, "powered", on=True),
+            "power_off": partial(self._set_state, "powered", on=False),
+            "reset": self._reset,
+            "configure": partial(self._set_state, "configured", on=True),
+            "daq_start": partial(self._set_state, "daq", on=True),
+            "daq_stop": partial(self._set_state, "daq", on=False),
+            "list_registers": self._list_registers,
+            "switch_on": partial(self._switch, on=True),
+            "switch_off": partial(self._switch, on=False),
+            "car_i2c_write": self._write_i2c,
+            "car_i2c_read": self._read_i2c,
+        }
+        for kind in self.KINDS:
+            self._commands[f"get_{kind}"] = partial(self._get, kind)
+            self._commands[f"set_{kind}"] = partial(self._set, kind)
+
+    @property
+    def name(self) -> str:
+        """Returns the device type."""
+        return self._name
+
+    @property
+    def states(self) -> dict[str, bool]:
+        """Returns the power, configuration and DAQ states set by commands."""
+        return self._states
+
+    def handle(self, cmd: str, args: Sequence[str]) -> bytes:
+        """Performs a device command.
+
+        Args:
+            cmd: The device command without the `device.` prefix.
+            args: The command arguments following the device index.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the command is unknown or its arguments are invalid.
+
+        """
+        try:
+            return self._handle(cmd, args)
+        except (TypeError, ValueError) as e:
+            raise PearyEmulatedDevice.CommandError(
+                f"Invalid arguments for {cmd}: {' '.join(args)}"
+            ) from e
+
+    def _handle(self, cmd: str, args: Sequence[str]) -> bytes:
+        """Performs a device command without translating argument errors.
+
+        Args:
+            cmd: The device command without the `device.` prefix.
+            args: The command arguments following the device index.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the command is unknown.
+
+        """
+        if (command := self._commands.get(cmd)) is None:
+            raise PearyEmulatedDevice.CommandError(f"Unknown device command: {cmd}")
+        return command(*args)
+
+    def _get(self, kind: str, name: str) -> bytes:
+        """Returns the stored value of a register or the measured value of a port."""
+        if kind not in self.MEASURED:
+            value = self._values[kind].get(name, 0)
+        elif name in self._switched_on:
+            value = self._values[kind].get(name, 0.0)
+        else:
+            value = 0.0
+        return str(value).encode("utf-8")
+
+    def _set(self, kind: str, name: str, value: str) -> bytes:
+        """Stores the value of a register or the setpoint of a port."""
+        self._values[kind][name] = (
+            float(value) if kind in self.MEASURED else int(value, 0)
+        )
+        return b""
+
+    def _set_state(self, state: str, *, on: bool) -> bytes:
+        """Sets the power, configuration or DAQ state."""
+        self._states[state] = on
+        return b""
+
+    def _reset(self) -> bytes:
+        """Resets all registers to 0."""
+        self._values["register"].clear()
+        return b""
+
+    def _list_registers(self) -> bytes:
+        """Returns the names of all registers written since the last reset."""
+        return " ".join(sorted(self._values["register"])).encode("utf-8")
+
+    def _switch(self, name: str, *, on: bool) -> bytes:
+        """Switches a port on or off."""
+        if on:
+            self._switched_on.add(name)
+        else:
+            self._switched_on.discard(name)
+        return b""
+
+    def _write_i2c(self, bus: str, comp: str, addr: str, *data: str) -> bytes:
+        """Stores consecutive bytes written to an I2C component."""
+        key = (int(bus, 0), int(comp, 0))
+        start = int(addr, 0)
+        for offset, byte in enumerate(data):
+            self._i2c[(*key, start + offset)] = int(byte, 0) & 0xFF
+        return b""
+
+    def _read_i2c(self, bus: str, comp: str, addr: str, length: str) -> bytes:
+        """Returns consecutive bytes of an I2C component, 0 if never written."""
+        key = (int(bus, 0), int(comp, 0))
+        start = int(addr, 0)
+        return " ".join(
+            str(self._i2c.get((*key, start + offset), 0))
+            for offset in range(int(length, 0))
+        ).encode("utf-8")
+
+
+class PearyEmulator:
+    """Local stand-in peary server with configurable latency, jitter and fragmentation.
+
+    Requests are handled as soon as they are received and each response is written
+    after the latency plus a uniformly distributed jitter, so responses to pipelined
+    requests may be reordered. Responses are optionally written in fragments of a
+    fixed size to exercise partial reads, i.e.
+
+        emulator = PearyEmulator(latency=0.001, jitter=0.0005, fragment_size=3)
+        async with await emulator.start("127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            # connect clients to the port
+
+    """
+
+    STATUS_ERROR = 1
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        fragment_size: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a new emulated peary server.
+
+        Args:
+            latency: Delay in seconds before each response is written. Defaults to 0.
+            jitter: Maximum additional random delay in seconds. Defaults to 0.
+            fragment_size: Size of the fragments responses are written in, or 0 to
+                write each response at once. Defaults to 0.
+            seed: Seed of the jitter random number generator. Defaults to None.
+
+        """
+        self._devices: list[PearyEmulatedDevice] = []
+        self._latency = latency
+        self._jitter = jitter
+        self._fragment_size = fragment_size
+        self._random = random.Random(seed)  # noqa: S311
+        self._commands: dict[str, Callable[..., bytes]] = {
+            "": lambda: b"",
+            "protocol_version": lambda: PearyProtocol.VERSION,
+            "add_device": self._add_device,
+            "list_devices": self._list_devices,
+            "clear_devices": self._clear_devices,
+        }
+
+    @property
+    def devices(self) -> list[PearyEmulatedDevice]:
+        """Returns the added devices in order of their index."""
+        return self._devices
+
+    def handle(self, payload: bytes) -> tuple[bytes, int]:
+        """Performs a request.
+
+        Args:
+            payload: The request payload.
+
+        Returns:
+            tuple[bytes, int]: The response payload and status.
+
+        """
+        try:
+            return self._handle(payload), PearyProtocol.STATUS_OK
+        except (
+            PearyEmulatedDevice.CommandError,
+            IndexError,
+            TypeError,
+            ValueError,
+        ) as e:
+            return str(e).encode("utf-8"), self.STATUS_ERROR
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Starts serving connections.
+
+        Args:
+            host: Interface to listen on. Defaults to 127.0.0.1.
+            port: Port to listen on, or 0 to pick a free port. Defaults to 0.
+
+        Returns:
+            asyncio.Server: The started server.
+
+        """
+        return await asyncio.start_server(self._serve, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        """Starts serving connections on a Unix domain socket.
+
+        Args:
+            path: Path of the socket to listen on.
+
+        Returns:
+            asyncio.Server: The started server.
+
+        """
+        return await asyncio.start_unix_server(self._serve, path)
+
+    async def serve_forever(
+        self, host: str = "127.0.0.1", port: int = 0, *, path: str | None = None
+    ) -> None:
+        """Serves connections until cancelled.
+
+        Args:
+            host: Interface to listen on. Defaults to 127.0.0.1.
+            port: Port to listen on, or 0 to pick a free port. Defaults to 0.
+            path: Path of a Unix domain socket to listen on instead of the port.
+                Defaults to None.
+
+        """
+        server = await (
+            self.start(host, port) if path is None else self.start_unix(path)
+        )
+        async with server:
+            await server.serve_forever()
+
+    def _handle(self, payload: bytes) -> bytes:
+        """Performs a request and raises if it fails.
+
+        Args:
+            payload: The request payload.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the request is unknown.
+            IndexError: If the device index is not the index of an added device.
+            UnicodeDecodeError: If the request payload is not valid UTF-8.
+
+        """
+        msg, *args = payload.decode("utf-8").split(" ")
+        if msg.startswith("device."):
+            if (index := int(args[0])) < 0:
+                raise IndexError(f"Invalid device index: {index}")
+            return self._devices[index].handle(msg[7:], args[1:])
+        if (command := self._commands.get(msg)) is None:
+            raise PearyEmulatedDevice.CommandError(f"Unknown command: {msg}")
+        return command(*args)
+
+    def _add_device(self, name: str) -> bytes:
+        """Adds a device and returns its index."""
+        self._devices.append(PearyEmulatedDevice(name))
+        return str(len(self._devices) - 1).encode("utf-8")
+
+    def _list_devices(self) -> bytes:
+        """Returns the names of all added devices."""
+        return " ".join(device.name for device in self._devices).encode("utf-8")
+
+    def _clear_devices(self) -> bytes:
+        """Removes all added devices."""
+        self._devices.clear()
+        return b""
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answers the requests of a single connection until it is closed.
+
+        Args:
+            reader: Stream reader of the connection.
+            writer: Stream writer of the connection.
+
+        """
+        decoder = PearyFrameDecoder()
+        lock = asyncio.Lock()
+        responses: set[asyncio.Task[None]] = set()
+        with contextlib.suppress(ConnectionError, PearyProtocol.DecodeError):
+            while data := await reader.read(65536):  # pylint: disable=while-used
+                decoder.feed(data)
+                for frame in decoder:
+                    payload, status = self.handle(frame.payload)
+                    encoded = PearyProtocol.encode(payload, frame.tag, status)
+                    response = asyncio.create_task(self._respond(writer, lock, encoded))
+                    responses.add(response)
+                    response.add_done_callback(responses.discard)
+        for response in responses:
+            response.cancel()
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, lock: asyncio.Lock, frame: bytes
+    ) -> None:
+        """Writes a response frame after the emulated delay.
+
+        Args:
+            writer: Stream writer of the connection.
+            lock: Lock keeping the fragments of a response together.
+            frame: The encoded response frame.
+
+        """
+        if delay := self._latency + self._jitter * self._random.random():
+            await asyncio.sleep(delay)
+        size = self._fragment_size or len(frame)
+        async with lock:
+            with contextlib.suppress(ConnectionError):
+                for start in range(0, len(frame), size):
+                    writer.write(frame[start : start + size])
+                    await writer.drain()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Runs the emulated peary server until interrupted.
+
+    Args:
+        argv: Command line arguments. Defaults to the arguments of the process.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=12345)
+    parser.add_argument("--unix", default=None, help="socket path instead of port")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--fragment-size", type=int, default=0, help="bytes")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    emulator = PearyEmulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        fragment_size=args.fragment_size,
+        seed=args.seed,
+    )
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(emulator.serve_forever(args.host, args.port, path=args.unix))
+
+
+if __name__ == "__main__":
+    main()
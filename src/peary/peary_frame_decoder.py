@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class DecodedBytes(NamedTuple):
+    """Return type for decoded bytes."""
+
+    payload: bytes
+    tag: int
+    status: int
+
+
+class DecodedHeader(NamedTuple):
+    """Return type for decoded frame headers."""
+
+    size: int
+    tag: int
+    status: int
+
+
+class PearyFrameDecoder:
+    """Incremental decoder of length-prefixed peary frames.
+
+    The decoder performs no I/O. Byte chunks of arbitrary size are either fed to the
+    decoder or received directly into its buffer, and complete frames are decoded as
+    soon as they are available, i.e.
+
+        decoder = PearyFrameDecoder()
+        decoder.feed(chunk)
+        for frame in decoder:
+            # do something with the frame
+
+    Frames are decoded in place with `struct.unpack_from`, unread bytes are moved to
+    the front of the buffer only when more space is needed, and the buffer only grows
+    to fit a frame larger than itself.
+    """
+
+    class DecodeError(Exception):
+        """Exception for failing decode."""
+
+    STRUCT_HEADER = struct.Struct("!HH")
+    STRUCT_LENGTH = struct.Struct("!L")
+    STRUCT_PREFIX = struct.Struct("!LHH")
+
+    def __init__(self, buffer_size: int = 4096) -> None:
+        """Initializes a new frame decoder.
+
+        Args:
+            buffer_size: Initial size of the receive buffer. Defaults to 4096.
+
+        """
+        self._buffer = bytearray(max(buffer_size, PearyFrameDecoder.STRUCT_LENGTH.size))
+        self._start = 0
+        self._end = 0
+
+    @property
+    def buffered(self) -> int:
+        """Returns the number of received bytes not yet decoded."""
+        return self._end - self._start
+
+    def clear(self) -> None:
+        """Discards all received bytes not yet decoded."""
+        self._start = self._end = 0
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        """Appends received data to the decoder.
+
+        Args:
+            data: The received bytes.
+
+        """
+        view = self.get_buffer(len(data))
+        view[: len(data)] = data
+        view.release()
+        self.buffer_updated(len(data))
+
+    def get_buffer(self, size: int = 0) -> memoryview:
+        """Returns a writable view of the free space in the buffer.
+
+        The free space holds at least the requested size and the rest of a partially
+        received frame. The view must be released before the decoder is used again.
+
+        Args:
+            size: Minimum number of free bytes. Defaults to 0.
+
+        Returns:
+            memoryview: View of the free space at the end of the buffered data.
+
+        """
+        return self.reserve(max(size, self._remaining()))
+
+    def reserve(self, size: int) -> memoryview:
+        """Returns a writable view of the free space in the buffer.
+
+        Unlike `get_buffer`, the free space is not grown to fit the rest of a partially
+        received frame.
+
+        Args:
+            size: Minimum number of free bytes.
+
+        Returns:
+            memoryview: View of the free space at the end of the buffered data.
+
+        """
+        size = max(size, 1)
+        if len(self._buffer) - self._end < size:
+            unread = self._buffer[self._start : self._end]
+            if len(self._buffer) < len(unread) + size:
+                self._buffer = bytearray(max(2 * len(self._buffer), len(unread) + size))
+            self._buffer[: len(unread)] = unread
+            self._end -= self._start
+            self._start = 0
+        return memoryview(self._buffer)[self._end :]
+
+    def buffer_updated(self, size: int) -> None:
+        """Marks bytes written into the view from `get_buffer` as received.
+
+        Args:
+            size: Number of bytes written.
+
+        """
+        self._end += size
+
+    def peek_header(self) -> DecodedHeader | None:
+        """Decodes the header of the next frame without consuming it.
+
+        Returns:
+            DecodedHeader | None: The payload size, tag and status of the next frame,
+                or None if its header has not been received yet.
+
+        Raises:
+            DecodeError: If the frame length is too short for the frame header.
+
+        """
+        if self.buffered < PearyFrameDecoder.STRUCT_PREFIX.size:
+            return None
+        length, tag, status = PearyFrameDecoder.STRUCT_PREFIX.unpack_from(
+            self._buffer, self._start
+        )
+        if length < PearyFrameDecoder.STRUCT_HEADER.size:
+            raise PearyFrameDecoder.DecodeError(f"Invalid frame length: {length}")
+        return DecodedHeader(length - PearyFrameDecoder.STRUCT_HEADER.size, tag, status)
+
+    def discard(self, size: int) -> None:
+        """Consumes received bytes without decoding them, i.e. a peeked header.
+
+        Args:
+            size: Number of bytes to consume, at most the number of buffered bytes.
+
+        """
+        self._start += size
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def readinto(self, view: memoryview) -> int:
+        """Consumes received bytes by copying them into a buffer.
+
+        Args:
+            view: The buffer receiving the bytes.
+
+        Returns:
+            int: The number of copied bytes.
+
+        """
+        size = min(len(view), self.buffered)
+        view[:size] = self._buffer[self._start : self._start + size]
+        self.discard(size)
+        return size
+
+    def next_frame(self) -> DecodedBytes | None:
+        """Decodes the next complete frame.
+
+        Returns:
+            DecodedBytes | None: The decoded frame, or None if no complete frame has
+                been received yet.
+
+        Raises:
+            DecodeError: If the frame length is too short for the frame header.
+
+        """
+        if self._remaining():
+            return None
+        (length,) = PearyFrameDecoder.STRUCT_LENGTH.unpack_from(
+            self._buffer, self._start
+        )
+        if length < PearyFrameDecoder.STRUCT_HEADER.size:
+            raise PearyFrameDecoder.DecodeError(f"Invalid frame length: {length}")
+        start = self._start + PearyFrameDecoder.STRUCT_LENGTH.size
+        end = start + length
+        tag, status = PearyFrameDecoder.STRUCT_HEADER.unpack_from(self._buffer, start)
+        with memoryview(self._buffer) as view:
+            payload = bytes(view[start + PearyFrameDecoder.STRUCT_HEADER.size : end])
+        if end == self._end:
+            self._start = self._end = 0
+        else:
+            self._start = end
+        return DecodedBytes(payload, tag, status)
+
+    def _remaining(self) -> int:
+        """Returns the number of bytes missing to complete the next frame."""
+        if (buffered := self._end - self._start) < PearyFrameDecoder.STRUCT_LENGTH.size:
+            return PearyFrameDecoder.STRUCT_LENGTH.size - buffered
+        (length,) = PearyFrameDecoder.STRUCT_LENGTH.unpack_from(
+            self._buffer, self._start
+        )
+        return max(0, PearyFrameDecoder.STRUCT_LENGTH.size + length - buffered)
+
+    def __iter__(self) -> Iterator[DecodedBytes]:
+        """Decodes all complete frames.
+
+        Yields:
+            DecodedBytes: The decoded frames in order of arrival.
+
+        """
+        while (frame := self.next_frame()) is not None:  # pylint: disable=W0149
+            yield frame
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_reconnecting_protocol import PearyReconnectingProtocol
+from peary.peary_stream import PearyResponseStream
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from peary.peary_protocol import PearySocket
+
+T = TypeVar("T")
+
+
+class PearyRoundTripTimes(NamedTuple):
+    """Round trip times in seconds of the keep alive messages in the window."""
+
+    samples: int
+    last: float
+    mean: float
+    minimum: float
+    maximum: float
+    deviation: float
+
+
+class PearyHeartbeatProtocol(  # pylint: disable=too-many-instance-attributes
+    PearyReconnectingProtocol
+):
+    """Reconnecting peary protocol keeping an idle connection alive in the background.
+
+    A heartbeat thread sends a keep alive message once the connection has been idle
+    for `interval` seconds and records its round trip time. Requests reset the idle
+    time, so no keep alive messages are sent during active traffic. A failing keep
+    alive marks the connection as unhealthy and re-establishes it, i.e.
+
+        client = PearyClient("localhost", protocol_class=PearyHeartbeatProtocol)
+        with client as proxy:
+            proxy.protocol.interval = 2
+            # do something with the proxy
+            print(proxy.protocol.healthy, proxy.protocol.round_trip_times)
+
+    Requests are serialized by a lock shared with the heartbeat, so a keep alive never
+    interleaves with a request. Streamed responses are received in full first for the
+    same reason. The keep alive waits for the response timeout of the empty message,
+    which is set with `timeouts.set("", timeout)`.
+    """
+
+    RTT_WINDOW = 64
+
+    def __init__(
+        self,
+        socket: PearySocket,
+        *,
+        timeout: float = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+        buffer_size: int = 4096,
+        max_in_flight: int = 32,
+    ) -> None:
+        """Initializes a new heartbeat peary protocol and starts its heartbeat.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+            timeout: Socket timeout value in seconds. Defaults to 1.
+            checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+            buffer_size: Initial size of the reusable receive buffer. Defaults to 4096.
+            max_in_flight: Maximum number of pipelined requests awaiting a response
+                before sending blocks on receiving responses. Defaults to 32.
+
+        """
+        self._interval = 5.0
+        self._lock = threading.RLock()
+        self._active = time.monotonic()
+        self._rtts: deque[float] = deque(maxlen=self.RTT_WINDOW)
+        self._failures = 0
+        self._missed = 0
+        self._error: Exception | None = None
+        self._stopped = False
+        self._wakeup = threading.Event()
+        super().__init__(
+            socket,
+            checks=checks,
+            timeout=timeout,
+            buffer_size=buffer_size,
+            max_in_flight=max_in_flight,
+        )
+        self._heartbeat = threading.Thread(target=self._beat, name="peary-heartbeat")
+        self._heartbeat.daemon = True
+        self._heartbeat.start()
+
+    @property
+    def interval(self) -> float:
+        """Returns the idle time in seconds after which a keep alive is sent."""
+        return self._interval
+
+    @interval.setter
+    def interval(self, interval: float) -> None:
+        """Sets the idle time in seconds after which a keep alive is sent."""
+        self._interval = interval
+        self._wakeup.set()
+
+    @property
+    def healthy(self) -> bool:
+        """Returns whether the last keep alive, if any, succeeded."""
+        return not self._missed
+
+    @property
+    def failures(self) -> int:
+        """Returns the number of failed keep alive messages."""
+        return self._failures
+
+    @property
+    def error(self) -> Exception | None:
+        """Returns the error of the last failed keep alive or reconnection."""
+        return self._error
+
+    @property
+    def round_trip_times(self) -> PearyRoundTripTimes | None:
+        """Returns the round trip times, or None before the first keep alive."""
+        if not (rtts := list(self._rtts)):
+            return None
+        return PearyRoundTripTimes(
+            samples=len(rtts),
+            last=rtts[-1],
+            mean=statistics.fmean(rtts),
+            minimum=min(rtts),
+            maximum=max(rtts),
+            deviation=statistics.pstdev(rtts),
+        )
+
+    def close(self) -> None:
+        """Stops the heartbeat once its current keep alive, if any, completes."""
+        self._stopped = True
+        self._wakeup.set()
+        self._heartbeat.join()
+        super().close()
+
+    def reconnect(self) -> None:
+        """Re-establishes the connection with backoff and restores the session."""
+        self._serialize(super().reconnect)
+
+    def request(self, msg: str, *args: str) -> bytes:
+        """Initiates a request and retries it once after reconnecting.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        request = super().request
+        return self._serialize(lambda: request(msg, *args))
+
+    def request_payload(self, msg: str, payload: bytes) -> bytes:
+        """Initiates a request from an encoded payload and retries it once reconnected.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `encode_message`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        request_payload = super().request_payload
+        return self._serialize(lambda: request_payload(msg, payload))
+
+    def send_payload(self, msg: str, payload: bytes) -> int:
+        """Sends an encoded request without waiting for its response.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `encode_message`.
+
+        Returns:
+            int: The request tag used to receive the response.
+
+        """
+        send_payload = super().send_payload
+        return self._serialize(lambda: send_payload(msg, payload))
+
+    def request_many(
+        self, requests: Iterable[tuple[str, Sequence[str]]]
+    ) -> list[bytes | Exception]:
+        """Initiates many requests and retries all of them once after reconnecting.
+
+        Args:
+            requests: Sequence of request messages and their additional arguments.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
+
+        """
+        request_many = super().request_many
+        return self._serialize(lambda: request_many(requests))
+
+    def recv_response(self, tag: int) -> bytes:
+        """Receives the response of a previously sent request.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        recv_response = super().recv_response
+        return self._serialize(lambda: recv_response(tag))
+
+    def stream_response(self, tag: int) -> PearyResponseStream:
+        """Receives the response of a previously sent request and streams it.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            PearyResponseStream: The stream of the received response payload.
+
+        """
+        return PearyResponseStream.from_payload(self.recv_response(tag))
+
+    def _serialize(self, call: Callable[[], T]) -> T:
+        """Performs a call on the connection while holding the lock of the heartbeat.
+
+        Args:
+            call: The call, which resets the idle time once it returns or fails.
+
+        Returns:
+            T: The result of the call.
+
+        """
+        with self._lock:
+            try:
+                return call()
+            finally:
+                self._active = time.monotonic()
+
+    def _idle_wait(self) -> float:
+        """Returns the time in seconds until the connection has been idle too long."""
+        return max(self._active + self._interval - time.monotonic(), 0)
+
+    def _beat(self) -> None:
+        """Sends a keep alive whenever the connection has been idle until stopped."""
+        while not self._stopped:  # pylint: disable=while-used
+            self._wakeup.wait(self._idle_wait())
+            self._wakeup.clear()
+            with self._lock:
+                if not self._idle_wait() and not self._stopped:
+                    self._keep_alive()
+
+    def _keep_alive(self) -> None:
+        """Sends a keep alive and re-establishes the connection if it fails."""
+        try:
+            self._measure()
+        except PearyReconnectingProtocol.RECONNECT_ERRORS as e:
+            self._error = e
+            self._failures += 1
+            self._missed += 1
+        else:
+            self._missed = 0
+            return
+        if self.connect is None:
+            return
+        try:
+            self.reconnect()
+        except PearyReconnectingProtocol.ReconnectError as e:
+            self._error = e
+        else:
+            self._missed = 0
+
+    def _measure(self) -> None:
+        """Sends a keep alive without retrying it and records its round trip time."""
+        start = time.monotonic()
+        PearyProtocol.request(self, "")
+        self._rtts.append(time.monotonic() - start)
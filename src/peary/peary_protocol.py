@@ -1,27 +1,49 @@
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
-import select
-import struct
+import contextlib
+import socket as socket_module
+import ssl
+import threading
+import time
 from enum import Flag, auto
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING, Protocol, cast
+
+from peary.peary_frame_decoder import DecodedBytes, DecodedHeader, PearyFrameDecoder
+from peary.peary_request_tracking import PearyRequestTracking
+from peary.peary_stream import PearyResponseStream
+from peary.peary_timeouts import PearyTimeouts
 
 if TYPE_CHECKING:
-    from socket import socket as socket_type
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Buffer
+
+    from peary.peary_capture import PearyCaptureWriter
+    from peary.peary_stats import PearyStats
 
 
-class DecodedBytes(NamedTuple):
-    """Return type for decoded bytes."""
+class PearySocket(Protocol):
+    """Socket operations used by the peary protocol, i.e. a connected `socket`."""
 
-    payload: bytes
-    tag: int
-    status: int
+    def settimeout(self, value: float | None, /) -> None:
+        """Sets the timeout of blocking operations."""
 
+    def sendmsg(self, buffers: Iterable[Buffer], /) -> int:
+        """Sends buffers in order and returns the number of sent bytes."""
 
-class PearyProtocol:
-    """Protocol for encoding and decoding communication with a remote peary server."""
+    def recv_into(self, buffer: WriteableBuffer, /) -> int:
+        """Receives into a buffer and returns the number of received bytes."""
 
-    class DecodeError(Exception):
-        """Exception for failing decode."""
+
+class PearyProtocol(PearyRequestTracking):
+    """Protocol for encoding and decoding communication with a remote peary server.
+
+    Each request waits for the response timeout of its message, or until the deadline
+    of an enclosing `deadline` block. A request timing out is abandoned and its late
+    response is discarded when it arrives, so the following requests are unaffected.
+    """
 
     class ResponseReceiveError(Exception):
         """Exception for failing to receive responses."""
@@ -44,31 +66,49 @@ class PearyProtocol:
         CHECK_NONE = auto()
         CHECK_VERSION = auto()
 
+    IOV_MAX = 1024
+    JOIN_MAX = 1024
     STATUS_OK = 0
-    STRUCT_HEADER = struct.Struct("!HH")
-    STRUCT_LENGTH = struct.Struct("!L")
+    TIMEOUT_ERRORS = (TimeoutError, socket_module.timeout)
+    TAG_MAX = 0xFFFF
+    STRUCT_HEADER = PearyFrameDecoder.STRUCT_HEADER
+    STRUCT_LENGTH = PearyFrameDecoder.STRUCT_LENGTH
+    STRUCT_PREFIX = PearyFrameDecoder.STRUCT_PREFIX
     VERSION = b"1"
 
+    DecodeError = PearyFrameDecoder.DecodeError
+
     def __init__(
         self,
-        socket: socket_type,
+        socket: PearySocket,
         *,
-        timeout: int = 1,
+        timeout: float = 1,
         checks: Checks = Checks.CHECK_VERSION,
+        buffer_size: int = 4096,
+        max_in_flight: int = 32,
     ) -> None:
         """Initializes a new peary proxy.
 
         Args:
             socket: Socket connected to the remote peary server.
-            timeout: Socket timeout value in seconds. Defaults to 1.
+            timeout: Default response timeout in seconds. Defaults to 1.
             checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+            buffer_size: Initial size of the reusable receive buffer. The buffer grows
+                to fit larger responses. Defaults to 4096.
+            max_in_flight: Maximum number of pipelined requests awaiting a response
+                before sending blocks on receiving responses. Defaults to 32.
 
         Raises:
             VersionError: If protocol version doesn match with remote host.
 
         """
-        self._tag: int = 0
         self._socket = socket
+        self._gather = PearyProtocol._can_gather(socket)
+        self._timeout = timeout
+        self._socket_timeout = timeout
+        self._deadlines = threading.local()
+        self._decoder = PearyFrameDecoder(buffer_size)
+        self._tracker = PearyRequestTracker(max_in_flight, timeout=timeout)
 
         self._socket.settimeout(timeout)
         if PearyProtocol.Checks.CHECK_VERSION in checks:
@@ -87,12 +127,44 @@ class PearyProtocol:
             bytes: The encoded sequence of bytes.
 
         """
-        header = PearyProtocol.STRUCT_HEADER.pack(tag, status)
-        length = PearyProtocol.STRUCT_LENGTH.pack(len(header) + len(payload))
-        return b"".join([length, header, payload])
+        return PearyProtocol.encode_prefix(len(payload), tag, status) + payload
+
+    @staticmethod
+    def encode_prefix(payload_size: int, tag: int, status: int) -> bytes:
+        """Encodes the length and header preceding a payload.
+
+        The prefix and a large payload are sent as separate buffers, so the payload is
+        not copied into the encoded frame.
+
+        Args:
+            payload_size: Number of bytes in the payload following the prefix.
+            tag: Identifier encoded into the sequence.
+            status: Status encoded into the sequence.
+
+        Returns:
+            bytes: The encoded length and header.
+
+        """
+        return PearyProtocol.STRUCT_PREFIX.pack(
+            PearyProtocol.STRUCT_HEADER.size + payload_size, tag, status
+        )
 
     @staticmethod
-    def decode(data: bytes) -> DecodedBytes:
+    def encode_message(msg: str, args: Sequence[str]) -> bytes:
+        """Encodes a request message and its arguments into a request payload.
+
+        Args:
+            msg: The request message.
+            args: Additiona message argumnets.
+
+        Returns:
+            bytes: The encoded request payload.
+
+        """
+        return " ".join([msg, *args]).encode("utf-8")
+
+    @staticmethod
+    def decode(data: bytes | bytearray | memoryview) -> DecodedBytes:
         """Decodes data into a sequence of bytes.
 
         Args:
@@ -106,98 +178,572 @@ class PearyProtocol:
             raise PearyProtocol.DecodeError(
                 f"Insufficent number of bytes: {len(data)}."
             )
-        (length,) = PearyProtocol.STRUCT_LENGTH.unpack(
-            data[: PearyProtocol.STRUCT_LENGTH.size]
-        )
+        (length,) = PearyProtocol.STRUCT_LENGTH.unpack_from(data)
 
         if len(data) != (PearyProtocol.STRUCT_LENGTH.size + length):
             raise PearyProtocol.DecodeError("Incorrect number of bytes")
-        tag, status = PearyProtocol.STRUCT_HEADER.unpack(
-            data[
-                PearyProtocol.STRUCT_LENGTH.size : PearyProtocol.STRUCT_LENGTH.size
-                + PearyProtocol.STRUCT_HEADER.size
-            ]
+        tag, status = PearyProtocol.STRUCT_HEADER.unpack_from(
+            data, PearyProtocol.STRUCT_LENGTH.size
+        )
+        payload = bytes(
+            data[PearyProtocol.STRUCT_LENGTH.size + PearyProtocol.STRUCT_HEADER.size :]
         )
-        payload = data[PearyProtocol.STRUCT_HEADER.size - length :]
         return DecodedBytes(payload, tag, status)
 
-    def request(self, msg: str, *args: str, buffer_size: int = 4096) -> bytes:
+    @staticmethod
+    def _can_gather(socket: PearySocket) -> bool:
+        """Returns true if a socket supports gathering writes with `sendmsg`.
+
+        Args:
+            socket: The connected socket.
+
+        Returns:
+            bool: False for TLS sockets and sockets without `sendmsg`, e.g. on Windows.
+
+        """
+        return hasattr(socket, "sendmsg") and not isinstance(socket, ssl.SSLSocket)
+
+    @staticmethod
+    def _consume(views: list[bytes | memoryview], index: int, size: int) -> int:
+        """Advances past sent bytes in a list of buffers.
+
+        Args:
+            views: The buffers being sent, updated to a view of the unsent part of a
+                partially sent buffer.
+            index: Index of the first buffer not yet completely sent.
+            size: Number of bytes sent starting at the index.
+
+        Returns:
+            int: Index of the first buffer not completely sent.
+
+        """
+        while size >= len(views[index]):  # pylint: disable=while-used
+            size -= len(views[index])
+            index += 1
+            if index == len(views):
+                return index
+        views[index] = memoryview(views[index])[size:]
+        return index
+
+    def close(self) -> None:
+        """Stops the background threads of the protocol, if any.
+
+        The socket is left open and closed by its owner, i.e. the client.
+        """
+
+    @contextlib.contextmanager
+    def deadline(self, timeout: float) -> Iterator[None]:
+        """Limits the time waited for the responses of the requests in a with block.
+
+        The deadline replaces the response timeouts of the requests, so slow commands
+        get the time they need without raising the timeout of every other request, i.e.
+
+            with protocol.deadline(30):
+                device.configure()
+
+        Nested deadlines never extend the deadline of an enclosing block, and the
+        deadline only applies to requests made by the current thread.
+
+        Args:
+            timeout: Time in seconds from now until all responses must be received.
+
+        Yields:
+            None: Nothing, the deadline applies until the end of the block.
+
+        """
+        previous: float | None = getattr(self._deadlines, "deadline", None)
+        deadline = time.monotonic() + timeout
+        self._deadlines.deadline = (
+            deadline if previous is None else min(deadline, previous)
+        )
+        try:
+            yield
+        finally:
+            self._deadlines.deadline = previous
+
+    def reset(self, socket: PearySocket) -> None:
+        """Replaces the connection and discards all pending requests and responses.
+
+        Args:
+            socket: Socket newly connected to the remote peary server.
+
+        """
+        self._socket = socket
+        self._gather = PearyProtocol._can_gather(socket)
+        self._socket.settimeout(self._timeout)
+        self._socket_timeout = self._timeout
+        self._decoder.clear()
+        self._tracker.reset()
+
+    def request(self, msg: str, *args: str) -> bytes:
         """Initiates a requst to the connected peary server.
 
         Args:
             msg: The request message to be sent.
             *args: Additiona message argumnets.
-            buffer_size: Size of the reciever buffer.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return self.recv_response(self.send_request(msg, *args))
+
+    def send_request(self, msg: str, *args: str) -> int:
+        """Sends a request without waiting for its response.
+
+        Requests sent this way are pipelined, i.e. many requests can be written before
+        any response is read. When the in-flight window is full, responses are received
+        and held until they are collected with `recv_response`.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            int: The request tag used to collect the response.
+
+        """
+        return self.send_payload(msg, self.encode_message(msg, args))
+
+    def request_payload(self, msg: str, payload: bytes) -> bytes:
+        """Initiates a request from an already encoded payload.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `encode_message`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return self.recv_response(self.send_payload(msg, payload))
+
+    def send_payload(self, msg: str, payload: bytes) -> int:
+        """Sends a request from an already encoded payload without waiting.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `encode_message`.
+
+        Returns:
+            int: The request tag used to collect the response.
+
+        """
+        return self._send_requests([(msg, payload)])[0]
+
+    def request_many(
+        self, requests: Iterable[tuple[str, Sequence[str]]]
+    ) -> list[bytes | Exception]:
+        """Initiates many independent requests and returns all of their responses.
+
+        The requests are pipelined and their frames are coalesced into as few writes as
+        the in-flight window allows. A request that fails on the remote server does not
+        abort the others, instead its exception is returned in place of its response.
+
+        Args:
+            requests: Sequence of request messages and their additional arguments.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
+
+        """
+        return self._collect_responses(
+            self._send_requests(
+                (msg, self.encode_message(msg, args)) for msg, args in requests
+            )
+        )
+
+    def recv_response(self, tag: int) -> bytes:
+        """Receives the response of a previously sent request.
+
+        Responses to other pending requests received in the meantime are held until
+        they are collected, so pipelined responses can be collected in any order.
+
+        Args:
+            tag: The request tag returned by `send_request`.
 
         Returns:
             bytes: The received response.
 
         Raises:
             ResponseStatusError: If response returns a failing status.
-            ResponseSequenceError: If response id different than request id.
+            ResponseSequenceError: If the tag does not belong to a pending request.
 
         """
-        self._tag += 1
-        self._send(
-            PearyProtocol.encode(
-                " ".join([msg, *args]).encode("utf-8"), self._tag, self.STATUS_OK
-            )
+        self._wait_response(tag)
+        return self._tracker.pop_response(tag)
+
+    def request_stream(self, msg: str, *args: str) -> PearyResponseStream:
+        """Initiates a request whose response payload is read as it arrives.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            PearyResponseStream: The stream of the response payload.
+
+        """
+        return self.stream_response(self.send_request(msg, *args))
+
+    def stream_response(self, tag: int) -> PearyResponseStream:
+        """Receives the response of a previously sent request as a stream.
+
+        Responses to other requests arriving first are received and held as usual.
+        Once the header of the response arrives, its payload is received in chunks
+        read from the stream, so memory use does not depend on the payload size. No
+        further requests are sent or received until the stream is read to its end or
+        closed. A response already held, or received while capturing, is streamed from
+        memory.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            PearyResponseStream: The stream of the response payload.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+            ResponseSequenceError: If the tag does not belong to a pending request.
+
+        """
+        if self._tracker.has_response(tag) or self._tracker.capture is not None:
+            return PearyResponseStream.from_payload(self.recv_response(tag))
+        header = self._receive_header(tag)
+        self._tracker.start_stream(tag)
+        stream = PearyResponseStream(
+            header.size,
+            self._receive_payload_into,
+            lambda: self._tracker.complete_stream(tag, header.status, header.size),
         )
-        resp, resp_id, resp_status = PearyProtocol.decode(self._recv(buffer_size))
+        if not header.size or header.status != PearyProtocol.STATUS_OK:
+            stream.close()
+        return stream
 
-        if resp_status != PearyProtocol.STATUS_OK:
-            raise PearyProtocol.ResponseStatusError(
-                f"Failed response status {resp_status} from request '{msg!r}'"
-            )
-        if resp_id != self._tag:
-            raise PearyProtocol.ResponseSequenceError(
-                f"Recieved out of order repsonse from '{msg}': {resp_id} != {self._tag}"
-            )
+    def _collect_responses(self, tags: list[int]) -> list[bytes | Exception]:
+        """Waits for the responses of pending requests and collects them in order.
 
-        return resp
+        Args:
+            tags: The request tags returned by `send_request`.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
 
-    def _send(self, data: bytes) -> int:
-        """Sends data through the connected socket.
+        Raises:
+            TimeoutError: If a response does not arrive within its timeout, in which
+                case all of the requests are abandoned.
+
+        """
+        try:
+            self._wait_responses(tags)
+        except TimeoutError:
+            for tag in tags:
+                self._tracker.abandon(tag)
+            raise
+        return [self._tracker.collect_response(tag) for tag in tags]
+
+    def _wait_responses(self, tags: Iterable[int]) -> None:
+        """Receives responses until the responses of pending requests have arrived.
+
+        Args:
+            tags: The request tags returned by `send_request`.
+
+        """
+        for tag in tags:
+            self._wait_response(tag)
+
+    def _wait_response(self, tag: int) -> None:
+        """Receives responses until the response of a pending request has arrived.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Raises:
+            TimeoutError: If the response does not arrive within its timeout, in which
+                case the request is abandoned.
+
+        """
+        if self._tracker.has_response(tag):
+            return
+        timeout = self._response_timeout(tag)
+        try:
+            self._receive_until(tag, timeout)
+        except PearyProtocol.TIMEOUT_ERRORS as e:
+            raise self._timed_out(tag, timeout) from e
+
+    def _receive_until(self, tag: int, timeout: float) -> None:
+        """Receives responses until the response of a pending request has arrived.
+
+        Each receive waits at most for the time left until the timeout expires.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+            timeout: Time in seconds to wait for the response.
+
+        Raises:
+            TimeoutError: If the timeout expires before the response arrives.
+
+        """
+        deadline = time.monotonic() + timeout
+        while not self._tracker.has_response(tag):  # pylint: disable=while-used
+            self._set_socket_timeout(timeout)
+            self._receive_response(tag)
+            timeout = deadline - time.monotonic()
+
+    def _receive_header(self, tag: int) -> DecodedHeader:
+        """Receives responses until the header of a pending request has arrived.
+
+        The socket timeout is restored to the response timeout afterwards, so each
+        receive of the payload waits for the full timeout.
 
         Args:
-            data: Bytes to be sent.
+            tag: The request tag returned by `send_request`.
 
         Returns:
-            int: The number of sent bytes.
+            DecodedHeader: The header of the response, followed by its payload.
 
         Raises:
-            RequestSendError: If the data failed to send
+            TimeoutError: If the header does not arrive within its timeout, in which
+                case the request is abandoned.
+
+        """
+        timeout = self._response_timeout(tag)
+        try:
+            header = self._receive_header_until(tag, timeout)
+        except PearyProtocol.TIMEOUT_ERRORS as e:
+            raise self._timed_out(tag, timeout) from e
+        self._set_socket_timeout(timeout)
+        return header
+
+    def _receive_header_until(self, tag: int, timeout: float) -> DecodedHeader:
+        """Receives responses until the header of a pending request has arrived.
+
+        Only the headers of frames are received ahead, so the payload of the response
+        is left on the connection.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+            timeout: Time in seconds to wait for the header.
+
+        Returns:
+            DecodedHeader: The header of the response, followed by its payload.
 
         """
-        if (size := self._socket.send(data)) != len(data):
-            raise PearyProtocol.RequestSendError(f"Failed to send request: {data!r}")
+        deadline = time.monotonic() + timeout
+        while (  # pylint: disable=while-used
+            header := self._decoder.peek_header()
+        ) is None or header.tag != tag:
+            self._set_socket_timeout(timeout)
+            if header is None:
+                self._receive_into_decoder(
+                    self._decoder.reserve(self.STRUCT_PREFIX.size)
+                )
+            else:
+                self._receive_response(tag)
+            timeout = deadline - time.monotonic()
+        self._decoder.discard(self.STRUCT_PREFIX.size)
+        return header
+
+    def _receive_payload_into(self, view: memoryview) -> int:
+        """Receives part of a streamed response payload into a buffer.
+
+        Args:
+            view: The buffer, no larger than the rest of the payload.
+
+        Returns:
+            int: The number of received bytes.
+
+        Raises:
+            ResponseReceiveError: If the connection closes or times out before the end
+                of the payload, leaving the connection out of sync.
+
+        """
+        if self._decoder.buffered:
+            return self._decoder.readinto(view)
+        try:
+            size = self._socket.recv_into(view)
+        except PearyProtocol.TIMEOUT_ERRORS as e:
+            raise PearyProtocol.ResponseReceiveError(
+                "Timed out receiving response stream."
+            ) from e
+        if not size:
+            raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
         return size
 
-    def _recv(self, buffer_size: int) -> bytes:
-        """Receive data from the connected socket.
+    def _set_socket_timeout(self, timeout: float) -> None:
+        """Sets the socket timeout to the time left for a response.
 
         Args:
-            buffer_size: Number of bytes to receive.
+            timeout: Time in seconds left to wait for the response.
+
+        Raises:
+            TimeoutError: If no time is left.
+
+        """
+        if timeout <= 0:
+            raise TimeoutError
+        if timeout != self._socket_timeout:
+            self._socket.settimeout(timeout)
+            self._socket_timeout = timeout
+
+    def _response_timeout(self, tag: int) -> float:
+        """Returns the time to wait for the response of a pending request.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            float: The time in seconds until the deadline of the enclosing `deadline`
+                block, or else the response timeout of the request message.
+
+        """
+        if (deadline := getattr(self._deadlines, "deadline", None)) is not None:
+            return cast("float", deadline) - time.monotonic()
+        return self._tracker.timeouts.timeout(self._tracker.message(tag))
+
+    def _timed_out(self, tag: int, timeout: float) -> TimeoutError:
+        """Abandons a pending request whose response did not arrive in time.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+            timeout: Time in seconds waited for the response.
+
+        Returns:
+            TimeoutError: The error to be raised for the request.
+
+        """
+        msg = self._tracker.message(tag)
+        self._tracker.abandon(tag)
+        self._tracker.timeouts.expire(msg)
+        return TimeoutError(f"No response to '{msg}' within {timeout:.3g}s.")
+
+    def _receive_response(self, tag: int) -> None:
+        """Receives a single response and holds it for its pending request.
+
+        Args:
+            tag: The request tag being waited on, used for error reporting.
+
+        """
+        self._tracker.add_response(self._recv(), tag)
+
+    def _send_requests(self, requests: Iterable[tuple[str, bytes]]) -> list[int]:
+        """Encodes and sends requests while respecting the in-flight window.
+
+        The frames queued between receives are sent together with a single gathering
+        write.
+
+        Args:
+            requests: Sequence of request messages and their encoded payloads.
 
         Returns:
-            bytes: The received data.
+            list[int]: The request tags used to collect the responses.
 
         Raises:
-            ResponseReceiveError: If failed to receive response.
+            TimeoutError: If the oldest request in flight times out while the window
+                is full, in which case all requests sent by this call are abandoned.
 
         """
-        data = bytearray()
-        while True:  # pylint: disable=while-used
-            block: bytes = self._socket.recv(buffer_size)
-            data.extend(block)
-            if len(block) < buffer_size:
-                break
-            readable, _, _ = select.select([self._socket], [], [], 0)
-            if self._socket not in readable:
-                break
-        if not data:
+        tags: list[int] = []
+        buffers: list[bytes] = []
+        for msg, payload in requests:
+            while self._tracker.is_full():  # pylint: disable=while-used
+                self._send(buffers)
+                buffers.clear()
+                try:
+                    self._wait_response(self._tracker.oldest())
+                except TimeoutError:
+                    for tag in tags:
+                        self._tracker.abandon(tag)
+                    raise
+            tag, frame = self._tracker.encode_request(msg, payload)
+            self._queue_frame(buffers, frame)
+            tags.append(tag)
+        self._send(buffers)
+        return tags
+
+    def _queue_frame(self, buffers: list[bytes], frame: tuple[bytes, bytes]) -> None:
+        """Queues an encoded frame for a gathering write.
+
+        A payload of at most `JOIN_MAX` bytes is joined with its prefix, since sending
+        a small frame as a single buffer is cheaper than gathering its two buffers.
+
+        Args:
+            buffers: The buffers to be sent, extended in place.
+            frame: The encoded prefix and payload of a request.
+
+        """
+        prefix, payload = frame
+        if len(payload) > self.JOIN_MAX:
+            buffers += frame
+        else:
+            buffers.append(prefix + payload)
+
+    def _send(self, buffers: Sequence[bytes]) -> int:
+        """Sends buffers through the connected socket without joining them.
+
+        The buffers are written with `sendmsg` in chunks of at most `IOV_MAX` buffers,
+        and partial writes are continued from the first unsent byte. Sockets without
+        a usable `sendmsg`, e.g. on Windows or with TLS, are sent joined buffers.
+
+        Args:
+            buffers: Bytes to be sent in order.
+
+        Returns:
+            int: The number of sent bytes.
+
+        Raises:
+            RequestSendError: If the socket fails to accept any more data.
+
+        """
+        if not self._gather:
+            cast("socket_module.socket", self._socket).sendall(b"".join(buffers))
+            return sum(len(buffer) for buffer in buffers)
+        views: list[bytes | memoryview] = list(buffers)
+        index = sent = 0
+        while index < len(views):  # pylint: disable=while-used
+            if not (size := self._socket.sendmsg(views[index : index + self.IOV_MAX])):
+                unsent = b"".join(views[index:])
+                raise PearyProtocol.RequestSendError(
+                    f"Failed to send request: {unsent!r}"
+                )
+            sent += size
+            if index + 1 == len(views) and size == len(views[index]):
+                break  # the last buffer, e.g. a single small frame, was sent whole
+            index = PearyProtocol._consume(views, index, size)
+        return sent
+
+    def _recv(self) -> DecodedBytes:
+        """Receive a single frame from the connected socket.
+
+        Data is received directly into the buffer of the frame decoder, so frames
+        arriving back-to-back in one segment are decoded without further socket calls.
+
+        Returns:
+            DecodedBytes: The decoded frame.
+
+        Raises:
+            ResponseReceiveError: If the connection closes before a frame is received.
+
+        """
+        while (frame := self._decoder.next_frame()) is None:  # pylint: disable=W0149
+            self._receive_into_decoder(self._decoder.get_buffer())
+        return frame
+
+    def _receive_into_decoder(self, view: memoryview) -> None:
+        """Receives data from the connected socket into the frame decoder.
+
+        Args:
+            view: The free space of the decoder buffer.
+
+        Raises:
+            ResponseReceiveError: If the connection closes before data is received.
+
+        """
+        if not (size := self._socket.recv_into(view)):
             raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
-        return bytes(data)
+        self._decoder.buffer_updated(size)
 
     def _verify_compatible_version(self) -> None:
         """Verify the remote version is suppoted by this protocol.
@@ -210,3 +756,333 @@ class PearyProtocol:
             raise PearyProtocol.VersionError(
                 f"Unsupported protocol version: {version!r}"
             )
+
+
+class PearyRequestTracker:  # pylint: disable=too-many-instance-attributes
+    """Tracks pipelined requests by tag and holds responses until they are collected.
+
+    The tracker performs no I/O, so it is shared by the blocking and asyncio protocols.
+    Requests abandoned after a timeout no longer count as in flight, and their late
+    responses are discarded when they arrive. At most `ABANDONED_MAX` requests wait
+    for a late response, beyond that the oldest is forgotten and its tag reused, so
+    peers never answering do not exhaust the tags.
+    """
+
+    ABANDONED_MAX = 1024
+
+    def __init__(self, max_in_flight: int = 32, *, timeout: float = 1) -> None:
+        """Initializes a new request tracker.
+
+        Args:
+            max_in_flight: Maximum number of requests awaiting a response. Defaults to
+                32.
+            timeout: Default response timeout in seconds. Defaults to 1.
+
+        """
+        self._tag: int = 0
+        self._max_in_flight = max(1, min(max_in_flight, PearyProtocol.TAG_MAX))
+        self._pending: dict[int, str] = {}
+        self._responses: dict[int, DecodedBytes] = {}
+        self._abandoned: dict[int, str] = {}
+        self._stats: PearyStats | None = None
+        self._sent: dict[int, tuple[float, int]] = {}
+        self._timeouts = PearyTimeouts(timeout)
+        self._stream: int | None = None
+        self.capture: PearyCaptureWriter | None = None
+
+    @property
+    def max_in_flight(self) -> int:
+        """Returns the maximum number of requests awaiting a response."""
+        return self._max_in_flight
+
+    @property
+    def stats(self) -> PearyStats | None:
+        """Returns the statistics recording completed requests, if any."""
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: PearyStats | None) -> None:
+        """Sets the statistics recording completed requests, or None to disable."""
+        self._stats = stats
+        self._sent.clear()
+
+    @property
+    def timeouts(self) -> PearyTimeouts:
+        """Returns the response timeouts of the requests by their message."""
+        return self._timeouts
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of sent requests whose response is not yet received."""
+        return len(self._pending) - len(self._responses)
+
+    @property
+    def abandoned(self) -> int:
+        """Returns the number of timed out requests whose late response is discarded."""
+        return len(self._abandoned)
+
+    def is_full(self) -> bool:
+        """Returns true if no further request may be sent before receiving."""
+        return self.in_flight >= self._max_in_flight
+
+    def oldest(self) -> int:
+        """Returns the tag of the oldest pending request still awaiting its response."""
+        return next(tag for tag in self._pending if tag not in self._responses)
+
+    def message(self, tag: int) -> str:
+        """Returns the message of a pending request.
+
+        Args:
+            tag: The request tag.
+
+        Returns:
+            str: The request message.
+
+        """
+        return self._pending[tag]
+
+    def encode_request(
+        self, msg: str, payload: bytes
+    ) -> tuple[int, tuple[bytes, bytes]]:
+        """Assigns the next free tag to a request and encodes it.
+
+        Only the prefix holding the tag is packed, the encoded payload is used as is.
+        Tags still pending, holding a response or awaiting a late response are skipped
+        when the tag counter wraps around.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The encoded request message and arguments.
+
+        Returns:
+            tuple[int, tuple[bytes, bytes]]: The request tag and the encoded request as
+                its prefix and payload buffers.
+
+        Raises:
+            RequestSendError: If a response is being streamed or all tags are in use.
+
+        """
+        self._check_stream(PearyProtocol.RequestSendError)
+        for _ in range(PearyProtocol.TAG_MAX):
+            self._tag = self._tag % PearyProtocol.TAG_MAX + 1
+            if self._tag not in self._pending and self._tag not in self._abandoned:
+                break
+        else:
+            raise PearyProtocol.RequestSendError("No free request tag.")
+        self._pending[self._tag] = msg
+        if self._stats is not None or self._timeouts.adaptive:
+            self._sent[self._tag] = (time.perf_counter(), len(payload))
+        if self.capture is not None:
+            self.capture.write(
+                self.capture.Direction.SENT, self._tag, PearyProtocol.STATUS_OK, payload
+            )
+        return self._tag, (
+            PearyProtocol.encode_prefix(
+                len(payload), self._tag, PearyProtocol.STATUS_OK
+            ),
+            payload,
+        )
+
+    def reset(self) -> None:
+        """Discards all pending requests and held responses, keeping the tag counter."""
+        self._pending.clear()
+        self._responses.clear()
+        self._abandoned.clear()
+        self._sent.clear()
+        self._stream = None
+
+    def abandon(self, tag: int) -> None:
+        """Stops waiting for the response of a request, i.e. after it timed out.
+
+        The late response is discarded when it arrives. Tags of requests that are not
+        pending are ignored. The oldest abandoned request is forgotten once more than
+        `ABANDONED_MAX` are abandoned.
+
+        Args:
+            tag: The request tag.
+
+        """
+        if (msg := self._pending.pop(tag, None)) is not None:
+            if self._responses.pop(tag, None) is None:
+                self._abandoned[tag] = msg
+            else:
+                self._sent.pop(tag, None)
+        if len(self._abandoned) > self.ABANDONED_MAX:
+            oldest = next(iter(self._abandoned))
+            del self._abandoned[oldest]
+            self._sent.pop(oldest, None)
+
+    def holds(self, tag: int) -> bool:
+        """Returns true if a received response is held for a request.
+
+        Args:
+            tag: The request tag.
+
+        Returns:
+            bool: True if the response is held by the tracker.
+
+        """
+        return tag in self._responses
+
+    def has_response(self, tag: int) -> bool:
+        """Returns true if the response of a pending request has been received.
+
+        Args:
+            tag: The request tag.
+
+        Returns:
+            bool: True if the response is held by the tracker.
+
+        Raises:
+            ResponseSequenceError: If the tag does not belong to a pending request, or
+                the response is not held while another response is being streamed.
+
+        """
+        if tag not in self._pending:
+            raise PearyProtocol.ResponseSequenceError(f"Unknown request tag: {tag}")
+        if tag not in self._responses:
+            self._check_stream(PearyProtocol.ResponseSequenceError)
+        return tag in self._responses
+
+    def add_response(self, response: DecodedBytes, tag: int) -> None:
+        """Holds a received response for its pending request.
+
+        Args:
+            response: The decoded response.
+            tag: The request tag being waited on, used for error reporting.
+
+        Raises:
+            ResponseSequenceError: If response tag does not match a pending request.
+
+        """
+        if self.capture is not None:
+            self.capture.write(
+                self.capture.Direction.RECEIVED,
+                response.tag,
+                response.status,
+                response.payload,
+            )
+        if (msg := self._abandoned.pop(response.tag, None)) is not None:
+            if response.tag in self._sent:
+                self._record(msg, response.tag, response.status, len(response.payload))
+            return
+        if response.tag not in self._pending or response.tag in self._responses:
+            raise PearyProtocol.ResponseSequenceError(
+                f"Recieved out of order repsonse from '{self._pending.get(tag)}': "
+                f"{response.tag} != {tag}"
+            )
+        self._responses[response.tag] = response
+        if response.tag in self._sent:
+            self._record(
+                self._pending[response.tag],
+                response.tag,
+                response.status,
+                len(response.payload),
+            )
+
+    def pop_response(self, tag: int) -> bytes:
+        """Removes a received response and returns its payload.
+
+        Args:
+            tag: The request tag.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+
+        """
+        msg = self._pending.pop(tag)
+        resp, _, resp_status = self._responses.pop(tag)
+
+        if resp_status != PearyProtocol.STATUS_OK:
+            raise PearyProtocol.ResponseStatusError(
+                f"Failed response status {resp_status} from request '{msg!r}'"
+            )
+
+        return resp
+
+    def start_stream(self, tag: int) -> None:
+        """Marks a pending request whose response payload is being streamed.
+
+        Args:
+            tag: The request tag.
+
+        """
+        self._stream = tag
+
+    def complete_stream(self, tag: int, status: int, size: int) -> None:
+        """Removes a pending request whose response payload has been streamed.
+
+        Args:
+            tag: The request tag.
+            status: The response status.
+            size: The size of the streamed payload.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+
+        """
+        msg = self._pending.pop(tag)
+        self._stream = None
+        if tag in self._sent:
+            self._record(msg, tag, status, size)
+        if status != PearyProtocol.STATUS_OK:
+            raise PearyProtocol.ResponseStatusError(
+                f"Failed response status {status} from request '{msg!r}'"
+            )
+
+    def collect_response(self, tag: int) -> bytes | Exception:
+        """Removes a received response and returns its payload or failure.
+
+        Args:
+            tag: The request tag.
+
+        Returns:
+            bytes | Exception: The response payload or its `ResponseStatusError`.
+
+        """
+        try:
+            return self.pop_response(tag)
+        except PearyProtocol.ResponseStatusError as e:
+            return e
+
+    def _check_stream(self, error: type[Exception]) -> None:
+        """Raises if a response is being streamed, leaving its payload on the stream.
+
+        Args:
+            error: The type of the raised exception.
+
+        Raises:
+            error: If a response stream is not read to its end or closed.
+
+        """
+        if self._stream is not None:
+            raise error(
+                f"Response stream of '{self._pending[self._stream]}' is not read to "
+                "its end or closed."
+            )
+
+    def _record(self, msg: str, tag: int, status: int, size: int) -> None:
+        """Records the latency of a received response.
+
+        Args:
+            msg: The request message.
+            tag: The tag of a request sent while recording.
+            status: The response status.
+            size: The size of the response payload.
+
+        """
+        start, payload_size = self._sent.pop(tag)
+        latency = time.perf_counter() - start
+        if self._timeouts.adaptive:
+            self._timeouts.observe(msg, latency)
+        if self._stats is not None:
+            self._stats.record(
+                msg,
+                PearyProtocol.STRUCT_PREFIX.size + payload_size,
+                PearyProtocol.STRUCT_PREFIX.size + size,
+                latency,
+                failed=status != PearyProtocol.STATUS_OK,
+            )
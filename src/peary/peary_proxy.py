@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from peary.peary_device import PearyDevice
+from peary.peary_reconnecting_protocol import PearyReconnectingProtocol
 
 if TYPE_CHECKING:
     from peary.peary_protocol import PearyProtocol
+    from peary.peary_reconnecting_protocol import PearyReconnectPolicy
 
 
 class PearyProxy:
@@ -26,6 +28,13 @@ class PearyProxy:
         """
         self._devices: dict[str, PearyDevice] = {}
         self._protocol = protocol
+        if isinstance(protocol, PearyReconnectingProtocol):
+            protocol.add_restore_callback(self._restore_session)
+
+    @property
+    def protocol(self) -> PearyProtocol:
+        """Returns the connected protocol."""
+        return self._protocol
 
     def keep_alive(self) -> bytes:
         """Send a keep-alive message to test the connection."""
@@ -83,3 +92,37 @@ class PearyProxy:
     def list_remote_devices(self) -> bytes:
         """List devices known to the remote server."""
         return self._protocol.request("list_devices")
+
+    def restore(self, *, replay_settings: bool = True) -> dict[int, int]:
+        """Adds all devices to the remote server again, i.e. after reconnecting.
+
+        The devices are added in their original order and keep their handles, which
+        are updated to the indices assigned by the remote server.
+
+        Args:
+            replay_settings: Replay the settings recorded by each device. Defaults to
+                True.
+
+        Returns:
+            dict[int, int]: The new index of each device by its previous index.
+
+        """
+        indices = {}
+        for name, device in self._devices.items():
+            index = int(self._protocol.request("add_device", name))
+            indices[device.index] = index
+            device.restore(index, replay_settings=replay_settings)
+        return indices
+
+    def _restore_session(self, policy: PearyReconnectPolicy) -> None:
+        """Restores the devices after the protocol reconnected.
+
+        Args:
+            policy: The reconnect policy of the protocol.
+
+        """
+        protocol = cast("PearyReconnectingProtocol", self._protocol)
+        for index, new_index in self.restore(
+            replay_settings=policy.replay_settings
+        ).items():
+            protocol.remap_device(index, new_index)
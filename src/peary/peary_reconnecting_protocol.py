@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from peary.peary_protocol import PearySocket
+
+T = TypeVar("T")
+
+
+class PearyReconnectPolicy(NamedTuple):
+    """Backoff of reconnection attempts and the restored session state."""
+
+    attempts: int = 5
+    delay: float = 0.1
+    max_delay: float = 5.0
+    replay_settings: bool = True
+
+    def delays(self) -> Iterator[float]:
+        """Returns the delays before each attempt.
+
+        The first attempt is made immediately and the delay doubles with each further
+        attempt up to the maximum delay.
+
+        Yields:
+            float: The delay in seconds before an attempt.
+
+        """
+        for attempt in range(self.attempts):
+            yield min(self.delay * 2 ** (attempt - 1), self.max_delay) if attempt else 0
+
+
+class PearyReconnectingProtocol(PearyProtocol):
+    """Peary protocol re-establishing a dropped connection and restoring the session.
+
+    When a request fails because the connection dropped, the protocol connects again
+    with backoff, runs the restore callbacks and retries the request once. A client
+    provides the connect function and a proxy restores its devices, i.e.
+
+        client = PearyClient("localhost", protocol_class=PearyReconnectingProtocol)
+        with client as proxy:
+            proxy.protocol.policy = PearyReconnectPolicy(attempts=10)
+            # do something with the proxy
+
+    Timed out requests are abandoned without reconnecting, since their late responses
+    are discarded. Only complete round trips are retried, and the retried device
+    requests are sent to the index reported with `remap_device` while restoring.
+    Pipelined requests sent before the connection dropped are lost and their tags
+    become unknown.
+    """
+
+    class ReconnectError(Exception):
+        """Exception for failing to re-establish the connection."""
+
+    RECONNECT_ERRORS = (
+        OSError,
+        PearyProtocol.RequestSendError,
+        PearyProtocol.ResponseReceiveError,
+    )
+
+    def __init__(
+        self,
+        socket: PearySocket,
+        *,
+        timeout: float = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+        buffer_size: int = 4096,
+        max_in_flight: int = 32,
+    ) -> None:
+        """Initializes a new reconnecting peary protocol.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+            timeout: Socket timeout value in seconds. Defaults to 1.
+            checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+            buffer_size: Initial size of the reusable receive buffer. Defaults to 4096.
+            max_in_flight: Maximum number of pipelined requests awaiting a response
+                before sending blocks on receiving responses. Defaults to 32.
+
+        """
+        self.connect: Callable[[], PearySocket] | None = None
+        self.policy = PearyReconnectPolicy()
+        self._reconnects = 0
+        self._restore_callbacks: list[Callable[[PearyReconnectPolicy], object]] = []
+        self._restoring = False
+        self._remapped: dict[str, str] = {}
+        super().__init__(
+            socket,
+            timeout=timeout,
+            checks=checks,
+            buffer_size=buffer_size,
+            max_in_flight=max_in_flight,
+        )
+
+    @property
+    def reconnects(self) -> int:
+        """Returns the number of times the connection was re-established."""
+        return self._reconnects
+
+    def add_restore_callback(
+        self, callback: Callable[[PearyReconnectPolicy], object]
+    ) -> None:
+        """Adds a function restoring session state after reconnecting.
+
+        Callbacks run in the order they were added and may send requests.
+
+        Args:
+            callback: Function called with the reconnect policy.
+
+        """
+        self._restore_callbacks.append(callback)
+
+    def remap_device(self, index: int, new_index: int) -> None:
+        """Reports a device added again under a new index while restoring.
+
+        Args:
+            index: The index of the device before reconnecting.
+            new_index: The index assigned by the remote server after reconnecting.
+
+        """
+        self._remapped[str(index)] = str(new_index)
+
+    def reconnect(self) -> None:
+        """Re-establishes the connection with backoff and restores the session.
+
+        Raises:
+            ReconnectError: If no connect function is set or all attempts failed.
+
+        """
+        if (connect := self.connect) is None:
+            raise PearyReconnectingProtocol.ReconnectError("No connect function set.")
+        error: Exception | None = None
+        self._remapped.clear()
+        for delay in self.policy.delays():
+            time.sleep(delay)
+            try:
+                self._restore(connect())  # pylint: disable=not-callable
+            except PearyReconnectingProtocol.RECONNECT_ERRORS as e:
+                error = e
+            else:
+                self._reconnects += 1
+                return
+        raise PearyReconnectingProtocol.ReconnectError(
+            f"Failed to reconnect after {self.policy.attempts} attempts."
+        ) from error
+
+    def request(self, msg: str, *args: str) -> bytes:
+        """Initiates a request and retries it once after reconnecting.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        request = super().request
+        return self._retry(lambda: request(msg, *self._remap(msg, args)))
+
+    def request_payload(self, msg: str, payload: bytes) -> bytes:
+        """Initiates a request from an encoded payload and retries it once reconnected.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The request payload returned by `encode_message`.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        request_payload = super().request_payload
+        return self._retry(
+            lambda: request_payload(msg, self._remap_payload(msg, payload))
+        )
+
+    def request_many(
+        self, requests: Iterable[tuple[str, Sequence[str]]]
+    ) -> list[bytes | Exception]:
+        """Initiates many requests and retries all of them once after reconnecting.
+
+        Args:
+            requests: Sequence of request messages and their additional arguments.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
+
+        """
+        request_many = super().request_many
+        requests = list(requests)
+        return self._retry(
+            lambda: request_many(
+                (msg, self._remap(msg, args)) for msg, args in requests
+            )
+        )
+
+    def _retry(self, call: Callable[[], T]) -> T:
+        """Performs a round trip and repeats it once after reconnecting.
+
+        Args:
+            call: The round trip.
+
+        Returns:
+            T: The result of the round trip.
+
+        """
+        try:
+            return call()
+        except PearyReconnectingProtocol.RECONNECT_ERRORS as e:
+            if self.connect is None or self._restoring or isinstance(e, TimeoutError):
+                raise
+        self.reconnect()
+        try:
+            return call()
+        finally:
+            self._remapped.clear()
+
+    def _remap(self, msg: str, args: Sequence[str]) -> Sequence[str]:
+        """Replaces the index of a retried device request after reconnecting.
+
+        Args:
+            msg: The request message.
+            args: The request arguments, starting with the index of device requests.
+
+        Returns:
+            Sequence[str]: The arguments with the index assigned after reconnecting.
+
+        """
+        if self._remapped and msg.startswith("device.") and args:
+            return (self._remapped.get(args[0], args[0]), *args[1:])
+        return args
+
+    def _remap_payload(self, msg: str, payload: bytes) -> bytes:
+        """Replaces the index of a retried encoded device request after reconnecting.
+
+        Args:
+            msg: The request message.
+            payload: The encoded request message and arguments.
+
+        Returns:
+            bytes: The payload with the index assigned after reconnecting.
+
+        """
+        if not self._remapped:
+            return payload
+        _, *args = payload.decode("utf-8").split(" ")
+        return self.encode_message(msg, self._remap(msg, args))
+
+    def _restore(self, socket: PearySocket) -> None:
+        """Replaces the connection and runs the restore callbacks.
+
+        Args:
+            socket: Socket newly connected to the remote peary server.
+
+        """
+        self.reset(socket)
+        self._restoring = True
+        try:
+            self._run_restore_callbacks()
+        finally:
+            self._restoring = False
+
+    def _run_restore_callbacks(self) -> None:
+        """Runs the restore callbacks in the order they were added."""
+        for callback in self._restore_callbacks:
+            callback(self.policy)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class PearyRegisterMap:
+    """Indexed register names of a device, validated without a request.
+
+    The names are kept in the order listed by the device, with an index for lookups
+    and a sorted copy for selecting groups of registers by prefix, i.e.
+
+        registers = device.load_register_map()
+        thresholds = registers.prefix("threshold_")
+        trims = registers.match("pixel_*_trim")
+
+    Names are interned, so the maps of several devices of the same chip share them.
+    """
+
+    class UnknownRegisterError(Exception):
+        """Exception for register names missing from the register map."""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Initializes a new register map.
+
+        Args:
+            names: The register names in the order listed by the device.
+
+        """
+        self._names = tuple(dict.fromkeys(sys.intern(name) for name in names))
+        self._index = {name: index for index, name in enumerate(self._names)}
+        self._sorted = sorted(self._names)
+
+    def index(self, name: str) -> int:
+        """Returns the position of a register in the listed order.
+
+        Args:
+            name: The name of the register.
+
+        Returns:
+            int: The position of the register.
+
+        Raises:
+            UnknownRegisterError: If the register is not in the register map.
+
+        """
+        if (index := self._index.get(name)) is None:
+            raise PearyRegisterMap.UnknownRegisterError(f"Unknown register: {name}")
+        return index
+
+    def validate(self, *names: str) -> None:
+        """Checks that registers are in the register map.
+
+        Args:
+            names: The names of the registers.
+
+        Raises:
+            UnknownRegisterError: If a register is not in the register map.
+
+        """
+        for name in names:
+            self.index(name)
+
+    def prefix(self, prefix: str) -> list[str]:
+        """Returns the registers starting with a prefix in sorted order.
+
+        Args:
+            prefix: The prefix of the register names.
+
+        Returns:
+            list[str]: The matching register names.
+
+        """
+        start = bisect.bisect_left(self._sorted, prefix)
+        stop = start
+        while (  # pylint: disable=while-used
+            stop < len(self._sorted) and self._sorted[stop].startswith(prefix)
+        ):
+            stop += 1
+        return self._sorted[start:stop]
+
+    def match(self, pattern: str) -> list[str]:
+        """Returns the registers matching a case sensitive glob pattern in listed order.
+
+        Args:
+            pattern: The pattern with the wildcards of `fnmatch`.
+
+        Returns:
+            list[str]: The matching register names.
+
+        """
+        return [name for name in self._names if fnmatch.fnmatchcase(name, pattern)]
+
+    def __contains__(self, name: object) -> bool:
+        """Returns whether a register is in the register map.
+
+        Args:
+            name: The name of the register.
+
+        Returns:
+            bool: True if the register is in the register map.
+
+        """
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the register names in listed order.
+
+        Returns:
+            Iterator[str]: The register names.
+
+        """
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        """Returns the number of registers.
+
+        Returns:
+            int: The number of registers.
+
+        """
+        return len(self._names)
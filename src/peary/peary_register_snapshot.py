@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import array
+import json
+import sys
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class PearyRegisterSnapshot(Mapping[str, int]):
+    """Register values of a device captured at one point in time.
+
+    Snapshots map register names to values, keep the values in a packed 64-bit array
+    and are serialized to JSON, so known-good configurations can be stored and applied
+    again with only the differing registers written, i.e.
+
+        snapshot = device.snapshot_registers()
+        path.write_text(snapshot.to_json())
+        # change some registers
+        device.apply_registers(PearyRegisterSnapshot.from_json(path.read_text()))
+
+    """
+
+    def __init__(self, values: Mapping[str, int]) -> None:
+        """Initializes a new snapshot.
+
+        Args:
+            values: The register values by name.
+
+        """
+        self._index = {sys.intern(name): i for i, name in enumerate(values)}
+        self._values = array.array("q", values.values())
+
+    @staticmethod
+    def from_json(text: str) -> PearyRegisterSnapshot:
+        """Returns a snapshot from its JSON serialization.
+
+        Args:
+            text: The JSON object mapping register names to values.
+
+        Returns:
+            PearyRegisterSnapshot: The deserialized snapshot.
+
+        Raises:
+            ValueError: If the JSON text is not an object of integer values.
+
+        """
+        values = json.loads(text)
+        if not isinstance(values, dict) or not all(
+            isinstance(value, int) and not isinstance(value, bool)
+            for value in values.values()
+        ):
+            raise ValueError(f"Invalid register snapshot: {text[:80]!r}")
+        return PearyRegisterSnapshot(values)
+
+    def diff(self, current: Mapping[str, int]) -> dict[str, int]:
+        """Returns the values of the registers differing from the current values.
+
+        Args:
+            current: The current register values by name.
+
+        Returns:
+            dict[str, int]: The values of the snapshot that differ from or are
+                missing in the current values, in the order of the snapshot.
+
+        """
+        return {
+            name: value
+            for name, value in zip(self._index, self._values)
+            if current.get(name) != value
+        }
+
+    def to_json(self) -> str:
+        """Returns the JSON serialization of the snapshot.
+
+        Returns:
+            str: The JSON object mapping register names to values.
+
+        """
+        return json.dumps(dict(zip(self._index, self._values)), separators=(",", ":"))
+
+    def __getitem__(self, name: str) -> int:
+        """Returns the value of a register.
+
+        Args:
+            name: The name of the register.
+
+        Returns:
+            int: The value of the register.
+
+        """
+        return self._values[self._index[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the register names in captured order.
+
+        Returns:
+            Iterator[str]: The register names.
+
+        """
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Returns the number of registers.
+
+        Returns:
+            int: The number of registers.
+
+        """
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the snapshot.
+
+        Returns:
+            str: The string representation of the snapshot.
+
+        """
+        return f"PearyRegisterSnapshot({dict(zip(self._index, self._values))!r})"
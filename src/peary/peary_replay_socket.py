@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from peary.peary_capture import PearyCaptureWriter
+from peary.peary_frame_decoder import PearyFrameDecoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Buffer
+
+    from peary.peary_capture import PearyCaptureReader, PearyCaptureRecord
+    from peary.peary_frame_decoder import DecodedBytes
+
+
+class PearyReplaySocket:
+    """Socket stand-in answering requests with the responses recorded in a capture.
+
+    Each request sent through the socket is matched to the next request of the capture
+    and its recorded response is returned with the tag of the sent request, so scripts
+    run offline at full speed without a peary server, i.e.
+
+        with PearyCaptureReader("bring_up.pcap") as capture:
+            proxy = PearyProxy(
+                PearyProtocol(
+                    PearyReplaySocket(capture), checks=PearyProtocol.Checks.CHECK_NONE
+                )
+            )
+            # do something with the proxy
+
+    The version check is disabled unless the capture was started before the protocol
+    was initialized.
+    """
+
+    class ReplayMismatchError(Exception):
+        """Exception for requests differing from the requests of the capture."""
+
+    def __init__(self, capture: PearyCaptureReader, *, strict: bool = True) -> None:
+        """Initializes a new replay socket.
+
+        Args:
+            capture: The capture holding the recorded requests and responses.
+            strict: Raise if a sent request payload differs from the recorded request.
+                Defaults to True.
+
+        """
+        self._records = iter(capture)
+        self._strict = strict
+        self._decoder = PearyFrameDecoder()
+        self._requests: deque[PearyCaptureRecord] = deque()
+        self._held: dict[int, PearyCaptureRecord] = {}
+        self._tags: dict[int, int] = {}
+        self._pending = bytearray()
+
+    def settimeout(self, value: float | None) -> None:
+        """Ignores the timeout since replayed responses are available immediately."""
+
+    def sendmsg(self, buffers: Iterable[Buffer], *_: object) -> int:
+        """Matches the sent requests to the recorded requests.
+
+        Args:
+            buffers: The sent request frames.
+            _: Catches the unused arguments of `socket.sendmsg`.
+
+        Returns:
+            int: The number of sent bytes.
+
+        """
+        data = b"".join(buffers)
+        self._decoder.feed(data)
+        for frame in self._decoder:
+            self._match_request(frame)
+        return len(data)
+
+    def recv_into(self, buffer: WriteableBuffer, *_: object) -> int:
+        """Receives the recorded responses of the sent requests.
+
+        Args:
+            buffer: The buffer receiving the response frames.
+            _: Catches the unused arguments of `socket.recv_into`.
+
+        Returns:
+            int: The number of received bytes, or 0 once the capture is exhausted.
+
+        """
+        if not self._pending:
+            self._replay_responses()
+        with memoryview(buffer) as view:
+            size = min(len(view), len(self._pending))
+            view[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+    def shutdown(self, how: int) -> None:
+        """Ignores the shutdown since there is no connection."""
+
+    def close(self) -> None:
+        """Ignores the close since there is no connection."""
+
+    def _match_request(self, frame: DecodedBytes) -> None:
+        """Matches a sent request to the next recorded request.
+
+        Args:
+            frame: The decoded request frame.
+
+        Raises:
+            ReplayMismatchError: If the capture has no further request or the recorded
+                request differs in strict mode.
+
+        """
+        while not self._requests and self._read_record():  # pylint: disable=W0149
+            pass
+        if not self._requests:
+            raise PearyReplaySocket.ReplayMismatchError(
+                f"Capture has no request for {frame.payload!r}"
+            )
+        record = self._requests.popleft()
+        if self._strict and record.payload != frame.payload:
+            raise PearyReplaySocket.ReplayMismatchError(
+                f"Sent request {frame.payload!r} != recorded {record.payload!r}"
+            )
+        self._tags[record.tag] = frame.tag
+        if (response := self._held.pop(record.tag, None)) is not None:
+            self._respond(response)
+
+    def _replay_responses(self) -> None:
+        """Reads the capture until a response to a sent request is available."""
+        while not self._pending and self._read_record():  # pylint: disable=W0149
+            pass
+
+    def _read_record(self) -> bool:
+        """Reads the next record of the capture.
+
+        Recorded requests are queued until they are sent, and recorded responses are
+        either returned or held until their request is sent.
+
+        Returns:
+            bool: False if the capture is exhausted.
+
+        """
+        if (record := next(self._records, None)) is None:
+            return False
+        if record.direction == PearyCaptureWriter.Direction.SENT:
+            self._requests.append(record)
+        elif record.tag in self._tags:
+            self._respond(record)
+        else:
+            self._held[record.tag] = record
+        return True
+
+    def _respond(self, record: PearyCaptureRecord) -> None:
+        """Queues a recorded response with the tag of its sent request.
+
+        Args:
+            record: The recorded response.
+
+        """
+        self._pending += PearyProtocol.encode(
+            record.payload, self._tags.pop(record.tag), record.status
+        )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from peary.peary_capture import PearyCaptureWriter
+    from peary.peary_protocol import PearyRequestTracker
+    from peary.peary_stats import PearyStats
+    from peary.peary_timeouts import PearyTimeouts
+
+
+class PearyRequestTracking:
+    """Properties of the requests tracked by a protocol.
+
+    Recording statistics and captures is disabled by default and costs a single check
+    per request while disabled.
+    """
+
+    _tracker: PearyRequestTracker
+
+    @property
+    def max_in_flight(self) -> int:
+        """Returns the maximum number of requests awaiting a response."""
+        return self._tracker.max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of sent requests whose response is not yet received."""
+        return self._tracker.in_flight
+
+    @property
+    def abandoned(self) -> int:
+        """Returns the number of timed out requests whose late response is discarded."""
+        return self._tracker.abandoned
+
+    @property
+    def timeouts(self) -> PearyTimeouts:
+        """Returns the response timeouts of the requests by their message."""
+        return self._tracker.timeouts
+
+    @property
+    def stats(self) -> PearyStats | None:
+        """Returns the statistics recording completed requests, if any."""
+        return self._tracker.stats
+
+    @stats.setter
+    def stats(self, stats: PearyStats | None) -> None:
+        """Sets the statistics recording completed requests, or None to disable."""
+        self._tracker.stats = stats
+
+    @property
+    def capture(self) -> PearyCaptureWriter | None:
+        """Returns the capture recording every sent and received frame, if any."""
+        return self._tracker.capture
+
+    @capture.setter
+    def capture(self, capture: PearyCaptureWriter | None) -> None:
+        """Sets the capture recording every sent and received frame, or None."""
+        self._tracker.capture = capture
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class PearyShadowStats(NamedTuple):
+    """Hits and misses of the register reads looked up in a shadow."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of the lookups served from the shadow."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class PearyRegisterShadow:
+    """Write-through cache of the register values of a device.
+
+    Register values written or read by the device are recorded, so later reads of the
+    same registers are served without a request. The shadow is only used while
+    attached to a device, i.e.
+
+        device.shadow = PearyRegisterShadow(volatile=["status"])
+        device.set_register("threshold", 42)
+        assert device.get_register("threshold") == 42  # served from the shadow
+        print(device.shadow.stats.hit_rate)
+
+    Volatile registers, e.g. status or counter registers changed by the hardware, are
+    never cached. All values are invalidated when the device is reset, configured or
+    powered off, including through batches. Writes through compiled commands or other
+    clients are not seen by the shadow and require invalidating the affected registers.
+    """
+
+    def __init__(self, volatile: Iterable[str] = ()) -> None:
+        """Initializes a new empty shadow.
+
+        Args:
+            volatile: Names of the registers never cached. Defaults to none.
+
+        """
+        self._values: dict[str, int] = {}
+        self._volatile = set(volatile)
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def volatile(self) -> frozenset[str]:
+        """Returns the names of the registers never cached."""
+        return frozenset(self._volatile)
+
+    @property
+    def stats(self) -> PearyShadowStats:
+        """Returns the hits and misses of the lookups and the number of entries."""
+        return PearyShadowStats(self._hits, self._misses, len(self._values))
+
+    def lookup(self, name: str) -> int | None:
+        """Returns the cached value of a register and counts the hit or miss.
+
+        Args:
+            name: The name of the register.
+
+        Returns:
+            int | None: The cached value, or None if the register has to be read.
+
+        """
+        if (value := self._values.get(name)) is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    def record(self, name: str, value: int) -> None:
+        """Records the value of a register unless it is volatile.
+
+        Args:
+            name: The name of the register.
+            value: The value written to or read from the register.
+
+        """
+        if name not in self._volatile:
+            self._values[name] = value
+
+    def mark_volatile(self, *names: str) -> None:
+        """Marks registers as volatile and discards their cached values.
+
+        Args:
+            names: The names of the registers.
+
+        """
+        self._volatile.update(names)
+        self.invalidate(*names)
+
+    def invalidate(self, *names: str) -> None:
+        """Discards cached values, so the registers are read again.
+
+        Args:
+            names: The names of the registers, or none to discard all values.
+
+        """
+        if not names:
+            self._values.clear()
+        for name in names:
+            self._values.pop(name, None)
+
+    def reset_stats(self) -> None:
+        """Discards the counted hits and misses."""
+        self._hits = 0
+        self._misses = 0
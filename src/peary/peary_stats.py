@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import NamedTuple
+
+
+class PearyLatencyHistogram:
+    """Histogram of latencies with logarithmic buckets and a fixed memory footprint.
+
+    Each octave above `MIN_LATENCY` is split into `BUCKETS_PER_OCTAVE` buckets, so a
+    percentile is accurate to within about 9% of its value. Latencies outside of the
+    covered range are counted in the first or last bucket.
+    """
+
+    BUCKETS_PER_OCTAVE = 8
+    MIN_LATENCY = 1e-6
+    OCTAVES = 28
+
+    def __init__(self) -> None:
+        """Initializes a new empty histogram."""
+        self._buckets = [0] * (self.OCTAVES * self.BUCKETS_PER_OCTAVE + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        """Returns the number of recorded latencies."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the recorded latencies in seconds."""
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Returns the largest recorded latency in seconds."""
+        return self._max
+
+    def add(self, latency: float) -> None:
+        """Records a latency.
+
+        Args:
+            latency: The latency in seconds.
+
+        """
+        index = 0
+        if latency > self.MIN_LATENCY:
+            index = int(math.log2(latency / self.MIN_LATENCY) * self.BUCKETS_PER_OCTAVE)
+            index = min(index, len(self._buckets) - 1)
+        self._buckets[index] += 1
+        self._count += 1
+        self._total += latency
+        self._max = max(self._max, latency)
+
+    def percentile(self, percent: float) -> float:
+        """Returns an upper bound of a percentile of the recorded latencies.
+
+        Args:
+            percent: The percentile between 0 and 100.
+
+        Returns:
+            float: The upper edge of the bucket holding the percentile in seconds,
+                limited to the largest recorded latency, or 0 if nothing was recorded.
+
+        """
+        rank = math.ceil(self._count * percent / 100)
+        cumulative = 0
+        for index, count in enumerate(self._buckets):
+            cumulative += count
+            if count and cumulative >= rank:
+                edge = self.MIN_LATENCY * 2 ** ((index + 1) / self.BUCKETS_PER_OCTAVE)
+                return min(edge, self._max)
+        return 0.0
+
+    def reset(self) -> None:
+        """Discards all recorded latencies."""
+        self._buckets = [0] * len(self._buckets)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+
+class PearyCommandSummary(NamedTuple):
+    """Summary of the requests of a single command."""
+
+    requests: int
+    errors: int
+    bytes_sent: int
+    bytes_received: int
+    rate: float
+    mean: float
+    p50: float
+    p99: float
+    max: float
+
+
+class PearyCommandStats:
+    """Counters and latency histogram of the requests of a single command."""
+
+    def __init__(self) -> None:
+        """Initializes new empty command statistics."""
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = PearyLatencyHistogram()
+
+    def record(
+        self, bytes_sent: int, bytes_received: int, latency: float, *, failed: bool
+    ) -> None:
+        """Records a completed request.
+
+        Args:
+            bytes_sent: Size of the request frame in bytes.
+            bytes_received: Size of the response frame in bytes.
+            latency: Time from sending the request to receiving its response.
+            failed: True if the response returned a failing status.
+
+        """
+        self.errors += failed
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        self.latency.add(latency)
+
+    def summary(self, elapsed: float) -> PearyCommandSummary:
+        """Returns a summary of the recorded requests.
+
+        Args:
+            elapsed: Time in seconds over which the requests were recorded.
+
+        Returns:
+            PearyCommandSummary: The counters, request rate and latency percentiles.
+
+        """
+        return PearyCommandSummary(
+            requests=self.latency.count,
+            errors=self.errors,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            rate=self.latency.count / elapsed if elapsed > 0 else 0.0,
+            mean=self.latency.mean,
+            p50=self.latency.percentile(50),
+            p99=self.latency.percentile(99),
+            max=self.latency.max,
+        )
+
+
+class PearyStats:
+    """Per-command request statistics collected by a protocol.
+
+    Statistics are only collected while attached to a protocol, i.e.
+
+        stats = PearyStats()
+        device.protocol.stats = stats
+        # do something with the device
+        for command, summary in stats.snapshot().items():
+            print(command, summary.requests, summary.p50, summary.p99)
+
+    The latency of a request is the time from sending it to receiving its response, so
+    it includes the network round trip and the time the server spends on the request.
+    """
+
+    def __init__(self) -> None:
+        """Initializes new empty statistics."""
+        self._commands: dict[str, PearyCommandStats] = {}
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the time in seconds since the statistics were created or reset."""
+        return time.perf_counter() - self._start
+
+    def record(
+        self,
+        msg: str,
+        bytes_sent: int,
+        bytes_received: int,
+        latency: float,
+        *,
+        failed: bool = False,
+    ) -> None:
+        """Records a completed request.
+
+        Args:
+            msg: The request message naming the command.
+            bytes_sent: Size of the request frame in bytes.
+            bytes_received: Size of the response frame in bytes.
+            latency: Time from sending the request to receiving its response.
+            failed: True if the response returned a failing status. Defaults to False.
+
+        """
+        if (command := self._commands.get(msg)) is None:
+            command = self._commands[msg] = PearyCommandStats()
+        command.record(bytes_sent, bytes_received, latency, failed=failed)
+
+    def snapshot(self) -> dict[str, PearyCommandSummary]:
+        """Returns the summaries of all recorded commands.
+
+        Returns:
+            dict[str, PearyCommandSummary]: Summary of each command by its message.
+
+        """
+        elapsed = self.elapsed
+        return {msg: stats.summary(elapsed) for msg, stats in self._commands.items()}
+
+    def reset(self) -> None:
+        """Discards all recorded requests and restarts the elapsed time."""
+        self._commands.clear()
+        self._start = time.perf_counter()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Self
+
+
+class PearyResponseStream:
+    """Response payload read in chunks as it arrives, without holding all of it.
+
+    The stream is iterated in chunks of `chunk_size` bytes, read like a binary file or
+    read into buffers provided by the caller, i.e.
+
+        with protocol.request_stream("device.read_memory", "0", "dump") as stream:
+            for chunk in stream:
+                file.write(chunk)
+
+    The connection only receives further responses once the payload is read to its
+    end. Closing the stream early discards the rest of the payload, so the connection
+    stays usable.
+    """
+
+    CHUNK_SIZE = 65536
+
+    def __init__(
+        self,
+        size: int,
+        receive_into: Callable[[memoryview], int],
+        complete: Callable[[], object] | None = None,
+    ) -> None:
+        """Initializes a new response stream.
+
+        Args:
+            size: Size of the response payload in bytes.
+            receive_into: Function receiving part of the payload into a buffer and
+                returning the number of received bytes.
+            complete: Function called once the payload has been read to its end.
+                Defaults to None.
+
+        """
+        self._size = size
+        self._remaining = size
+        self._receive_into = receive_into
+        self._complete = complete
+        self.chunk_size = self.CHUNK_SIZE
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the response payload in bytes."""
+        return self._size
+
+    @property
+    def remaining(self) -> int:
+        """Returns the number of payload bytes not yet read."""
+        return self._remaining
+
+    @staticmethod
+    def from_payload(payload: bytes) -> PearyResponseStream:
+        """Returns a stream of an already received response payload.
+
+        Args:
+            payload: The response payload.
+
+        Returns:
+            PearyResponseStream: The stream reading the payload.
+
+        """
+        return PearyResponseStream(len(payload), io.BytesIO(payload).readinto)
+
+    def close(self) -> None:
+        """Discards the rest of the payload, so the next response can be received."""
+        scratch = bytearray(min(self._remaining, self.chunk_size))
+        while self.readinto(scratch):  # pylint: disable=while-used
+            pass
+        self._finish()
+
+    def read(self, size: int = -1) -> bytearray:
+        """Reads part of the payload.
+
+        Args:
+            size: Number of bytes to read, or -1 to read the rest of the payload.
+                Defaults to -1.
+
+        Returns:
+            bytearray: The read bytes, fewer than the size only at the end of the
+                payload.
+
+        """
+        chunk = bytearray(self._remaining if size < 0 else min(size, self._remaining))
+        with memoryview(chunk) as view:
+            read = 0
+            while read < len(chunk):  # pylint: disable=while-used
+                read += self.readinto(view[read:])
+        return chunk
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        """Reads part of the payload into a buffer with a single receive.
+
+        Args:
+            buffer: The buffer receiving the payload.
+
+        Returns:
+            int: The number of read bytes, or 0 at the end of the payload.
+
+        """
+        with memoryview(buffer) as view:
+            if not (size := min(len(view), self._remaining)):
+                return 0
+            with view.cast("B")[:size] as part:
+                received = self._receive_into(part)
+        self._remaining -= received
+        if not self._remaining:
+            self._finish()
+        return received
+
+    def _finish(self) -> None:
+        """Reports the end of the payload once."""
+        complete, self._complete = self._complete, None
+        if complete is not None:
+            complete()
+
+    def __enter__(self) -> Self:
+        """Enters a with block reading the stream.
+
+        Returns:
+            Self: The stream.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Closes the stream, discarding the rest of the payload.
+
+        Args:
+            _: Catches the unused arguments required for the __exit__ function.
+
+        """
+        self.close()
+
+    def __iter__(self) -> PearyResponseStream:
+        """Returns the stream iterating over its chunks.
+
+        Returns:
+            PearyResponseStream: The stream.
+
+        """
+        return self
+
+    def __next__(self) -> bytearray:
+        """Reads the next chunk of the payload.
+
+        Returns:
+            bytearray: The chunk of at most `chunk_size` bytes.
+
+        Raises:
+            StopIteration: If the payload has been read to its end.
+
+        """
+        if not self._remaining:
+            raise StopIteration
+        return self.read(self.chunk_size)
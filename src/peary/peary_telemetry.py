@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import array
+import math
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from peary.peary_device import PearyDevice
+
+
+class PearyTelemetryStats(NamedTuple):
+    """Statistics of the samples of a single channel within a window."""
+
+    samples: int
+    failed: int
+    mean: float
+    deviation: float
+    minimum: float
+    maximum: float
+    last: float
+
+
+class PearyTelemetrySnapshot(NamedTuple):
+    """Copy of the sampled timestamps and values in chronological order."""
+
+    timestamps: array.array[float]
+    values: dict[tuple[str, str], array.array[float]]
+
+
+class PearyTelemetrySampler:  # pylint: disable=too-many-instance-attributes
+    """Samples the voltages and currents of device ports into fixed-size ring buffers.
+
+    Each cycle reads all channels with pipelined requests and stores one timestamp
+    and one value per channel. Once `capacity` cycles are stored, each cycle
+    overwrites the oldest one, so memory use stays constant however long the sampler
+    runs, i.e.
+
+        sampler = PearyTelemetrySampler(
+            device, [("voltage", "PWR_OUT_1"), ("current", "PWR_OUT_1")], rate=100
+        )
+        thread = threading.Thread(target=sampler.run)
+        thread.start()
+        # do something else
+        print(sampler.stats(window=60)[("current", "PWR_OUT_1")].maximum)
+        sampler.stop()
+        thread.join()
+
+    Timestamps are seconds since the epoch. Reads failing on the remote server or
+    returning no number are stored as NaN, counted in `errors` and excluded from the
+    statistics. A cycle timing out or failing to receive is stored as NaN for all
+    channels, and sampling continues with the next cycle.
+    """
+
+    KINDS = ("voltage", "current")
+
+    def __init__(
+        self,
+        device: PearyDevice,
+        channels: Iterable[tuple[str, str]],
+        *,
+        rate: float = 10.0,
+        capacity: int = 4096,
+    ) -> None:
+        """Initializes a new sampler with preallocated ring buffers.
+
+        Args:
+            device: Device whose ports are sampled.
+            channels: Kind, either "voltage" or "current", and name of each sampled
+                port.
+            rate: Target number of cycles per second. Defaults to 10.
+            capacity: Number of cycles kept in the ring buffers. Defaults to 4096.
+
+        Raises:
+            ValueError: If a channel kind is unknown, or the rate or capacity is not
+                positive.
+
+        """
+        self._channels = list(dict.fromkeys(channels))
+        if unknown := [kind for kind, _ in self._channels if kind not in self.KINDS]:
+            raise ValueError(f"Unknown channel kinds: {unknown}")
+        if capacity < 1:
+            raise ValueError(f"Invalid capacity: {capacity}")
+        self._device = device
+        self._capacity = capacity
+        self._timestamps = array.array("d", bytes(8 * capacity))
+        self._values = {
+            channel: array.array("d", bytes(8 * capacity)) for channel in self._channels
+        }
+        self._head = 0
+        self._cycles = 0
+        self._errors = 0
+        self._overruns = 0
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._rate = 0.0
+        self.rate = rate
+
+    @property
+    def rate(self) -> float:
+        """Returns the target number of cycles per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        """Sets the target number of cycles per second."""
+        if rate <= 0:
+            raise ValueError(f"Invalid rate: {rate}")
+        self._rate = rate
+
+    @property
+    def channels(self) -> list[tuple[str, str]]:
+        """Returns the kind and name of each sampled port."""
+        return list(self._channels)
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of cycles kept in the ring buffers."""
+        return self._capacity
+
+    @property
+    def cycles(self) -> int:
+        """Returns the number of sampled cycles, including overwritten ones."""
+        return self._cycles
+
+    @property
+    def errors(self) -> int:
+        """Returns the number of reads that failed or returned no number."""
+        return self._errors
+
+    @property
+    def overruns(self) -> int:
+        """Returns the number of cycles skipped because sampling fell behind."""
+        return self._overruns
+
+    @staticmethod
+    def _ordered(
+        buffer: array.array[float], head: int, *, full: bool
+    ) -> array.array[float]:
+        """Returns the stored part of a ring buffer in chronological order.
+
+        Args:
+            buffer: The ring buffer.
+            head: The position of the next cycle.
+            full: True if all cycles of the buffer are stored.
+
+        Returns:
+            array.array[float]: A copy of the stored cycles, oldest first.
+
+        """
+        if not full:
+            return buffer[:head]
+        return buffer[head:] + buffer[:head]
+
+    @staticmethod
+    def _parse(response: bytes | Exception) -> float:
+        """Returns the value of a response.
+
+        Args:
+            response: The response payload, or the error of the failed read.
+
+        Returns:
+            float: The value, or NaN if the read failed or returned no number.
+
+        """
+        if isinstance(response, Exception):
+            return math.nan
+        try:
+            return float(response)
+        except ValueError:
+            return math.nan
+
+    @staticmethod
+    def _summarize(values: Iterable[float]) -> PearyTelemetryStats | None:
+        """Returns the statistics of the valid values.
+
+        Args:
+            values: The values of a channel, with NaN for failed reads.
+
+        Returns:
+            PearyTelemetryStats | None: The statistics of the valid values and the
+                number of failed reads, or None without valid values.
+
+        """
+        values = list(values)
+        if not (valid := [value for value in values if not math.isnan(value)]):
+            return None
+        return PearyTelemetryStats(
+            samples=len(valid),
+            failed=len(values) - len(valid),
+            mean=statistics.fmean(valid),
+            deviation=statistics.pstdev(valid),
+            minimum=min(valid),
+            maximum=max(valid),
+            last=valid[-1],
+        )
+
+    def sample(self) -> None:
+        """Reads all channels with pipelined requests and stores them as one cycle."""
+        responses: list[bytes | Exception]
+        try:
+            responses = self._device.protocol.request_many(
+                (f"device.get_{kind}", (str(self._device.index), name))
+                for kind, name in self._channels
+            )
+        except (*PearyProtocol.TIMEOUT_ERRORS, PearyProtocol.ResponseReceiveError) as e:
+            responses = [e] * len(self._channels)
+        timestamp = time.time()
+        values = [self._parse(response) for response in responses]
+        with self._lock:
+            self._timestamps[self._head] = timestamp
+            for channel, value in zip(self._channels, values):
+                self._values[channel][self._head] = value
+            self._errors += sum(math.isnan(value) for value in values)
+            self._head = (self._head + 1) % self._capacity
+            self._cycles += 1
+
+    def run(self, cycles: int | None = None) -> None:
+        """Samples at the target rate until stopped.
+
+        Cycles are scheduled at fixed intervals, so the rate does not drift with the
+        time taken by each cycle. Cycles missed while falling behind are skipped and
+        counted as overruns.
+
+        Args:
+            cycles: Number of cycles to sample, or None to sample until `stop` is
+                called. Defaults to None.
+
+        """
+        start = time.monotonic()
+        slot = 0
+        remaining = math.inf if cycles is None else cycles
+        while remaining > 0:  # pylint: disable=while-used
+            self.sample()
+            remaining -= 1
+            elapsed = (time.monotonic() - start) * self.rate
+            following = max(slot + 1, math.floor(elapsed) + 1)
+            self._overruns += following - slot - 1
+            slot = following
+            if remaining and self._stopped.wait((slot - elapsed) / self.rate):
+                break
+        self._stopped.clear()
+
+    def stop(self) -> None:
+        """Stops sampling once the current cycle completes, or after the next cycle."""
+        self._stopped.set()
+
+    def snapshot(self) -> PearyTelemetrySnapshot:
+        """Returns a copy of the stored cycles in chronological order.
+
+        The copy is consistent while another thread is sampling.
+
+        Returns:
+            PearyTelemetrySnapshot: The timestamps and the values of each channel.
+
+        """
+        with self._lock:
+            head = self._head
+            full = self._cycles >= self._capacity
+            return PearyTelemetrySnapshot(
+                self._ordered(self._timestamps, head, full=full),
+                {
+                    channel: self._ordered(values, head, full=full)
+                    for channel, values in self._values.items()
+                },
+            )
+
+    def stats(
+        self, window: float | None = None
+    ) -> dict[tuple[str, str], PearyTelemetryStats | None]:
+        """Returns the statistics of each channel within a window.
+
+        Args:
+            window: Time in seconds before the last cycle covered by the statistics,
+                or None for all stored cycles. Defaults to None.
+
+        Returns:
+            dict[tuple[str, str], PearyTelemetryStats | None]: The statistics of each
+                channel, or None if the channel has no valid samples in the window.
+
+        """
+        snapshot = self.snapshot()
+        first = 0
+        if window is not None and snapshot.timestamps:
+            oldest = snapshot.timestamps[-1] - window
+            first = next(
+                i
+                for i, timestamp in enumerate(snapshot.timestamps)
+                if timestamp >= oldest
+            )
+        return {
+            channel: self._summarize(values[first:])
+            for channel, values in snapshot.values.items()
+        }
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stream import PearyResponseStream
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from peary.peary_protocol import PearySocket
+
+
+class PearyThreadedProtocol(PearyProtocol):
+    """Peary protocol shared by many threads over a single connection.
+
+    A background reader thread owns the receiving side of the socket and hands each
+    response to the thread waiting on its tag, so threads never wait on each other's
+    round trips. Writes are serialized by a lock held only while frames are sent, i.e.
+
+        with PearyClient("localhost", protocol_class=PearyThreadedProtocol) as proxy:
+            # share the proxy and its devices between threads
+
+    The reader polls for shutdown at the default response timeout and stops when the
+    connection closes or `close` is called. Response timeouts and deadlines apply to
+    the waiting threads, and late responses are discarded by the reader. Since the
+    reader receives every response, streamed responses are received in full first.
+    """
+
+    def __init__(
+        self,
+        socket: PearySocket,
+        *,
+        timeout: float = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+        buffer_size: int = 4096,
+        max_in_flight: int = 32,
+    ) -> None:
+        """Initializes a new thread-safe peary protocol and starts its reader.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+            timeout: Socket timeout and default response timeout in seconds. Defaults
+                to 1.
+            checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+            buffer_size: Initial size of the reusable receive buffer. Defaults to 4096.
+            max_in_flight: Maximum number of pipelined requests awaiting a response
+                before sending blocks on receiving responses. Defaults to 32.
+
+        Raises:
+            VersionError: If protocol version doesn match with remote host.
+
+        """
+        super().__init__(
+            socket,
+            timeout=timeout,
+            checks=PearyProtocol.Checks.CHECK_NONE,
+            buffer_size=buffer_size,
+            max_in_flight=max_in_flight,
+        )
+        self._condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._error: Exception | None = None
+        self._closed = threading.Event()
+        self._reader = threading.Thread(target=self._read, name="peary-reader")
+        self._reader.daemon = True
+        self._reader.start()
+        if PearyProtocol.Checks.CHECK_VERSION in checks:
+            self._verify_compatible_version()
+
+    def close(self) -> None:
+        """Stops the reader thread within the socket timeout."""
+        self._closed.set()
+        self._reader.join()
+        super().close()
+
+    def recv_response(self, tag: int) -> bytes:
+        """Waits for the response of a previously sent request.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            bytes: The received response.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+            ResponseSequenceError: If the tag does not belong to a pending request.
+
+        """
+        with self._condition:
+            self._wait_response(tag)
+            return self._tracker.pop_response(tag)
+
+    def stream_response(self, tag: int) -> PearyResponseStream:
+        """Waits for the response of a previously sent request and streams it.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Returns:
+            PearyResponseStream: The stream of the received response payload.
+
+        """
+        return PearyResponseStream.from_payload(self.recv_response(tag))
+
+    def _collect_responses(self, tags: list[int]) -> list[bytes | Exception]:
+        """Waits for the responses of pending requests and collects them in order.
+
+        Args:
+            tags: The request tags returned by `send_request`.
+
+        Returns:
+            list[bytes | Exception]: The received responses in request order, or the
+                `ResponseStatusError` of each failed request.
+
+        """
+        with self._condition:
+            return super()._collect_responses(tags)
+
+    def _wait_response(self, tag: int) -> None:
+        """Waits until the reader has received the response of a pending request.
+
+        Args:
+            tag: The request tag returned by `send_request`.
+
+        Raises:
+            TimeoutError: If the response does not arrive within its timeout, in which
+                case the request is abandoned.
+
+        """
+        with self._condition:
+            if self._tracker.has_response(tag):
+                return
+            timeout = self._response_timeout(tag)
+            try:
+                self._wait_for(lambda: self._tracker.has_response(tag), timeout)
+            except TimeoutError as e:
+                raise self._timed_out(tag, timeout) from e
+
+    def _wait_for(self, predicate: Callable[[], bool], timeout: float) -> None:
+        """Waits until a condition on the tracked requests holds.
+
+        Args:
+            predicate: The condition, evaluated while holding the tracker lock.
+            timeout: Time in seconds to wait for the condition.
+
+        Raises:
+            ResponseReceiveError: If the reader stopped on an error.
+            TimeoutError: If the condition does not hold within the timeout.
+
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._error is not None or predicate(), max(timeout, 0)
+            ):
+                raise TimeoutError("Timed out waiting for response.")
+            if self._error is not None:
+                raise PearyProtocol.ResponseReceiveError(
+                    f"Response reader stopped: {self._error}"
+                ) from self._error
+
+    def _send_requests(self, requests: Iterable[tuple[str, bytes]]) -> list[int]:
+        """Encodes and sends requests while respecting the in-flight window.
+
+        Frames encoded while the window has room are sent together. A thread only
+        waits for room once its own encoded frames have been sent, so it never waits
+        on responses to requests it has not sent yet.
+
+        Args:
+            requests: Sequence of request messages and their encoded payloads.
+
+        Returns:
+            list[int]: The request tags used to collect the responses.
+
+        """
+        tags: list[int] = []
+        buffers: list[bytes] = []
+        for msg, payload in requests:
+            if (request := self._try_encode_request(msg, payload)) is None:
+                self._send_locked(buffers)
+                buffers.clear()
+                request = self._encode_request(msg, payload)
+            tag, frame = request
+            self._queue_frame(buffers, frame)
+            tags.append(tag)
+        self._send_locked(buffers)
+        return tags
+
+    def _try_encode_request(
+        self, msg: str, payload: bytes
+    ) -> tuple[int, tuple[bytes, bytes]] | None:
+        """Assigns the next tag to a request if the in-flight window has room.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The encoded request message and arguments.
+
+        Returns:
+            tuple[int, tuple[bytes, bytes]] | None: The request tag and its encoded
+                frame, or None if the window is full.
+
+        """
+        with self._condition:
+            if self._tracker.is_full():
+                return None
+            return self._tracker.encode_request(msg, payload)
+
+    def _encode_request(
+        self, msg: str, payload: bytes
+    ) -> tuple[int, tuple[bytes, bytes]]:
+        """Waits for room in the in-flight window and assigns the next tag to a request.
+
+        Args:
+            msg: The request message, used for error reporting.
+            payload: The encoded request message and arguments.
+
+        Returns:
+            tuple[int, tuple[bytes, bytes]]: The request tag and its encoded frame.
+
+        """
+        with self._condition:
+            self._wait_for(lambda: not self._tracker.is_full(), self._timeout)
+            return self._tracker.encode_request(msg, payload)
+
+    def _send_locked(self, buffers: Sequence[bytes]) -> None:
+        """Sends buffers without interleaving them with frames of other threads.
+
+        Args:
+            buffers: Bytes to be sent in order.
+
+        """
+        with self._send_lock:
+            self._send(buffers)
+
+    def _read(self) -> None:
+        """Runs the reader and hands its error to the waiting threads once stopped."""
+        try:
+            self._read_responses()
+        except Exception as e:  # pylint: disable=broad-exception-caught  # noqa: BLE001
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def _read_responses(self) -> None:
+        """Receives responses and hands them to the waiting threads until closed.
+
+        Raises:
+            ResponseSequenceError: If a response is received twice.
+
+        """
+        while not self._closed.is_set():  # pylint: disable=while-used
+            try:
+                frame = self._recv()
+            except PearyProtocol.TIMEOUT_ERRORS:
+                continue
+            with self._condition:
+                if self._tracker.holds(frame.tag):
+                    raise PearyProtocol.ResponseSequenceError(
+                        f"Duplicate response tag: {frame.tag}"
+                    )
+                self._tracker.add_response(frame, frame.tag)
+                self._condition.notify_all()
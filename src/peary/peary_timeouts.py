@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+
+class PearyTimeouts:
+    """Response timeouts of requests by their message.
+
+    A request waits for the timeout set for its message. Without one, it waits for the
+    adaptive timeout of its message once enabled and observed, and otherwise for the
+    default timeout, i.e.
+
+        protocol.timeouts.set("device.configure", 30)
+        protocol.timeouts.adaptive = True
+
+    The adaptive timeout follows the smoothed latency and its variation like the TCP
+    retransmission timeout of RFC 6298, bounded by `minimum` and `maximum`. A request
+    timing out doubles the adaptive timeout of its message until its next response.
+    """
+
+    GAIN = 0.125
+    VARIATION_GAIN = 0.25
+    VARIATION_FACTOR = 4
+
+    def __init__(self, default: float = 1) -> None:
+        """Initializes new timeouts without observed latencies.
+
+        Args:
+            default: Timeout in seconds of messages without a set or adaptive timeout.
+                Defaults to 1.
+
+        """
+        self._default = default
+        self._timeouts: dict[str, float] = {}
+        self._estimates: dict[str, tuple[float, float]] = {}
+        self._backoff: dict[str, float] = {}
+        self.adaptive = False
+        self.minimum = 0.2
+        self.maximum = 60.0
+
+    @property
+    def default(self) -> float:
+        """Returns the timeout of messages without a set or adaptive timeout."""
+        return self._default
+
+    def set(self, msg: str, timeout: float | None) -> None:
+        """Sets the timeout of a message.
+
+        Args:
+            msg: The request message.
+            timeout: The timeout in seconds, or None to remove the set timeout.
+
+        """
+        if timeout is None:
+            self._timeouts.pop(msg, None)
+        else:
+            self._timeouts[msg] = timeout
+
+    def timeout(self, msg: str) -> float:
+        """Returns the time to wait for the response of a request.
+
+        Args:
+            msg: The request message.
+
+        Returns:
+            float: The timeout in seconds.
+
+        """
+        if (timeout := self._timeouts.get(msg)) is not None:
+            return timeout
+        if self.adaptive and (timeout := self.estimate(msg)) is not None:
+            return timeout
+        return self._default
+
+    def estimate(self, msg: str) -> float | None:
+        """Returns the adaptive timeout of a message.
+
+        Args:
+            msg: The request message.
+
+        Returns:
+            float | None: The adaptive timeout in seconds, or None if no latency of the
+                message has been observed.
+
+        """
+        if (timeout := self._backoff.get(msg)) is not None:
+            return timeout
+        if (estimate := self._estimates.get(msg)) is None:
+            return None
+        latency, variation = estimate
+        timeout = latency + self.VARIATION_FACTOR * variation
+        return min(max(timeout, self.minimum), self.maximum)
+
+    def observe(self, msg: str, latency: float) -> None:
+        """Updates the adaptive timeout of a message with the latency of a response.
+
+        Args:
+            msg: The request message.
+            latency: The time in seconds between sending the request and receiving the
+                response.
+
+        """
+        self._backoff.pop(msg, None)
+        if (estimate := self._estimates.get(msg)) is None:
+            self._estimates[msg] = (latency, latency / 2)
+            return
+        smoothed, variation = estimate
+        self._estimates[msg] = (
+            smoothed + self.GAIN * (latency - smoothed),
+            variation + self.VARIATION_GAIN * (abs(smoothed - latency) - variation),
+        )
+
+    def expire(self, msg: str) -> None:
+        """Doubles the adaptive timeout of a message after a request timed out.
+
+        Args:
+            msg: The request message.
+
+        """
+        if self.adaptive:
+            timeout = self.estimate(msg) or self._default
+            self._backoff[msg] = min(2 * timeout, self.maximum)
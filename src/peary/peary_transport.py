@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import os
+import socket as socket_module
+from typing import TYPE_CHECKING, NamedTuple, Protocol
+
+from peary.peary_frame_decoder import PearyFrameDecoder
+from peary.peary_protocol import PearyProtocol, PearySocket
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from _typeshed import WriteableBuffer
+    from typing_extensions import Buffer
+
+    from peary.peary_emulator import PearyEmulator
+
+
+class PearyTransportSocket(PearySocket, Protocol):
+    """Connection operations used by the peary client, i.e. a `socket`."""
+
+    def connect(self, address: tuple[str, int] | str, /) -> None:
+        """Connects to the address of the remote peary server."""
+
+    def shutdown(self, how: int, /) -> None:
+        """Shuts down one or both halves of the connection."""
+
+    def close(self) -> None:
+        """Closes the connection."""
+
+
+class PearyTransport(Protocol):
+    """Creates the connections of a peary client to a remote peary server."""
+
+    @property
+    def address(self) -> tuple[str, int] | str:
+        """Returns the address the created sockets connect to."""
+
+    def create_socket(self) -> PearyTransportSocket:
+        """Returns a new socket configured for the transport but not yet connected."""
+
+
+class PearyKeepalive(NamedTuple):
+    """Probing of idle TCP connections to detect a remote server that went away."""
+
+    idle: int = 10
+    interval: int = 5
+    probes: int = 3
+
+
+class PearyTcpTransport:
+    """Transport connecting to a peary server over TCP.
+
+    Nagle's algorithm is disabled by default, since every request is a small frame
+    waiting for its response. Keep alive probing is disabled by default and enabled by
+    setting `keepalive`, i.e.
+
+        transport = PearyTcpTransport("localhost")
+        transport.keepalive = PearyKeepalive(idle=30)
+        with PearyClient(transport) as proxy:
+            # do something with the proxy
+
+    Keep alive timings not supported by the platform are left at their defaults.
+    """
+
+    KEEPALIVE_OPTIONS = ("TCP_KEEPIDLE", "TCP_KEEPINTVL", "TCP_KEEPCNT")
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 12345,
+        *,
+        socket_class: type[socket_module.socket] = socket_module.socket,
+    ) -> None:
+        """Initializes a new TCP transport.
+
+        Args:
+            host: Hostname of the remote peary server.
+            port: Port number of the remote peary server. Defaults to 12345.
+            socket_class: Class used for the remote socket. Defaults to socket.
+
+        """
+        self._host = host
+        self._port = port
+        self._socket_class = socket_class
+        self.nodelay = True
+        self.keepalive: PearyKeepalive | None = None
+
+    def __str__(self) -> str:
+        """Returns the description used in connection errors.
+
+        Returns:
+            str: The description of the remote peary server.
+
+        """
+        return f"host {self._host} using port {self._port}"
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the hostname and port of the remote peary server."""
+        return self._host, self._port
+
+    def create_socket(self) -> socket_module.socket:
+        """Returns a new TCP socket with the configured socket options.
+
+        Returns:
+            socket: The socket, not yet connected.
+
+        """
+        socket = self._socket_class(socket_module.AF_INET, socket_module.SOCK_STREAM)
+        if self.nodelay:
+            socket.setsockopt(socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY, 1)
+        if self.keepalive is not None:
+            socket.setsockopt(socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE, 1)
+            for name, value in zip(self.KEEPALIVE_OPTIONS, self.keepalive):
+                if (option := getattr(socket_module, name, None)) is not None:
+                    socket.setsockopt(socket_module.IPPROTO_TCP, option, value)
+        return socket
+
+
+class PearyUnixTransport:
+    """Transport connecting to a peary server over a Unix domain socket.
+
+    Clients running on the same host as the peary server bypass the TCP stack, i.e.
+
+        with PearyClient(PearyUnixTransport("/run/peary.sock")) as proxy:
+            # do something with the proxy
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        socket_class: type[socket_module.socket] = socket_module.socket,
+    ) -> None:
+        """Initializes a new Unix domain socket transport.
+
+        Args:
+            path: Path of the socket the remote peary server listens on.
+            socket_class: Class used for the remote socket. Defaults to socket.
+
+        """
+        self._path = os.fspath(path)
+        self._socket_class = socket_class
+
+    def __str__(self) -> str:
+        """Returns the description used in connection errors.
+
+        Returns:
+            str: The description of the remote peary server.
+
+        """
+        return f"unix socket {self._path}"
+
+    @property
+    def address(self) -> str:
+        """Returns the path of the socket the remote peary server listens on."""
+        return self._path
+
+    def create_socket(self) -> socket_module.socket:
+        """Returns a new Unix domain socket.
+
+        Returns:
+            socket: The socket, not yet connected.
+
+        """
+        return self._socket_class(socket_module.AF_UNIX, socket_module.SOCK_STREAM)
+
+
+class PearyInProcessSocket:
+    """Socket stand-in handing each request directly to an emulated peary server.
+
+    Requests are answered while they are sent, so no system calls are made and the
+    latency, jitter and fragmentation of the emulator are not applied.
+    """
+
+    def __init__(self, emulator: PearyEmulator) -> None:
+        """Initializes a new unconnected in-process socket.
+
+        Args:
+            emulator: The emulated peary server answering the requests.
+
+        """
+        self._emulator = emulator
+        self._decoder = PearyFrameDecoder()
+        self._pending = bytearray()
+        self._connected = False
+
+    def settimeout(self, value: float | None) -> None:
+        """Ignores the timeout since responses are available immediately."""
+
+    def connect(self, _: object, /) -> None:
+        """Connects to the emulator, ignoring the address."""
+        self._connected = True
+
+    def sendmsg(self, buffers: Iterable[Buffer], *_: object) -> int:
+        """Hands the sent requests to the emulator and queues their responses.
+
+        Args:
+            buffers: The sent request frames.
+            _: Catches the unused arguments of `socket.sendmsg`.
+
+        Returns:
+            int: The number of sent bytes.
+
+        Raises:
+            BrokenPipeError: If the socket is not connected.
+
+        """
+        if not self._connected:
+            raise BrokenPipeError("In-process socket is not connected.")
+        data = b"".join(buffers)
+        self._decoder.feed(data)
+        for frame in self._decoder:
+            payload, status = self._emulator.handle(frame.payload)
+            self._pending += PearyProtocol.encode(payload, frame.tag, status)
+        return len(data)
+
+    def recv_into(self, buffer: WriteableBuffer, *_: object) -> int:
+        """Receives the queued responses.
+
+        Args:
+            buffer: The buffer receiving the response frames.
+            _: Catches the unused arguments of `socket.recv_into`.
+
+        Returns:
+            int: The number of received bytes, or 0 once the socket is shut down.
+
+        Raises:
+            TimeoutError: If no response is queued, since none will arrive later.
+
+        """
+        if not self._pending and self._connected:
+            raise TimeoutError("No response pending.")
+        with memoryview(buffer) as view:
+            received = self._pending[: len(view)]
+            view[: len(received)] = received
+        del self._pending[: len(received)]
+        return len(received)
+
+    def shutdown(self, _: int, /) -> None:
+        """Disconnects from the emulator, discarding the queued responses."""
+        self.close()
+
+    def close(self) -> None:
+        """Disconnects from the emulator, discarding the queued responses."""
+        self._connected = False
+        self._pending.clear()
+
+
+class PearyInProcessTransport:
+    """Transport connecting to an emulated peary server in the same process.
+
+    Requests are answered by the emulator without a network connection, so scripts and
+    tests run without a peary server, i.e.
+
+        with PearyClient(PearyInProcessTransport(PearyEmulator())) as proxy:
+            # do something with the proxy
+
+    """
+
+    def __init__(self, emulator: PearyEmulator) -> None:
+        """Initializes a new in-process transport.
+
+        Args:
+            emulator: The emulated peary server answering the requests.
+
+        """
+        self._emulator = emulator
+
+    def __str__(self) -> str:
+        """Returns the description used in connection errors.
+
+        Returns:
+            str: The description of the remote peary server.
+
+        """
+        return "in-process emulator"
+
+    @property
+    def address(self) -> str:
+        """Returns an empty address, since the emulator needs none."""
+        return ""
+
+    def create_socket(self) -> PearyInProcessSocket:
+        """Returns a new in-process socket.
+
+        Returns:
+            PearyInProcessSocket: The socket, not yet connected.
+
+        """
+        return PearyInProcessSocket(self._emulator)
@@ -35,9 +35,7 @@ def _mock_caribou_board() -> Callable:
         class MockProtocol(PearyProtocol):
             """A Mock Peary Protocol."""
 
-            def request(
-                self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-            ) -> bytes:
+            def request(self, msg: str, *args: str) -> bytes:
                 TRANSACTIONS.append(" ".join([str(_) for _ in (msg, *args)]))
                 return " ".join([msg, *args]).encode("utf-8")
 
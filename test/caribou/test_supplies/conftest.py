@@ -20,9 +20,7 @@ def _mock_device() -> Callable:
         class MockProtocol(PearyProtocol):
             """A Mock Peary Protocol."""
 
-            def request(
-                self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-            ) -> bytes:
+            def request(self, msg: str, *args: str) -> bytes:
                 assert " ".join([msg, *args]) == req
                 return resp
 
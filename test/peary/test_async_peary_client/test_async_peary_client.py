@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from peary.async_peary_client import AsyncPearyClient
+from peary.async_peary_proxy import AsyncPearyProxy
+from peary.peary_protocol import PearyProtocol
+
+
+async def _respond_version(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    while prefix := await reader.read(  # pylint: disable=while-used
+        PearyProtocol.STRUCT_LENGTH.size
+    ):
+        (length,) = PearyProtocol.STRUCT_LENGTH.unpack(prefix)
+        tag, _ = PearyProtocol.STRUCT_HEADER.unpack(
+            (await reader.readexactly(length))[: PearyProtocol.STRUCT_HEADER.size]
+        )
+        writer.write(
+            PearyProtocol.encode(PearyProtocol.VERSION, tag, PearyProtocol.STATUS_OK)
+        )
+    writer.close()
+
+
+def test_async_peary_client_context_manager() -> None:
+    async def _test() -> None:
+        server = await asyncio.start_server(_respond_version, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            client = AsyncPearyClient("127.0.0.1", port)
+            async with client as proxy:
+                assert isinstance(proxy, AsyncPearyProxy)
+                assert await proxy.keep_alive() == PearyProtocol.VERSION
+            await client.__aexit__(None, None, None)
+
+    asyncio.run(_test())
+
+
+def test_async_peary_client_concurrent_clients() -> None:
+    async def _keep_alive(port: int) -> bytes:
+        async with AsyncPearyClient("127.0.0.1", port) as proxy:
+            return await proxy.keep_alive()
+
+    async def _test() -> None:
+        server = await asyncio.start_server(_respond_version, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            assert (
+                await asyncio.gather(*(_keep_alive(port) for _ in range(4)))
+                == [PearyProtocol.VERSION] * 4
+            )
+
+    asyncio.run(_test())
+
+
+def test_async_peary_client_connect_error() -> None:
+    async def _test() -> None:
+        async with AsyncPearyClient("-", 0):
+            pass  # pragma: no cover
+
+    with pytest.raises(
+        AsyncPearyClient.PearySockerError,
+        match=r"Unable to connect to host - using port 0\.",
+    ):
+        asyncio.run(_test())
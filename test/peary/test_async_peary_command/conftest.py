@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from peary.async_peary_protocol import AsyncPearyProtocol
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class MockAsyncPearyProtocol(AsyncPearyProtocol):
+    """A Mock Async Peary Protocol recording the sent payloads."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            cast("asyncio.StreamReader", None), cast("asyncio.StreamWriter", None)
+        )
+        self.sent: list[tuple[str, bytes]] = []
+
+    async def send_payload(self, msg: str, payload: bytes) -> int:
+        self.sent.append((msg, payload))
+        return len(self.sent)
+
+    async def recv_response(self, tag: int) -> bytes:
+        return self.sent[tag - 1][1].upper()
+
+
+@pytest.fixture(name="mock_protocol")
+def _mock_protocol() -> MockAsyncPearyProtocol:
+    return MockAsyncPearyProtocol()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from peary.async_peary_command import AsyncPearyCommand
+
+if TYPE_CHECKING:
+    from .conftest import MockAsyncPearyProtocol
+
+
+def test_async_peary_command_payload(mock_protocol: MockAsyncPearyProtocol) -> None:
+    command = AsyncPearyCommand(mock_protocol, "device.get_voltage", "0", "PWR_OUT_1")
+    assert command.msg == "device.get_voltage"
+    assert command.payload == b"device.get_voltage 0 PWR_OUT_1"
+    assert not mock_protocol.sent
+
+
+def test_async_peary_command_call(mock_protocol: MockAsyncPearyProtocol) -> None:
+    async def _test() -> None:
+        command = AsyncPearyCommand(mock_protocol, "alpha", "0")
+        assert await asyncio.gather(command(), command()) == [b"ALPHA 0"] * 2
+        assert mock_protocol.sent == [("alpha", b"alpha 0")] * 2
+
+    asyncio.run(_test())
+
+
+def test_async_peary_command_send(mock_protocol: MockAsyncPearyProtocol) -> None:
+    async def _test() -> None:
+        command = AsyncPearyCommand(mock_protocol, "alpha")
+        assert [await command.send() for _ in range(3)] == [1, 2, 3]
+        assert await mock_protocol.recv_response(3) == b"ALPHA"
+
+    asyncio.run(_test())
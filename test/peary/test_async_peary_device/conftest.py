@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from peary.async_peary_device import AsyncPearyDevice
+from peary.async_peary_protocol import AsyncPearyProtocol
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
+
+@pytest.fixture(name="mock_device")
+def _mock_device() -> Callable:
+    def _customize_mock_device_request(
+        index: int, *, req: str | None = None, resp: bytes | None = None
+    ) -> AsyncPearyDevice:
+
+        class MockAsyncPearyProtocol(AsyncPearyProtocol):
+            """A Mock Async Peary Protocol."""
+
+            async def request(self, msg: str, *args: str) -> bytes:
+                if req:
+                    assert " ".join([msg, *args]) == req
+                if resp:
+                    return resp
+                else:
+                    return " ".join([msg, *args]).encode("utf-8")
+
+            async def request_payload(self, msg: str, payload: bytes) -> bytes:
+                assert payload.startswith(msg.encode("utf-8"))
+                return await self.request(*payload.decode("utf-8").split(" "))
+
+        return AsyncPearyDevice(
+            index,
+            MockAsyncPearyProtocol(
+                cast("asyncio.StreamReader", None), cast("asyncio.StreamWriter", None)
+            ),
+        )
+
+    return _customize_mock_device_request
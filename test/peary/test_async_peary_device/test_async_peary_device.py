@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_async_peary_device_init(mock_device: Callable) -> None:
+    device = mock_device(1)
+    assert device.index == 1
+    assert device.protocol is not None
+
+
+def test_async_peary_device_name(mock_device: Callable) -> None:
+    async def _test() -> None:
+        device = mock_device(1, req="device.name 1", resp=b"alpha")
+        assert repr(device) == "AsyncPearyDevice(1)"
+        assert await device.name() == "alpha"
+        assert await device.name() == "alpha"
+        assert repr(device) == "alpha(1)"
+
+    asyncio.run(_test())
+
+
+def test_async_peary_device_methods_command(mock_device: Callable) -> None:
+    async def _test() -> None:
+        device = mock_device(1)
+        assert await device.power_on() == b"device.power_on 1"
+        assert await device.power_off() == b"device.power_off 1"
+        assert await device.reset() == b"device.reset 1"
+        assert await device.configure() == b"device.configure 1"
+        assert await device.daq_start() == b"device.daq_start 1"
+        assert await device.daq_stop() == b"device.daq_stop 1"
+        assert await device.set_register("a", 2) == b"device.set_register 1 a 2"
+        assert await device.set_memory("a", 2) == b"device.set_memory 1 a 2"
+        assert await device.set_current("a", 2.0) == b"device.set_current 1 a 2.0"
+        assert await device.set_voltage("a", 2.0) == b"device.set_voltage 1 a 2.0"
+        assert await device.switch_on("a") == b"device.switch_on 1 a"
+        assert await device.switch_off("a") == b"device.switch_off 1 a"
+
+    asyncio.run(_test())
+
+
+def test_async_peary_device_methods_values(mock_device: Callable) -> None:
+    async def _test() -> None:
+        assert await mock_device(
+            0, req="device.list_registers 0", resp=b"alpha beta"
+        ).list_registers() == ["alpha", "beta"]
+        assert (
+            await mock_device(0, req="device.get_register 0 a", resp=b"2").get_register(
+                "a"
+            )
+            == 2
+        )
+        assert (
+            await mock_device(0, req="device.get_memory 0 a", resp=b"2").get_memory("a")
+            == 2
+        )
+        assert (
+            await mock_device(0, req="device.get_current 0 a", resp=b"2.5").get_current(
+                "a"
+            )
+            == 2.5
+        )
+        assert (
+            await mock_device(0, req="device.get_voltage 0 a", resp=b"2.5").get_voltage(
+                "a"
+            )
+            == 2.5
+        )
+
+    asyncio.run(_test())
+
+
+def test_async_peary_device_compile(mock_device: Callable) -> None:
+    async def _test() -> None:
+        command = mock_device(
+            1, req="device.get_voltage 1 PWR_OUT_1", resp=b"1.5"
+        ).compile("get_voltage", "PWR_OUT_1")
+        assert command.payload == b"device.get_voltage 1 PWR_OUT_1"
+        assert float(await command()) == 1.5
+
+    asyncio.run(_test())
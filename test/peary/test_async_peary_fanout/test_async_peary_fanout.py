@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.async_peary_client import AsyncPearyClient
+from peary.async_peary_fanout import AsyncPearyFanout
+from peary.peary_emulator import PearyEmulator
+
+if TYPE_CHECKING:
+    from peary.async_peary_proxy import AsyncPearyProxy
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _start(emulators: list[PearyEmulator]) -> list[asyncio.Server]:
+    return [await emulator.start("127.0.0.1", 0) for emulator in emulators]
+
+
+def _hosts(servers: list[asyncio.Server]) -> list[tuple[str, int]]:
+    return [("127.0.0.1", server.sockets[0].getsockname()[1]) for server in servers]
+
+
+def test_async_peary_fanout_run() -> None:
+    async def _power_on(proxy: AsyncPearyProxy) -> int:
+        device = await proxy.add_device("dut")
+        await device.power_on()
+        await device.set_register("reg", device.index + 7)
+        return await device.get_register("reg")
+
+    async def _test() -> None:
+        emulators = [PearyEmulator() for _ in range(3)]
+        servers = await _start(emulators)
+        hosts = _hosts(servers)
+        async with AsyncPearyFanout(hosts) as fanout:
+            names = [f"{host}:{port}" for host, port in hosts]
+            assert fanout.hosts == names
+            assert [*fanout.proxies] == names
+            assert not fanout.errors
+            results = await fanout.run(_power_on)
+        assert [*results] == names
+        for name, result in results.items():
+            assert result.host == name
+            assert result.error is None
+            assert result.elapsed >= 0
+            assert result.result() == 7
+        assert all(emulator.devices[0].states["powered"] for emulator in emulators)
+        assert not fanout.proxies
+        for server in servers:
+            server.close()
+
+    asyncio.run(_test())
+
+
+def test_async_peary_fanout_concurrent() -> None:
+    async def _test() -> None:
+        servers = await _start([PearyEmulator(latency=0.2) for _ in range(5)])
+        async with AsyncPearyFanout(_hosts(servers)) as fanout:
+            start = asyncio.get_running_loop().time()
+            results = await fanout.run(lambda proxy: proxy.keep_alive())
+            assert asyncio.get_running_loop().time() - start < 0.2 * len(servers)
+        assert all(not result.result() for result in results.values())
+        for server in servers:
+            server.close()
+
+    asyncio.run(_test())
+
+
+def test_async_peary_fanout_errors() -> None:
+    async def _fail(proxy: AsyncPearyProxy) -> str:
+        return await proxy.get_device("missing").name()
+
+    async def _test() -> None:
+        servers = await _start([PearyEmulator(), PearyEmulator(latency=0.5)])
+        hosts = [*_hosts(servers), ("127.0.0.1", _unused_port())]
+        async with AsyncPearyFanout(hosts) as fanout:
+            unreachable = f"127.0.0.1:{hosts[2][1]}"
+            assert [*fanout.errors] == [unreachable]
+            assert isinstance(
+                fanout.errors[unreachable], AsyncPearyClient.PearySockerError
+            )
+            results = await fanout.run(lambda proxy: proxy.keep_alive(), timeout=0.2)
+            assert results[f"127.0.0.1:{hosts[0][1]}"].error is None
+            slow = f"127.0.0.1:{hosts[1][1]}"
+            assert isinstance(results[slow].error, asyncio.TimeoutError)
+            assert fanout.proxies[slow].protocol.in_flight == 0
+            assert fanout.proxies[slow].protocol.abandoned == 1
+            with pytest.raises(AsyncPearyClient.PearySockerError):
+                results[unreachable].result()
+            assert results[unreachable].elapsed == 0
+            failures = await fanout.run(_fail)
+            assert all(result.error is not None for result in failures.values())
+        for server in servers:
+            server.close()
+
+    asyncio.run(_test())
+
+
+def test_async_peary_fanout_hostname() -> None:
+    fanout = AsyncPearyFanout(["localhost", ("localhost", 12346)])
+    assert fanout.hosts == ["localhost", "localhost:12346"]
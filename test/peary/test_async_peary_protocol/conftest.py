@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class MockStreamWriter:
+    """Mock stream writer collecting written data."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write(self, data: bytes) -> None:
+        self.data.extend(data)
+
+    def writelines(self, data: Iterable[bytes]) -> None:
+        for buffer in data:
+            self.write(buffer)
+
+    async def drain(self) -> None:
+        """Mock drain method."""
+
+
+@pytest.fixture(name="mock_streams")
+def _mock_streams() -> Callable:
+    def _create_mock_streams(
+        *frames: bytes, eof: bool = False
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(frames))
+        if eof:
+            reader.feed_eof()
+        return reader, cast("asyncio.StreamWriter", MockStreamWriter())
+
+    return _create_mock_streams
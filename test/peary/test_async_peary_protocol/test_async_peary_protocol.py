@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.async_peary_protocol import AsyncPearyProtocol
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _frame(payload: bytes, tag: int, status: int = PearyProtocol.STATUS_OK) -> bytes:
+    return PearyProtocol.encode(payload, tag, status)
+
+
+def test_async_peary_protocol_shared_exceptions() -> None:
+    assert AsyncPearyProtocol.ResponseStatusError is PearyProtocol.ResponseStatusError
+    assert AsyncPearyProtocol.VersionError is PearyProtocol.VersionError
+
+
+def test_async_peary_protocol_request(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"beta", 1))
+        protocol = AsyncPearyProtocol(reader, writer)
+        assert await protocol.request("alpha", "0") == b"beta"
+        assert writer.data == _frame(b"alpha 0", 1)  # type: ignore[attr-defined]
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_request_payload(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"beta", 1), _frame(b"gamma", 2))
+        protocol = AsyncPearyProtocol(reader, writer)
+        payload = PearyProtocol.encode_message("alpha", ["0"])
+        assert await protocol.request_payload("alpha", payload) == b"beta"
+        assert await protocol.request_payload("alpha", payload) == b"gamma"
+        expected = _frame(b"alpha 0", 1) + _frame(b"alpha 0", 2)
+        assert writer.data == expected  # type: ignore[attr-defined]
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_verify_supported(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(PearyProtocol.VERSION, 1))
+        await AsyncPearyProtocol(reader, writer).verify()
+        assert writer.data == _frame(  # type: ignore[attr-defined]
+            b"protocol_version", 1
+        )
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_verify_unsupported(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"0", 1))
+        with pytest.raises(
+            PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+        ):
+            await AsyncPearyProtocol(reader, writer).verify()
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_verify_none(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams()
+        await AsyncPearyProtocol(
+            reader, writer, checks=PearyProtocol.Checks.CHECK_NONE
+        ).verify()
+        assert not writer.data  # type: ignore[attr-defined]
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_concurrent_requests(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(
+            *(_frame(f"{ii}".encode(), ii) for ii in (3, 1, 2))
+        )
+        protocol = AsyncPearyProtocol(reader, writer)
+        assert await asyncio.gather(
+            *(protocol.request(f"{ii}") for ii in range(1, 4))
+        ) == [b"1", b"2", b"3"]
+        assert protocol.in_flight == 0
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_request_many(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(
+            *(_frame(b"", ii, status) for ii, status in ((1, 0), (2, 1), (3, 0)))
+        )
+        protocol = AsyncPearyProtocol(reader, writer, max_in_flight=2)
+        assert protocol.max_in_flight == 2
+        responses = await protocol.request_many([("a", ()), ("b", ()), ("c", ())])
+        assert responses[0] == b""
+        assert isinstance(responses[1], PearyProtocol.ResponseStatusError)
+        assert responses[2] == b""
+        assert writer.data == b"".join(  # type: ignore[attr-defined]
+            _frame(msg, ii + 1) for ii, msg in enumerate((b"a", b"b", b"c"))
+        )
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_max_in_flight_concurrent(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(*(_frame(b"", ii) for ii in range(1, 5)))
+        protocol = AsyncPearyProtocol(reader, writer, max_in_flight=1)
+        tags = [await protocol.send_request("") for _ in range(2)]
+        assert protocol.in_flight == 1
+        assert (
+            await asyncio.gather(
+                protocol.request(""),
+                protocol.request(""),
+                *(protocol.recv_response(tag) for tag in tags),
+            )
+            == [b""] * 4
+        )
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_status_error(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"", 1, 1))
+        with pytest.raises(
+            PearyProtocol.ResponseStatusError, match="Failed response status 1"
+        ):
+            await AsyncPearyProtocol(reader, writer).request("")
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_sequence_error(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"", 0))
+        with pytest.raises(
+            PearyProtocol.ResponseSequenceError,
+            match="Recieved out of order repsonse from 'alpha': 0 != 1",
+        ):
+            await AsyncPearyProtocol(reader, writer).request("alpha")
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_recv_error(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"alpha", 1)[:-1], eof=True)
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match=r"Failed to receive response\."
+        ):
+            await AsyncPearyProtocol(reader, writer).request("")
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_timeout(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams()
+        with pytest.raises(asyncio.TimeoutError):
+            await AsyncPearyProtocol(reader, writer, timeout=0).request("")
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_stats(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams(_frame(b"beta", 1), _frame(b"gamma", 2))
+        protocol = AsyncPearyProtocol(reader, writer)
+        assert protocol.stats is None
+        protocol.stats = stats = PearyStats()
+        assert protocol.stats is stats
+        await asyncio.gather(protocol.request("alpha"), protocol.request("alpha"))
+        assert stats.snapshot()["alpha"].requests == 2
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_timeout_full_window(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams()
+        protocol = AsyncPearyProtocol(reader, writer, timeout=0.05, max_in_flight=2)
+        with pytest.raises(asyncio.TimeoutError):
+            await protocol.request_many([(msg, ()) for msg in "abcde"])
+        assert protocol.in_flight == 0
+        assert protocol.abandoned == 2
+        reader.feed_data(_frame(b"late", 1) + _frame(b"late", 2))
+        reader.feed_data(_frame(b"fresh", 3))
+        assert await protocol.request("z") == b"fresh"
+
+    asyncio.run(_test())
+
+
+def test_async_peary_protocol_cancel_full_window(mock_streams: Callable) -> None:
+    async def _test() -> None:
+        reader, writer = mock_streams()
+        protocol = AsyncPearyProtocol(reader, writer, timeout=10, max_in_flight=2)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                protocol.request_many([(msg, ()) for msg in "abcde"]), 0.05
+            )
+        assert protocol.in_flight == 0
+        assert protocol.abandoned == 2
+
+    asyncio.run(_test())
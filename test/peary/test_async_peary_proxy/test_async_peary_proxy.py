@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from typing import cast
+
+import pytest
+
+from peary.async_peary_device import AsyncPearyDevice
+from peary.async_peary_protocol import AsyncPearyProtocol
+from peary.async_peary_proxy import AsyncPearyProxy
+
+
+class MockAsyncPearyProtocol(AsyncPearyProtocol):
+    """A Mock Async Peary Protocol."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            cast("asyncio.StreamReader", None), cast("asyncio.StreamWriter", None)
+        )
+        self.transactions: list[str] = []
+
+    async def request(self, msg: str, *args: str) -> bytes:
+        self.transactions.append(" ".join([msg, *args]))
+        return f"{len(self.transactions) - 1}".encode() if args else b""
+
+
+def test_async_peary_proxy_keep_alive() -> None:
+    protocol = MockAsyncPearyProtocol()
+    proxy = AsyncPearyProxy(protocol)
+    assert proxy.protocol is protocol
+    assert not asyncio.run(proxy.keep_alive())
+    assert protocol.transactions == [""]
+
+
+def test_async_peary_proxy_devices() -> None:
+    async def _test() -> None:
+        protocol = MockAsyncPearyProtocol()
+        proxy = AsyncPearyProxy(protocol)
+        alpha = await proxy.add_device("alpha")
+        beta = await proxy.add_device("beta", AsyncPearyDevice)
+        assert (alpha.index, beta.index) == (0, 1)
+        assert proxy.get_device("beta") is beta
+        assert proxy.list_devices() == ["alpha", "beta"]
+        assert not await proxy.list_remote_devices()
+        await proxy.clear_devices()
+        assert not proxy.list_devices()
+        assert protocol.transactions == [
+            "add_device alpha",
+            "add_device beta",
+            "list_devices",
+            "clear_devices",
+        ]
+
+    asyncio.run(_test())
+
+
+def test_async_peary_proxy_add_device_repeated_name() -> None:
+    async def _test() -> None:
+        proxy = AsyncPearyProxy(MockAsyncPearyProtocol())
+        await proxy.add_device("a")
+        with pytest.raises(
+            AsyncPearyProxy.PearyProxyAddDeviceError, match="Device already exists: a"
+        ):
+            await proxy.add_device("a")
+
+    asyncio.run(_test())
+
+
+def test_async_peary_proxy_get_device_unknown() -> None:
+    with pytest.raises(
+        AsyncPearyProxy.PearyProxyGetDeviceError, match="Unknown device: alpha"
+    ):
+        AsyncPearyProxy(MockAsyncPearyProtocol()).get_device("alpha")
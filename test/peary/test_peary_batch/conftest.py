@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import socket
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_device import PearyDevice
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+
+@pytest.fixture(name="mock_device")
+def _mock_device() -> Callable:
+    def _customize_mock_device(
+        index: int = 0, *, resp: bytes | None = None, transactions: list | None = None
+    ) -> PearyDevice:
+
+        class MockPearyProtocol(PearyProtocol):
+            """A Mock Peary Protocol."""
+
+            def request_many(
+                self, requests: Iterable[tuple[str, Sequence[str]]]
+            ) -> list[bytes | Exception]:
+                responses: list[bytes | Exception] = []
+                for msg, args in requests:
+                    if transactions is not None:
+                        transactions.append(" ".join([msg, *args]))
+                    if "fail" in args:
+                        responses.append(PearyProtocol.ResponseStatusError(msg))
+                    elif resp:
+                        responses.append(resp)
+                    else:
+                        responses.append(" ".join([msg, *args]).encode("utf-8"))
+                return responses
+
+        return PearyDevice(
+            index,
+            MockPearyProtocol(socket.socket(), checks=PearyProtocol.Checks.CHECK_NONE),
+        )
+
+    return _customize_mock_device
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_batch import PearyBatch, PearyBatchResult
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_batch_device_batch(mock_device: Callable) -> None:
+    assert isinstance(mock_device().batch(), PearyBatch)
+
+
+def test_peary_batch_flush_on_exit(mock_device: Callable) -> None:
+    transactions: list[str] = []
+    with mock_device(1, transactions=transactions).batch() as batch:
+        result = batch.set_register("alpha", 0)
+        assert not result.done()
+        assert len(batch) == 1
+        assert not transactions
+    assert len(batch) == 0
+    assert result.done()
+    assert transactions == ["device.set_register 1 alpha 0"]
+
+
+def test_peary_batch_discard_on_error(mock_device: Callable) -> None:
+    class MockError(Exception):
+        """Mock exception for testing purposes."""
+
+    transactions: list[str] = []
+    with pytest.raises(MockError):  # noqa: PT012
+        with mock_device(transactions=transactions).batch() as batch:
+            result = batch.set_register("alpha", 0)
+            raise MockError
+    assert not transactions
+    assert not result.done()
+    assert len(batch) == 0
+
+
+def test_peary_batch_flush_explicit(mock_device: Callable) -> None:
+    transactions: list[str] = []
+    batch = mock_device(transactions=transactions).batch()
+    batch.switch_on("alpha")
+    batch.flush()
+    batch.switch_off("alpha")
+    batch.flush()
+    assert transactions == ["device.switch_on 0 alpha", "device.switch_off 0 alpha"]
+
+
+def test_peary_batch_result_pending(mock_device: Callable) -> None:
+    with pytest.raises(
+        PearyBatchResult.PendingResultError, match=r"Batch has not been flushed\."
+    ):
+        mock_device().batch().get_register("alpha").result()
+
+
+def test_peary_batch_result_error(mock_device: Callable) -> None:
+    with mock_device().batch() as batch:
+        failed = batch.get_register("fail")
+        passed = batch.set_register("alpha", 1)
+    assert failed.done()
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        failed.result()
+    assert passed.result() == b"device.set_register 0 alpha 1"
+
+
+def test_peary_batch_methods_command(mock_device: Callable) -> None:
+    with mock_device(1).batch() as batch:
+        results = {
+            "device.power_on 1": batch.power_on(),
+            "device.power_off 1": batch.power_off(),
+            "device.reset 1": batch.reset(),
+            "device.configure 1": batch.configure(),
+            "device.set_register 1 a 2": batch.set_register("a", 2),
+            "device.set_memory 1 a 2": batch.set_memory("a", 2),
+            "device.set_current 1 a 2.0": batch.set_current("a", 2.0),
+            "device.set_voltage 1 a 2.0": batch.set_voltage("a", 2.0),
+            "device.switch_on 1 a": batch.switch_on("a"),
+            "device.switch_off 1 a": batch.switch_off("a"),
+        }
+    for request, result in results.items():
+        assert result.result() == request.encode("utf-8")
+
+
+def test_peary_batch_methods_values(mock_device: Callable) -> None:
+    transactions: list[str] = []
+    with mock_device(1, resp=b"2", transactions=transactions).batch() as batch:
+        register = batch.get_register("alpha")
+        memory = batch.get_memory("beta")
+        current = batch.get_current("gamma")
+        voltage = batch.get_voltage("delta")
+    assert transactions == [
+        "device.get_register 1 alpha",
+        "device.get_memory 1 beta",
+        "device.get_current 1 gamma",
+        "device.get_voltage 1 delta",
+    ]
+    assert register.result() == 2
+    assert isinstance(register.result(), int)
+    assert memory.result() == 2
+    assert current.result() == 2.0
+    assert isinstance(current.result(), float)
+    assert voltage.result() == 2.0
+
+
+def test_peary_batch_records_settings(mock_device: Callable) -> None:
+    device = mock_device()
+    with device.batch() as batch:
+        batch.set_voltage("vdd", 1.2)
+        batch.switch_on("vdd")
+        batch.set_register("alpha", "fail")
+        batch.get_register("alpha")
+    assert device.settings == [("set_voltage", "vdd", "1.2"), ("switch_on", "vdd")]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_capture import PearyCaptureReader, PearyCaptureWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SENT = PearyCaptureWriter.Direction.SENT
+RECEIVED = PearyCaptureWriter.Direction.RECEIVED
+
+
+def test_peary_capture_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    with PearyCaptureWriter(path) as capture:
+        capture.write(SENT, 1, 0, b"alpha 0")
+        capture.write(RECEIVED, 1, 2, b"")
+        capture.flush()
+    with PearyCaptureReader(path) as reader:
+        records = list(reader)
+    assert [record[1:] for record in records] == [
+        (SENT, 1, 0, b"alpha 0"),
+        (RECEIVED, 1, 2, b""),
+    ]
+    assert records[0].timestamp <= records[1].timestamp
+    assert isinstance(records[0].payload, bytes)
+
+
+def test_peary_capture_append(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    for tag in (1, 2):
+        with PearyCaptureWriter(path) as capture:
+            capture.write(SENT, tag, 0, b"alpha")
+    with PearyCaptureReader(path) as reader:
+        assert [record.tag for record in reader] == [1, 2]
+
+
+def test_peary_capture_empty(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    PearyCaptureWriter(path).close()
+    with PearyCaptureReader(path) as reader:
+        assert not list(reader)
+
+
+def test_peary_capture_too_short(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(b"")
+    with pytest.raises(
+        PearyCaptureReader.CaptureFormatError, match="Capture file is too short: 0"
+    ):
+        PearyCaptureReader(path)
+
+
+def test_peary_capture_bad_header(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(b"PEARYCAP\x00\x02")
+    with pytest.raises(
+        PearyCaptureReader.CaptureFormatError,
+        match="Unsupported capture header: b'PEARYCAP' version 2",
+    ):
+        PearyCaptureReader(path)
+
+
+@pytest.mark.parametrize("size", [4, PearyCaptureWriter.STRUCT_RECORD.size + 2])
+def test_peary_capture_truncated(tmp_path: Path, size: int) -> None:
+    path = tmp_path / "capture.pcap"
+    with PearyCaptureWriter(path) as capture:
+        capture.write(SENT, 1, 0, b"alpha")
+    path.write_bytes(
+        path.read_bytes()[: PearyCaptureWriter.STRUCT_FILE_HEADER.size + size]
+    )
+    with (
+        PearyCaptureReader(path) as reader,
+        pytest.raises(
+            PearyCaptureReader.CaptureFormatError,
+            match="Truncated capture record at offset 10",
+        ),
+    ):
+        list(reader)
+
+
+def test_peary_capture_record_layout(tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    with PearyCaptureWriter(path) as capture:
+        capture.write(RECEIVED, 3, 1, b"beta")
+    data = path.read_bytes()
+    assert data[:10] == b"PEARYCAP\x00\x01"
+    _, direction, tag, status, size = struct.unpack_from("!dBHHL", data, 10)
+    assert (direction, tag, status, size) == (1, 3, 1, 4)
+    assert data[-4:] == b"beta"
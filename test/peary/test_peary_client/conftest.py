@@ -8,8 +8,10 @@ import pytest
 from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any
 
+    from _typeshed import WriteableBuffer
     from typing_extensions import Buffer
 
 
@@ -30,6 +32,7 @@ class MockSocket(socket_module.socket):
         fileno: int | None = None,  # noqa: ARG002
     ) -> None:
         self.address: tuple[Any, ...] | str | Buffer | None = None
+        self.pending = bytearray()
 
     # pylint: enable=super-init-not-called,unused-argument,redefined-builtin
 
@@ -53,13 +56,30 @@ class MockSocket(socket_module.socket):
     def settimeout(self, value: float | None = None) -> None:
         """Mock settimeout method"""
 
+    def setsockopt(self, *_: object) -> None:
+        """Mock setsockopt method"""
+
     # pylint: disable-next=W0613
     def recv(self, size: int, flags: int = 0) -> bytes:  # noqa: ARG002
         return PearyProtocol.encode(PearyProtocol.VERSION, 1, PearyProtocol.STATUS_OK)
 
-    # pylint: disable-next=W0613
-    def send(self, data: Buffer, flags: int = 0) -> int:  # noqa: ARG002
-        return len(bytes(data))
+    def recv_into(  # pylint: disable=unused-argument
+        self,
+        buffer: WriteableBuffer,
+        nbytes: int = 0,  # noqa: ARG002
+        flags: int = 0,  # noqa: ARG002
+    ) -> int:
+        view = memoryview(buffer)
+        if not self.pending:
+            self.pending = bytearray(self.recv(len(view)))
+        size = min(len(view), len(self.pending))
+        view[:size] = self.pending[:size]
+        del self.pending[:size]
+        return size
+
+    # pylint: disable-next=R6301
+    def sendmsg(self, buffers: Iterable[Buffer], *_: object) -> int:
+        return len(b"".join(buffers))
 
 
 @pytest.fixture(name="mock_socket_class")
@@ -17,5 +17,7 @@ def test_peary_client_init_socket_class() -> None:
 
 
 def test_peary_client_init_socket_config() -> None:
-    assert PearyClient("").socket.family == socket_module.AF_INET
-    assert PearyClient("").socket.type == socket_module.SOCK_STREAM
+    socket = PearyClient("").socket
+    assert isinstance(socket, socket_module.socket)
+    assert socket.family == socket_module.AF_INET
+    assert socket.type == socket_module.SOCK_STREAM
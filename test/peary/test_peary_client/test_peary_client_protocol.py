@@ -17,9 +17,7 @@ def test_peary_client_protocol_class(
     class MockProtocol(PearyProtocol):
         """A Mock Protocol."""
 
-        def request(
-            self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-        ) -> bytes:
+        def request(self, msg: str, *args: str) -> bytes:
             request_collection.append(" ".join([msg, *args]))
             return b"1"
 
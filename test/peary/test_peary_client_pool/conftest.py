@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_emulator import PearyEmulator
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(name="emulator_port")
+def _emulator_port() -> Generator[int]:
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(PearyEmulator().start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    yield server.sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
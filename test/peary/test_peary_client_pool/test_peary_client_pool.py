@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_client_pool import PearyClientPool
+from peary.peary_protocol import PearyProtocol
+
+
+class FlakyProtocol(PearyProtocol):
+    failing = False
+    error: type[Exception] = PearyProtocol.ResponseReceiveError
+
+    def request(self, msg: str, *args: str) -> bytes:
+        if FlakyProtocol.failing and not msg:
+            raise FlakyProtocol.error("Failed to receive response.")
+        return super().request(msg, *args)
+
+
+def _request(pool: PearyClientPool, msg: str) -> bytes:
+    with pool.acquire() as proxy:
+        return proxy.protocol.request(msg)
+
+
+def test_peary_client_pool_parallel_workloads(emulator_port: int) -> None:
+    barrier = threading.Barrier(2)
+
+    def _workload(index: int) -> bytes:
+        with pool.acquire() as proxy:
+            barrier.wait(timeout=1)
+            return proxy.protocol.request("add_device", f"Device{index}")
+
+    with PearyClientPool("127.0.0.1", emulator_port, size=2) as pool:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_workload, range(4)))
+        assert sorted(results) == [b"0", b"1", b"2", b"3"]
+        assert pool.size == 2
+        assert len(pool.connections) == 2
+        assert sum(c.acquisitions for c in pool.connections) == 4
+        assert pool.in_use == 0
+
+
+def test_peary_client_pool_acquire_timeout(emulator_port: int) -> None:
+    with PearyClientPool(
+        "127.0.0.1", emulator_port, size=1, acquire_timeout=0.01
+    ) as pool:
+        assert pool.acquire_timeout == 0.01
+        with (
+            pool.acquire(),
+            pytest.raises(
+                PearyClientPool.PoolTimeoutError, match="No connection available"
+            ),
+        ):
+            with pool.acquire():
+                pass  # pragma: no cover
+        with pool.acquire() as proxy:
+            assert proxy.keep_alive() == b""
+
+
+def test_peary_client_pool_reuse_and_reap(emulator_port: int) -> None:
+    with PearyClientPool("127.0.0.1", emulator_port) as pool:
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+        pool.idle_timeout = 0
+        with pool.acquire() as third:
+            assert third is not first
+            assert pool.in_use == 1
+        pool.idle_timeout = None
+        with pool.acquire() as fourth:
+            assert fourth is third
+
+
+def test_peary_client_pool_health_check(
+    emulator_port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with PearyClientPool(
+        "127.0.0.1", emulator_port, protocol_class=FlakyProtocol
+    ) as pool:
+        pool.health_check_interval = 0
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+        monkeypatch.setattr(FlakyProtocol, "failing", True)
+        with pool.acquire() as third:
+            assert third is not first
+        monkeypatch.setattr(FlakyProtocol, "failing", False)
+        pool.health_check_interval = None
+        with pool.acquire() as fourth:
+            assert fourth is third
+
+
+def test_peary_client_pool_health_check_error(
+    emulator_port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with PearyClientPool(
+        "127.0.0.1",
+        emulator_port,
+        size=1,
+        acquire_timeout=0,
+        protocol_class=FlakyProtocol,
+    ) as pool:
+        pool.health_check_interval = 0
+        with pool.acquire():
+            pass
+        monkeypatch.setattr(FlakyProtocol, "failing", True)
+        monkeypatch.setattr(FlakyProtocol, "error", PearyProtocol.ResponseStatusError)
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            with pool.acquire():
+                pass  # pragma: no cover
+        assert not pool.connections
+        monkeypatch.setattr(FlakyProtocol, "failing", False)
+        with pool.acquire() as proxy:
+            assert proxy.keep_alive() == b""
+
+
+def test_peary_client_pool_broken_connection(
+    emulator_port: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with PearyClientPool(
+        "127.0.0.1", emulator_port, protocol_class=FlakyProtocol
+    ) as pool:
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            _request(pool, "unknown")
+        assert len(pool.connections) == 1
+        monkeypatch.setattr(FlakyProtocol, "failing", True)
+        with pytest.raises(PearyProtocol.ResponseReceiveError):
+            _request(pool, "")
+        assert not pool.connections
+
+
+def test_peary_client_pool_pending_requests(emulator_port: int) -> None:
+    with PearyClientPool("127.0.0.1", emulator_port) as pool:
+        with pool.acquire() as proxy:
+            proxy.protocol.send_request("")
+        assert not pool.connections
+
+
+def test_peary_client_pool_close(emulator_port: int) -> None:
+    pool = PearyClientPool("127.0.0.1", emulator_port)
+    with pool.acquire():
+        pass
+    with pool.acquire():
+        pool.close()
+        assert len(pool.connections) == 1
+    assert not pool.connections
+    with pytest.raises(PearyClientPool.PoolClosedError):
+        with pool.acquire():
+            pass  # pragma: no cover
+
+
+def test_peary_client_pool_stats(emulator_port: int) -> None:
+    with PearyClientPool("127.0.0.1", emulator_port) as pool:
+        pool.collect_stats = True
+        with pool.acquire() as proxy:
+            proxy.keep_alive()
+        connection = pool.connections[0]
+        assert connection.stats is not None
+        assert connection.stats.snapshot()[""].requests == 1
+        assert connection.idle_since > 0
+
+
+def test_peary_client_pool_connect_error() -> None:
+    with socket.create_server(("127.0.0.1", 0)) as listener:
+        port = listener.getsockname()[1]
+    with PearyClientPool("127.0.0.1", port, size=1, acquire_timeout=0) as pool:
+        for _ in range(2):
+            with pytest.raises(PearyClient.PearySockerError):
+                with pool.acquire():
+                    pass  # pragma: no cover
+        assert not pool.connections
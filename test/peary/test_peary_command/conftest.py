@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+from peary.peary_protocol import PearyProtocol
+
+
+class MockPearyProtocol(PearyProtocol):
+    """A Mock Peary Protocol recording the sent payloads."""
+
+    def __init__(self) -> None:
+        super().__init__(socket.socket(), checks=PearyProtocol.Checks.CHECK_NONE)
+        self.sent: list[tuple[str, bytes]] = []
+
+    def send_payload(self, msg: str, payload: bytes) -> int:
+        self.sent.append((msg, payload))
+        return len(self.sent)
+
+    def recv_response(self, tag: int) -> bytes:
+        return self.sent[tag - 1][1].upper()
+
+
+@pytest.fixture(name="mock_protocol")
+def _mock_protocol() -> MockPearyProtocol:
+    return MockPearyProtocol()
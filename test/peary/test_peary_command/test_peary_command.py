@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.peary_command import PearyCommand
+
+if TYPE_CHECKING:
+    from .conftest import MockPearyProtocol
+
+
+def test_peary_command_payload(mock_protocol: MockPearyProtocol) -> None:
+    command = PearyCommand(mock_protocol, "device.get_voltage", "0", "PWR_OUT_1")
+    assert command.msg == "device.get_voltage"
+    assert command.payload == b"device.get_voltage 0 PWR_OUT_1"
+    assert not mock_protocol.sent
+
+
+def test_peary_command_call(mock_protocol: MockPearyProtocol) -> None:
+    command = PearyCommand(mock_protocol, "alpha", "0")
+    assert command() == b"ALPHA 0"
+    assert command() == b"ALPHA 0"
+    assert mock_protocol.sent == [("alpha", b"alpha 0")] * 2
+    assert mock_protocol.sent[0][1] is mock_protocol.sent[1][1]
+
+
+def test_peary_command_send(mock_protocol: MockPearyProtocol) -> None:
+    command = PearyCommand(mock_protocol, "alpha")
+    assert [command.send() for _ in range(3)] == [1, 2, 3]
+    assert mock_protocol.recv_response(3) == b"ALPHA"
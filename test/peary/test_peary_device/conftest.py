@@ -21,9 +21,7 @@ def _mock_device() -> Callable:
         class MockPearyProtocol(PearyProtocol):
             """A Mock Peary Protocol."""
 
-            def request(
-                self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-            ) -> bytes:
+            def request(self, msg: str, *args: str) -> bytes:
                 if req:
                     assert " ".join([msg, *args]) == req
                 if resp:
@@ -31,6 +29,10 @@ def _mock_device() -> Callable:
                 else:
                     return " ".join([msg, *args]).encode("utf-8")
 
+            def request_payload(self, msg: str, payload: bytes) -> bytes:
+                assert payload.startswith(msg.encode("utf-8"))
+                return self.request(*payload.decode("utf-8").split(" "))
+
         return PearyDevice(
             index,
             MockPearyProtocol(socket.socket(), checks=PearyProtocol.Checks.CHECK_NONE),
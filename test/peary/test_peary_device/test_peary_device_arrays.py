@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import PearyInProcessTransport
+
+if TYPE_CHECKING:
+    from peary.peary_device import PearyDevice
+
+
+def _emulated_device() -> PearyDevice:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    return proxy.add_device("Caribou")
+
+
+def test_peary_device_get_registers() -> None:
+    device = _emulated_device()
+    names = [f"reg{i}" for i in range(100)]
+    for i, name in enumerate(names):
+        device.set_register(name, i - 50)
+    values = device.get_registers(names)
+    assert values.dtype == np.int64
+    assert values.tolist() == list(range(-50, 50))
+    out = np.zeros(100, dtype=np.int64)
+    assert device.get_memories(names, out=out) is out
+    assert not out.any()
+    assert device.get_registers([]).shape == (0,)
+
+
+def test_peary_device_get_voltages() -> None:
+    device = _emulated_device()
+    device.set_voltage("VDD", 1.2)
+    device.set_current("VDD", 0.5)
+    device.switch_on("VDD")
+    assert device.get_voltages(["VDD", "VSS"]).tolist() == [1.2, 0.0]
+    assert device.get_currents(["VDD"]).dtype == np.float64
+    assert device.get_currents(["VDD"])[0] == pytest.approx(0.5)
+
+
+def test_peary_device_get_registers_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    device = _emulated_device()
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        device.get_voltages(["VDD", "unknown port"])
+    monkeypatch.setattr(device.protocol, "request_many", lambda _: [b"1 2", b""])
+    with pytest.raises(ValueError, match="Invalid get_register responses"):
+        device.get_registers(["a", "b"])
+    monkeypatch.setattr(device.protocol, "request_many", lambda _: [b"1", b"1.5"])
+    with pytest.raises(ValueError, match="Invalid get_register responses"):
+        device.get_registers(["a", "b"])
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match="peary-client\\[numpy\\]"):
+        device.get_registers(["a"])
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_device_compile(mock_device: Callable) -> None:
+    command = mock_device(
+        index=1, req="device.get_voltage 1 PWR_OUT_1", resp=b"1.5"
+    ).compile("get_voltage", "PWR_OUT_1")
+    assert command.payload == b"device.get_voltage 1 PWR_OUT_1"
+    assert float(command()) == 1.5
+    assert float(command()) == 1.5
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import array
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+from peary.peary_transport import PearyInProcessTransport
+
+if TYPE_CHECKING:
+    from peary.peary_device import PearyDevice
+
+
+def _emulated_device() -> PearyDevice:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    return proxy.add_device("Caribou")
+
+
+def test_peary_device_read_memories() -> None:
+    device = _emulated_device()
+    names = [f"mem{i}" for i in range(64)]
+    device.write_memories(names, range(-32, 32))
+    values = device.read_memories(names)
+    assert isinstance(values, array.array)
+    assert values.typecode == "q"
+    assert values.tolist() == list(range(-32, 32))
+    out = np.zeros(64, dtype=np.int32)
+    device.read_memories_into(names, out.data)
+    assert out.tolist() == list(range(-32, 32))
+    buffer = bytearray(64)
+    device.read_memories_into(names[32:40], memoryview(buffer).cast("q"))
+    assert array.array("q", buffer).tolist() == list(range(8))
+    assert not device.read_memories([])
+
+
+def test_peary_device_write_memories() -> None:
+    device = _emulated_device()
+    device.protocol.stats = PearyStats()
+    device.write_memories(["a", "b"], array.array("q", [1, 2]))
+    assert device.settings == [("set_memory", "a", "1"), ("set_memory", "b", "2")]
+    assert device.protocol.stats.snapshot()["device.set_memory"].requests == 2
+    assert device.get_memory("b") == 2
+
+
+def test_peary_device_memories_errors() -> None:
+    device = _emulated_device()
+    with pytest.raises(ValueError, match=r"Buffer of shape \(1,\) cannot hold 2"):
+        device.read_memories_into(["a", "b"], array.array("q", [0]))
+    with pytest.raises(ValueError, match=r"Buffer of shape \(1, 2\) cannot hold 2"):
+        device.read_memories_into(["a", "b"], np.zeros((1, 2), dtype=np.int64).data)
+    with pytest.raises(ValueError, match="Got 1 values for 2 memories"):
+        device.write_memories(["a", "b"], [1])
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        device.read_memories(["a b"])
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_register_map import PearyRegisterMap
+from peary.peary_stats import PearyStats
+from peary.peary_transport import PearyInProcessTransport
+
+
+def test_peary_device_register_map() -> None:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    device = proxy.add_device("Caribou")
+    device.set_register("bias", 1)
+    device.set_register("trim", 2)
+    assert device.register_map is None
+    registers = device.load_register_map()
+    assert device.register_map is registers
+    assert list(registers) == ["bias", "trim"]
+    device.protocol.stats = PearyStats()
+    assert device.get_register("trim") == 2
+    with pytest.raises(PearyRegisterMap.UnknownRegisterError, match="tirm"):
+        device.get_register("tirm")
+    with pytest.raises(PearyRegisterMap.UnknownRegisterError, match="bais"):
+        device.set_register("bais", 0)
+    with pytest.raises(PearyRegisterMap.UnknownRegisterError, match="bais"):
+        device.get_registers(["trim", "bais"])
+    with device.batch() as batch:
+        with pytest.raises(PearyRegisterMap.UnknownRegisterError, match="tirm"):
+            batch.get_register("tirm")
+        with pytest.raises(PearyRegisterMap.UnknownRegisterError, match="bais"):
+            batch.set_register("bais", 0)
+        assert not batch
+    assert [*device.protocol.stats.snapshot()] == ["device.get_register"]
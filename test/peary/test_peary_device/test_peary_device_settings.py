@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_device_settings(mock_device: Callable) -> None:
+    device = mock_device(0)
+    device.set_voltage("vdd", 1.2)
+    device.switch_on("vdd")
+    device.set_register("reg", 3)
+    device.set_voltage("vdd", 1.8)
+    device.name  # noqa: B018  # pylint: disable=pointless-statement
+    assert device.settings == [
+        ("set_voltage", "vdd", "1.8"),
+        ("switch_on", "vdd"),
+        ("set_register", "reg", "3"),
+    ]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_device import PearyDevice
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_shadow import PearyRegisterShadow
+from peary.peary_stats import PearyStats
+from peary.peary_transport import PearyInProcessTransport
+
+
+def _shadowed_devices() -> tuple[PearyDevice, PearyDevice]:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    device = proxy.add_device("Caribou")
+    device.shadow = PearyRegisterShadow(volatile=["status"])
+    device.protocol.stats = PearyStats()
+    return device, PearyDevice(device.index, device.protocol)
+
+
+def _requests(device: PearyDevice, cmd: str) -> int:
+    assert device.protocol.stats is not None
+    return device.protocol.stats.snapshot()[f"device.{cmd}"].requests
+
+
+def test_peary_device_shadow_reads() -> None:
+    device, other = _shadowed_devices()
+    device.set_register("reg", 3)
+    other.set_register("reg", 4)
+    assert device.get_register("reg") == 3
+    device.shadow.invalidate("reg")  # type: ignore[union-attr]
+    assert device.get_register("reg") == 4
+    assert device.get_register("reg") == 4
+    assert _requests(device, "get_register") == 1
+    assert device.shadow is not None
+    assert device.shadow.stats == (2, 1, 1)
+
+
+def test_peary_device_shadow_volatile() -> None:
+    device, other = _shadowed_devices()
+    device.set_register("status", 1)
+    other.set_register("status", 2)
+    assert device.get_register("status") == 2
+    assert device.get_register("status") == 2
+    assert _requests(device, "get_register") == 2
+
+
+@pytest.mark.parametrize("cmd", ["reset", "configure", "power_off"])
+def test_peary_device_shadow_invalidating(cmd: str) -> None:
+    device, other = _shadowed_devices()
+    device.set_register("reg", 3)
+    other.set_register("reg", 4)
+    getattr(device, cmd)()
+    assert device.get_register("reg") == other.get_register("reg") != 3
+
+
+def test_peary_device_shadow_failed_write() -> None:
+    device, _ = _shadowed_devices()
+    device.set_register("reg", 3)
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        device.set_register("reg", "invalid")  # type: ignore[arg-type]
+    assert device.shadow is not None
+    assert device.shadow.stats.entries == 0
+    device.shadow = None
+    device.set_register("reg", 5)
+    assert device.get_register("reg") == 5
+
+
+def test_peary_device_shadow_restore() -> None:
+    device, other = _shadowed_devices()
+    device.set_register("reg", 3)
+    other.set_register("reg", 0)
+    device.restore(device.index, replay_settings=False)
+    assert device.get_register("reg") == 0
+
+
+def test_peary_device_shadow_batch_write() -> None:
+    device, other = _shadowed_devices()
+    device.set_register("reg", 3)
+    with device.batch() as batch:
+        batch.set_register("reg", 4)
+        batch.set_register("other", "invalid")  # type: ignore[arg-type]
+    other.set_register("reg", 5)
+    assert device.get_register("reg") == 4
+    assert device.shadow is not None
+    assert device.shadow.stats == (1, 0, 1)
+
+
+@pytest.mark.parametrize("cmd", ["reset", "configure", "power_off"])
+def test_peary_device_shadow_batch_invalidating(cmd: str) -> None:
+    device, other = _shadowed_devices()
+    device.set_register("reg", 3)
+    with device.batch() as batch:
+        getattr(batch, cmd)()
+    other.set_register("reg", 4)
+    assert device.get_register("reg") == 4
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_shadow import PearyRegisterShadow
+from peary.peary_stats import PearyStats
+from peary.peary_transport import PearyInProcessTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from peary.peary_device import PearyDevice
+
+
+def _emulated_device() -> PearyDevice:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    device = proxy.add_device("Caribou")
+    for i in range(4):
+        device.set_register(f"reg{i}", i)
+    device.protocol.stats = PearyStats()
+    return device
+
+
+def _requests(device: PearyDevice) -> dict[str, int]:
+    assert device.protocol.stats is not None
+    snapshot = device.protocol.stats.snapshot()
+    device.protocol.stats.reset()
+    return {msg[7:]: summary.requests for msg, summary in snapshot.items()}
+
+
+def test_peary_device_snapshot_registers() -> None:
+    device = _emulated_device()
+    snapshot = device.snapshot_registers()
+    assert snapshot == {"reg0": 0, "reg1": 1, "reg2": 2, "reg3": 3}
+    assert _requests(device) == {"list_registers": 1, "get_register": 4}
+    device.load_register_map()
+    assert list(device.snapshot_registers()) == list(snapshot)
+    assert device.snapshot_registers(["reg3"]) == {"reg3": 3}
+
+
+def test_peary_device_apply_registers() -> None:
+    device = _emulated_device()
+    snapshot = device.snapshot_registers()
+    device.set_register("reg1", 10)
+    device.set_register("reg2", 20)
+    _requests(device)
+    assert device.apply_registers(snapshot) == {"reg1": 1, "reg2": 2}
+    assert _requests(device) == {"get_register": 4, "set_register": 2}
+    assert device.snapshot_registers() == snapshot
+    assert ("set_register", "reg1", "1") in device.settings
+    assert not device.apply_registers(snapshot)
+
+
+def test_peary_device_apply_registers_shadow() -> None:
+    device = _emulated_device()
+    device.shadow = PearyRegisterShadow()
+    device.set_register("reg0", 5)
+    _requests(device)
+    assert device.apply_registers({"reg0": 0, "reg1": 1}) == {"reg0": 0}
+    assert _requests(device) == {"get_register": 1, "set_register": 1}
+    assert device.get_register("reg0") == 0
+    assert device.shadow.stats == (2, 1, 2)
+    assert not _requests(device)
+
+
+def test_peary_device_apply_registers_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    device = _emulated_device()
+    device.shadow = PearyRegisterShadow()
+    device.snapshot_registers()
+    request_many = device.protocol.request_many
+
+    def _fail_first(
+        requests: Iterable[tuple[str, Sequence[str]]],
+    ) -> list[bytes | Exception]:
+        responses = request_many(requests)
+        responses[0] = PearyProtocol.ResponseStatusError("failed")
+        return responses
+
+    monkeypatch.setattr(device.protocol, "request_many", _fail_first)
+    with pytest.raises(PearyProtocol.ResponseStatusError, match="failed"):
+        device.apply_registers({"reg0": 5, "reg1": 1, "reg2": 7})
+    assert device.shadow.stats.entries == 3
+    assert device.get_register("reg2") == 7
+    assert ("set_register", "reg2", "7") in device.settings
+    assert ("set_register", "reg0", "5") not in device.settings
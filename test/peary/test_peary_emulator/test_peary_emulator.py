@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import runpy
+import socket
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary import peary_emulator
+from peary.async_peary_client import AsyncPearyClient
+from peary.async_peary_protocol import AsyncPearyProtocol
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulatedDevice, PearyEmulator
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_peary_emulator_handle_proxy_commands() -> None:
+    emulator = PearyEmulator()
+    assert emulator.handle(b"") == (b"", PearyProtocol.STATUS_OK)
+    assert emulator.handle(b"protocol_version") == (PearyProtocol.VERSION, 0)
+    assert emulator.handle(b"add_device Caribou") == (b"0", 0)
+    assert emulator.handle(b"add_device H35") == (b"1", 0)
+    assert emulator.handle(b"list_devices") == (b"Caribou H35", 0)
+    assert [device.name for device in emulator.devices] == ["Caribou", "H35"]
+    assert emulator.handle(b"device.name 1") == (b"H35", 0)
+    assert emulator.handle(b"clear_devices") == (b"", 0)
+    assert emulator.handle(b"list_devices") == (b"", 0)
+
+
+def test_peary_emulator_handle_errors() -> None:
+    emulator = PearyEmulator()
+    assert emulator.handle(b"unknown") == (b"Unknown command: unknown", 1)
+    assert emulator.handle(b"device.name 0")[1] == PearyEmulator.STATUS_ERROR
+    assert emulator.handle(b"device.name zero")[1] == PearyEmulator.STATUS_ERROR
+    assert emulator.handle(b"add_device")[1] == PearyEmulator.STATUS_ERROR
+    assert emulator.handle(b"protocol_version extra")[1] == PearyEmulator.STATUS_ERROR
+    assert emulator.handle(b"\xff")[1] == PearyEmulator.STATUS_ERROR
+    emulator.handle(b"add_device Caribou")
+    assert emulator.handle(b"device.name -1") == (b"Invalid device index: -1", 1)
+    assert emulator.handle(b"device.unknown 0") == (
+        b"Unknown device command: unknown",
+        1,
+    )
+    assert emulator.handle(b"device.set_register 0 reg") == (
+        b"Invalid arguments for set_register: reg",
+        1,
+    )
+    assert emulator.handle(b"device.set_register 0 reg x") == (
+        b"Invalid arguments for set_register: reg x",
+        1,
+    )
+
+
+def test_peary_emulated_device_registers() -> None:
+    device = PearyEmulatedDevice("Caribou")
+    assert device.handle("get_register", ["reg_b"]) == b"0"
+    assert device.handle("set_register", ["reg_b", "0x10"]) == b""
+    assert device.handle("set_register", ["reg_a", "3"]) == b""
+    assert device.handle("set_memory", ["mem", "7"]) == b""
+    assert device.handle("get_register", ["reg_b"]) == b"16"
+    assert device.handle("get_memory", ["mem"]) == b"7"
+    assert device.handle("list_registers", []) == b"reg_a reg_b"
+    assert device.handle("reset", []) == b""
+    assert device.handle("list_registers", []) == b""
+    assert device.handle("get_memory", ["mem"]) == b"7"
+
+
+def test_peary_emulated_device_power() -> None:
+    device = PearyEmulatedDevice("Caribou")
+    assert device.handle("set_voltage", ["VDD", "1.2"]) == b""
+    assert device.handle("set_current", ["VDD", "0.5"]) == b""
+    assert device.handle("get_voltage", ["VDD"]) == b"0.0"
+    assert device.handle("switch_on", ["VDD"]) == b""
+    assert device.handle("get_voltage", ["VDD"]) == b"1.2"
+    assert device.handle("get_current", ["VDD"]) == b"0.5"
+    assert device.handle("get_voltage", ["VCC"]) == b"0.0"
+    assert device.handle("switch_off", ["VDD"]) == b""
+    assert device.handle("get_current", ["VDD"]) == b"0.0"
+
+
+def test_peary_emulated_device_states() -> None:
+    device = PearyEmulatedDevice("Caribou")
+    for cmd in ("power_on", "configure", "daq_start", "daq_stop"):
+        assert device.handle(cmd, []) == b""
+    assert device.states == {"powered": True, "configured": True, "daq": False}
+    device.handle("power_off", [])
+    assert not device.states["powered"]
+
+
+def test_peary_emulated_device_i2c() -> None:
+    device = PearyEmulatedDevice("Caribou")
+    assert device.handle("car_i2c_write", ["0", "0x40", "2", "1", "0x1ff"]) == b""
+    assert device.handle("car_i2c_read", ["0", "0x40", "1", "4"]) == b"0 1 255 0"
+    assert device.handle("car_i2c_read", ["1", "0x40", "2", "1"]) == b"0"
+
+
+def test_peary_emulator_async_client() -> None:
+    async def _test() -> None:
+        emulator = PearyEmulator(latency=0.001, jitter=0.002, fragment_size=3, seed=1)
+        async with await emulator.start() as server:
+            port = server.sockets[0].getsockname()[1]
+            async with AsyncPearyClient("127.0.0.1", port) as proxy:
+                device = await proxy.add_device("Caribou")
+                assert await device.name() == "Caribou"
+                await device.set_voltage("VDD", 1.5)
+                await device.switch_on("VDD")
+                assert await device.get_voltage("VDD") == pytest.approx(1.5)
+                assert (
+                    await proxy.protocol.request_many(
+                        ("device.set_register", ("0", f"reg{i}", str(i)))
+                        for i in range(64)
+                    )
+                    == [b""] * 64
+                )
+                assert await asyncio.gather(
+                    *(device.get_register(f"reg{i}") for i in range(64))
+                ) == list(range(64))
+
+    asyncio.run(_test())
+
+
+def test_peary_emulator_async_client_errors() -> None:
+    async def _test() -> None:
+        async with await PearyEmulator().start() as server:
+            port = server.sockets[0].getsockname()[1]
+            async with AsyncPearyClient("127.0.0.1", port) as proxy:
+                with pytest.raises(AsyncPearyProtocol.ResponseStatusError):
+                    await proxy.protocol.request("device.name", "0")
+
+    asyncio.run(_test())
+
+
+def test_peary_emulator_client(emulator_thread: int) -> None:
+    with PearyClient("127.0.0.1", emulator_thread) as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 5)
+        assert device.get_register("reg") == 5
+        assert proxy.list_remote_devices() == b"Caribou"
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            proxy.protocol.request_payload("raw", b"\xff")
+        assert device.get_register("reg") == 5
+
+
+def test_peary_emulator_invalid_frame() -> None:
+    async def _test() -> None:
+        async with await PearyEmulator().start() as server:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(PearyProtocol.STRUCT_PREFIX.pack(0, 1, 0))
+            assert await reader.read() == b""
+            writer.close()
+            await writer.wait_closed()
+
+    asyncio.run(_test())
+
+
+def test_peary_emulator_closed_connection() -> None:
+    async def _test() -> None:
+        async with await PearyEmulator(latency=0.05).start() as server:
+            port = server.sockets[0].getsockname()[1]
+            with socket.create_connection(("127.0.0.1", port)) as sock:
+                sock.sendall(PearyProtocol.encode(b"protocol_version", 1, 0))
+            await asyncio.sleep(0.1)
+
+    asyncio.run(_test())
+
+
+def test_peary_emulator_main(monkeypatch: pytest.MonkeyPatch) -> None:
+    arguments: list[tuple[PearyEmulator, str, int, str | None]] = []
+
+    async def _serve_forever(
+        self: PearyEmulator, host: str, port: int, *, path: str | None
+    ) -> None:
+        arguments.append((self, host, port, path))
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(PearyEmulator, "serve_forever", _serve_forever)
+    peary_emulator.main(["--port", "4000", "--latency", "0.5", "--seed", "1"])
+    peary_emulator.main(["--unix", "peary.sock"])
+    assert arguments[0][1:] == ("127.0.0.1", 4000, None)
+    assert arguments[1][1:] == ("127.0.0.1", 12345, "peary.sock")
+
+
+def test_peary_emulator_serve_forever(tmp_path: Path) -> None:
+    async def _test(path: str | None) -> None:
+        task = asyncio.create_task(PearyEmulator().serve_forever(path=path))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        assert task.cancelled()
+
+    asyncio.run(_test(None))
+    asyncio.run(_test(str(tmp_path / "peary.sock")))
+
+
+def test_peary_emulator_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["peary_emulator", "--help"])
+    monkeypatch.delitem(sys.modules, "peary.peary_emulator")
+    with pytest.raises(SystemExit):
+        runpy.run_module("peary.peary_emulator", run_name="__main__")
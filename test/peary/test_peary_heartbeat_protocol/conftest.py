@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_emulator import PearyEmulator
+from peary.peary_heartbeat_protocol import PearyHeartbeatProtocol
+from peary.peary_transport import PearyInProcessTransport
+
+
+@pytest.fixture(name="client")
+def _client() -> PearyClient:
+    return PearyClient(
+        PearyInProcessTransport(PearyEmulator()), protocol_class=PearyHeartbeatProtocol
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_emulator import PearyEmulator
+from peary.peary_heartbeat_protocol import PearyHeartbeatProtocol
+from peary.peary_reconnecting_protocol import (
+    PearyReconnectingProtocol,
+    PearyReconnectPolicy,
+)
+from peary.peary_transport import PearyInProcessSocket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_client import PearyClient
+
+
+def _wait_until(predicate: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not predicate():  # pylint: disable=while-used
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _protocol() -> tuple[PearyHeartbeatProtocol, PearyInProcessSocket]:
+    sock = PearyInProcessSocket(PearyEmulator())
+    sock.connect("")
+    return PearyHeartbeatProtocol(sock), sock
+
+
+def test_peary_heartbeat_protocol_keep_alive(client: PearyClient) -> None:
+    with client as proxy:
+        assert isinstance(proxy.protocol, PearyHeartbeatProtocol)
+        protocol = proxy.protocol
+        assert protocol.interval == 5.0
+        assert protocol.round_trip_times is None
+        protocol.interval = 0.001
+        _wait_until(
+            lambda: bool((rtt := protocol.round_trip_times) and rtt.samples > 2)
+        )
+        rtt = protocol.round_trip_times
+        assert rtt
+        assert 0 <= rtt.minimum <= rtt.mean <= rtt.maximum
+        assert rtt.deviation >= 0
+        assert protocol.healthy
+        assert not protocol.failures
+        assert protocol.error is None
+
+
+def test_peary_heartbeat_protocol_idle_only(client: PearyClient) -> None:
+    with client as proxy:
+        assert isinstance(proxy.protocol, PearyHeartbeatProtocol)
+        proxy.protocol.interval = 0.05
+        device = proxy.add_device("Caribou")
+        command = device.compile("get_register", "reg")
+        deadline = time.monotonic() + 0.2
+        while time.monotonic() < deadline:  # pylint: disable=while-used
+            device.set_register("reg", 1)
+            assert command() == b"1"
+            tag = proxy.protocol.send_request("")
+            assert proxy.protocol.recv_response(tag) == b""
+            assert proxy.protocol.request_many([("", ())]) == [b""]
+            assert proxy.protocol.request_stream("").read() == b""
+        assert proxy.protocol.round_trip_times is None
+
+
+def test_peary_heartbeat_protocol_reconnect(client: PearyClient) -> None:
+    with client as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 3)
+        assert isinstance(proxy.protocol, PearyHeartbeatProtocol)
+        protocol = proxy.protocol
+        client.socket.close()
+        protocol.interval = 0.001
+        _wait_until(lambda: protocol.reconnects == 1)
+        assert protocol.failures >= 1
+        assert isinstance(protocol.error, BrokenPipeError)
+        assert device.index == 1
+        assert device.get_register("reg") == 3
+
+
+def test_peary_heartbeat_protocol_unhealthy() -> None:
+    protocol, sock = _protocol()
+    sock.close()
+    protocol.interval = 0.001
+    _wait_until(lambda: protocol.failures > 1)
+    assert not protocol.healthy
+    assert isinstance(protocol.error, BrokenPipeError)
+    protocol.close()
+
+
+def _refuse() -> PearyInProcessSocket:
+    raise ConnectionRefusedError
+
+
+def test_peary_heartbeat_protocol_reconnect_error() -> None:
+    protocol, sock = _protocol()
+    protocol.policy = PearyReconnectPolicy(attempts=1)
+    protocol.connect = _refuse
+    sock.close()
+    protocol.interval = 0.001
+    _wait_until(
+        lambda: isinstance(protocol.error, PearyReconnectingProtocol.ReconnectError)
+    )
+    assert not protocol.healthy
+    protocol.close()
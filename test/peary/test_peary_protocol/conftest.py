@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-import select
 import socket as socket_module
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 import pytest
 
 from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
-    from socket import socket as socket_type
+    from collections.abc import Callable, Generator, Iterable
 
+    from _typeshed import WriteableBuffer
     from typing_extensions import Buffer
 
 
@@ -21,7 +20,7 @@ class MockSocketInterface(socket_module.socket):
 
 
 @pytest.fixture(name="socket_class_context")
-def _socket_class_context(monkeypatch: pytest.MonkeyPatch) -> Callable:
+def _socket_class_context() -> Callable:
 
     @contextmanager
     def _socket_class_contextmanager(
@@ -30,26 +29,36 @@ def _socket_class_context(monkeypatch: pytest.MonkeyPatch) -> Callable:
         mock_recv: Callable[[int], bytes] = lambda _: PearyProtocol.encode(
             b"", 1, PearyProtocol.STATUS_OK
         ),
-        mock_select: Callable[
-            [list[socket_type]], tuple[list, list, list]
-        ] = lambda *_: ([], [], []),
     ) -> Generator[type[MockSocketInterface]]:
 
         class MockSocket(MockSocketInterface):
 
-            # pylint: disable-next=W0613
-            def send(self, data: Buffer, flags: int = 0) -> int:  # noqa: ARG002
-                return mock_send(cast("bytes", data))
+            pending = bytearray()
+
+            def sendmsg(self, buffers: Iterable[Buffer], *_: object) -> int:
+                return mock_send(b"".join(buffers))
 
             # pylint: disable-next=W0613
             def recv(self, size: int, flags: int = 0) -> bytes:  # noqa: ARG002
                 return mock_recv(size)
 
+            def recv_into(  # pylint: disable=unused-argument
+                self,
+                buffer: WriteableBuffer,
+                nbytes: int = 0,  # noqa: ARG002
+                flags: int = 0,  # noqa: ARG002
+            ) -> int:
+                view = memoryview(buffer)
+                if not self.pending:
+                    self.pending = bytearray(self.recv(len(view)))
+                size = min(len(view), len(self.pending))
+                view[:size] = self.pending[:size]
+                del self.pending[:size]
+                return size
+
             def settimeout(self, value: float | None = None) -> None:
                 MockSocket.timeout = value
 
-        with monkeypatch.context() as m:
-            m.setattr(select, "select", mock_select)
-            yield MockSocket
+        yield MockSocket
 
     return _socket_class_contextmanager
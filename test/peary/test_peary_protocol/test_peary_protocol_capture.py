@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.peary_capture import PearyCaptureReader, PearyCaptureWriter
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def test_peary_protocol_capture(socket_class_context: Callable, tmp_path: Path) -> None:
+    path = tmp_path / "capture.pcap"
+    mock_recv_generator = iter(
+        PearyProtocol.encode(payload, ii, status)
+        for ii, payload, status in ((1, b"1", 0), (2, b"", 1), (3, b"3", 0))
+    )
+    with (
+        socket_class_context(
+            mock_recv=lambda _: next(mock_recv_generator)
+        ) as socket_class,
+        PearyCaptureWriter(path) as capture,
+    ):
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        assert protocol.capture is None
+        protocol.capture = capture
+        assert protocol.capture is capture
+        protocol.request_many([("alpha", ("0",)), ("beta", ())])
+        protocol.capture = None
+        protocol.request("gamma")
+    with PearyCaptureReader(path) as reader:
+        assert [record[1:] for record in reader] == [
+            (PearyCaptureWriter.Direction.SENT, 1, 0, b"alpha 0"),
+            (PearyCaptureWriter.Direction.SENT, 2, 0, b"beta"),
+            (PearyCaptureWriter.Direction.RECEIVED, 1, 0, b"1"),
+            (PearyCaptureWriter.Direction.RECEIVED, 2, 1, b""),
+        ]
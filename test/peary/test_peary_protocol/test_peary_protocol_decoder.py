@@ -13,6 +13,19 @@ def test_peary_protocol_decode_payload() -> None:
     )
 
 
+def test_peary_protocol_decode_payload_empty() -> None:
+    assert PearyProtocol.decode(b"\x00\x00\x00\x04\x00\x00\x00\x00").payload == b""
+
+
+def test_peary_protocol_decode_payload_memoryview() -> None:
+    decoded = PearyProtocol.decode(
+        memoryview(bytearray(b"\x00\x00\x00\x09\x00\x01\x00\x00alpha"))
+    )
+    assert decoded.payload == b"alpha"
+    assert isinstance(decoded.payload, bytes)
+    assert decoded.tag == 1
+
+
 def test_peary_protocol_decode_tag() -> None:
     assert PearyProtocol.decode(b"\x00\x00\x00\x04\x00\x00\x00\x00").tag == 0
     assert PearyProtocol.decode(b"\x00\x00\x00\x04\x00\x01\x00\x00").tag == 1
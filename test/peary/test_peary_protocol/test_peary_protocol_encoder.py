@@ -25,3 +25,10 @@ def test_peary_protocol_encode_length() -> None:
     assert PearyProtocol.encode(b"1", 0, 0) == b"\x00\x00\x00\x05\x00\x00\x00\x001"
     assert PearyProtocol.encode(b"12", 0, 0) == b"\x00\x00\x00\x06\x00\x00\x00\x0012"
     assert PearyProtocol.encode(b"123", 0, 0) == b"\x00\x00\x00\x07\x00\x00\x00\x00123"
+
+
+def test_peary_protocol_encode_prefix() -> None:
+    assert PearyProtocol.encode_prefix(0, 1, 2) == b"\x00\x00\x00\x04\x00\x01\x00\x02"
+    assert PearyProtocol.encode_prefix(5, 0, 0) + b"alpha" == PearyProtocol.encode(
+        b"alpha", 0, 0
+    )
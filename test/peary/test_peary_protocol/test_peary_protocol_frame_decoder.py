@@ -0,0 +1,118 @@
+import pytest
+
+from peary.peary_frame_decoder import PearyFrameDecoder
+from peary.peary_protocol import PearyProtocol
+
+
+def test_peary_frame_decoder_empty() -> None:
+    decoder = PearyFrameDecoder()
+    assert decoder.next_frame() is None
+    assert not list(decoder)
+    assert decoder.buffered == 0
+
+
+def test_peary_frame_decoder_single_frame() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(PearyProtocol.encode(b"alpha", 1, 2))
+    assert decoder.next_frame() == (b"alpha", 1, 2)
+    assert decoder.next_frame() is None
+    assert decoder.buffered == 0
+
+
+def test_peary_frame_decoder_empty_payload() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(PearyProtocol.encode(b"", 1, 0))
+    assert decoder.next_frame() == (b"", 1, 0)
+
+
+def test_peary_frame_decoder_byte_by_byte() -> None:
+    decoder = PearyFrameDecoder()
+    data = PearyProtocol.encode(b"alpha", 1, 0)
+    for i, byte in enumerate(data):
+        assert decoder.next_frame() is None
+        decoder.feed(bytes([byte]))
+        assert decoder.buffered == (i + 1) % len(data) or len(data)
+    assert decoder.next_frame() == (b"alpha", 1, 0)
+
+
+def test_peary_frame_decoder_multiple_frames() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(
+        PearyProtocol.encode(b"alpha", 1, 0)
+        + PearyProtocol.encode(b"beta", 2, 0)
+        + PearyProtocol.encode(b"gamma", 3, 0)[:6]
+    )
+    assert list(decoder) == [(b"alpha", 1, 0), (b"beta", 2, 0)]
+    assert decoder.buffered == 6
+    decoder.feed(PearyProtocol.encode(b"gamma", 3, 0)[6:])
+    assert list(decoder) == [(b"gamma", 3, 0)]
+
+
+def test_peary_frame_decoder_payload_type() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(memoryview(PearyProtocol.encode(b"alpha", 1, 0)))
+    frame = decoder.next_frame()
+    assert frame is not None
+    assert isinstance(frame.payload, bytes)
+
+
+def test_peary_frame_decoder_large_frame() -> None:
+    decoder = PearyFrameDecoder(8)
+    payload = bytes(range(256)) * 256
+    data = PearyProtocol.encode(payload, 1, 0)
+    for i in range(0, len(data), 1000):
+        decoder.feed(data[i : i + 1000])
+    assert decoder.next_frame() == (payload, 1, 0)
+
+
+def test_peary_frame_decoder_compaction() -> None:
+    decoder = PearyFrameDecoder(32)
+    data = b"".join(PearyProtocol.encode(b"alpha", tag, 0) for tag in range(100))
+    for i in range(0, len(data), 7):
+        decoder.feed(data[i : i + 7])
+        for frame in decoder:
+            assert frame.payload == b"alpha"
+    assert decoder.buffered == 0
+
+
+def test_peary_frame_decoder_get_buffer() -> None:
+    decoder = PearyFrameDecoder(16)
+    data = PearyProtocol.encode(b"alpha", 1, 0)
+    with decoder.get_buffer() as view:
+        view[:4] = data[:4]
+    decoder.buffer_updated(4)
+    with decoder.get_buffer() as view:
+        assert len(view) >= len(data) - 4
+        view[: len(data) - 4] = data[4:]
+    decoder.buffer_updated(len(data) - 4)
+    assert decoder.next_frame() == (b"alpha", 1, 0)
+
+
+def test_peary_frame_decoder_get_buffer_size() -> None:
+    decoder = PearyFrameDecoder(16)
+    with decoder.get_buffer(100) as view:
+        assert len(view) >= 100
+
+
+def test_peary_frame_decoder_invalid_length() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(b"\x00\x00\x00\x03\x00\x00\x00")
+    with pytest.raises(PearyProtocol.DecodeError, match="Invalid frame length: 3"):
+        decoder.next_frame()
+    decoder.feed(b"\x00")
+    with pytest.raises(PearyProtocol.DecodeError, match="Invalid frame length: 3"):
+        decoder.peek_header()
+
+
+def test_peary_frame_decoder_peek_header() -> None:
+    decoder = PearyFrameDecoder()
+    decoder.feed(PearyProtocol.encode(b"alpha", 1, 2)[:7])
+    assert decoder.peek_header() is None
+    decoder.feed(b"\x02al")
+    assert decoder.peek_header() == (5, 1, 2)
+    decoder.discard(PearyProtocol.STRUCT_PREFIX.size)
+    view = memoryview(bytearray(4))
+    assert decoder.readinto(view) == 2
+    assert view[:2] == b"al"
+    assert decoder.buffered == 0
+    assert len(decoder.reserve(1)) >= 1
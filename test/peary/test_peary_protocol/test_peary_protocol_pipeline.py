@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame_decoder import DecodedBytes
+from peary.peary_protocol import PearyProtocol, PearyRequestTracker
+from peary.peary_stats import PearyStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_protocol_pipeline_send_request_tags(
+    socket_class_context: Callable,
+) -> None:
+    sent = []
+
+    def mock_send(data: bytes) -> int:
+        sent.append(data)
+        return len(data)
+
+    with socket_class_context(mock_send=mock_send) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        assert [protocol.send_request("alpha", str(ii)) for ii in range(3)] == [1, 2, 3]
+        assert protocol.in_flight == 3
+    assert sent == [
+        PearyProtocol.encode(f"alpha {ii}".encode(), ii + 1, PearyProtocol.STATUS_OK)
+        for ii in range(3)
+    ]
+
+
+def test_peary_protocol_pipeline_recv_response_in_order(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(f"{ii}".encode(), ii, PearyProtocol.STATUS_OK)
+        for ii in range(1, 4)
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        tags = [protocol.send_request("") for _ in range(3)]
+        assert [protocol.recv_response(tag) for tag in tags] == [b"1", b"2", b"3"]
+        assert protocol.in_flight == 0
+
+
+def test_peary_protocol_pipeline_recv_response_out_of_order(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(f"{ii}".encode(), ii, PearyProtocol.STATUS_OK)
+        for ii in (3, 1, 2)
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        tags = [protocol.send_request("") for _ in range(3)]
+        assert protocol.recv_response(tags[1]) == b"2"
+        assert protocol.in_flight == 0
+        assert protocol.recv_response(tags[2]) == b"3"
+        assert protocol.recv_response(tags[0]) == b"1"
+
+
+def test_peary_protocol_pipeline_max_in_flight(socket_class_context: Callable) -> None:
+    events = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, PearyProtocol.STATUS_OK) for ii in range(1, 6)
+    )
+
+    def mock_send(data: bytes) -> int:
+        events.append("send")
+        return len(data)
+
+    def mock_recv(_: int) -> bytes:
+        events.append("recv")
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_send=mock_send, mock_recv=mock_recv) as socket_class:
+        protocol = PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE, max_in_flight=2
+        )
+        assert protocol.max_in_flight == 2
+        tags = [protocol.send_request("") for _ in range(5)]
+        assert protocol.in_flight == 2
+        assert [protocol.recv_response(tag) for tag in tags] == [b""] * 5
+    assert (
+        events
+        == ["send", "send", "recv", "send", "recv", "send", "recv", "send"]
+        + ["recv"] * 2
+    )
+
+
+def test_peary_protocol_pipeline_max_in_flight_limits(
+    socket_class_context: Callable,
+) -> None:
+    with socket_class_context() as socket_class:
+        for max_in_flight, expected in ((0, 1), (1, 1), (0x10000, 0xFFFF)):
+            assert (
+                PearyProtocol(
+                    socket_class(),
+                    checks=PearyProtocol.Checks.CHECK_NONE,
+                    max_in_flight=max_in_flight,
+                ).max_in_flight
+                == expected
+            )
+
+
+def test_peary_protocol_pipeline_tag_wraparound(socket_class_context: Callable) -> None:
+    tags = []
+
+    def mock_send(data: bytes) -> int:
+        tags.append(PearyProtocol.decode(data).tag)
+        return len(data)
+
+    with socket_class_context(
+        mock_send=mock_send,
+        mock_recv=lambda _: PearyProtocol.encode(
+            b"", tags[-1], PearyProtocol.STATUS_OK
+        ),
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        for _ in range(PearyProtocol.TAG_MAX + 1):
+            protocol.request("")
+    assert tags[0] == 1
+    assert tags[-2] == PearyProtocol.TAG_MAX
+    assert tags[-1] == 1
+
+
+def test_peary_protocol_pipeline_recv_response_unknown_tag(
+    socket_class_context: Callable,
+) -> None:
+    with socket_class_context() as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        with pytest.raises(
+            PearyProtocol.ResponseSequenceError, match="Unknown request tag: 1"
+        ):
+            protocol.recv_response(1)
+
+
+def test_peary_protocol_pipeline_recv_response_duplicate_tag(
+    socket_class_context: Callable,
+) -> None:
+    with socket_class_context(
+        mock_recv=lambda _: PearyProtocol.encode(b"", 1, PearyProtocol.STATUS_OK)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.send_request("alpha")
+        tag = protocol.send_request("beta")
+        with pytest.raises(
+            PearyProtocol.ResponseSequenceError,
+            match="Recieved out of order repsonse from 'beta': 1 != 2",
+        ):
+            protocol.recv_response(tag)
+
+
+def test_peary_protocol_pipeline_recv_response_status_error(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, status) for ii, status in ((1, 1), (2, 0))
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        tags = [protocol.send_request(msg) for msg in ("alpha", "beta")]
+        with pytest.raises(
+            PearyProtocol.ResponseStatusError, match="Failed response status 1"
+        ):
+            protocol.recv_response(tags[0])
+        assert not protocol.recv_response(tags[1])
+
+
+def test_peary_protocol_pipeline_tag_wraparound_skips_used_tags() -> None:
+    tracker = PearyRequestTracker()
+    assert tracker.encode_request("pending", b"")[0] == 1
+    assert tracker.encode_request("held", b"")[0] == 2
+    assert tracker.encode_request("late", b"")[0] == 3
+    tracker.add_response(DecodedBytes(b"", 2, PearyProtocol.STATUS_OK), 2)
+    tracker.abandon(3)
+    for _ in range(PearyProtocol.TAG_MAX - 3):
+        tag, _ = tracker.encode_request("", b"")
+        tracker.add_response(DecodedBytes(b"", tag, PearyProtocol.STATUS_OK), tag)
+        tracker.pop_response(tag)
+    assert tracker.encode_request("next", b"")[0] == 4
+
+
+def test_peary_protocol_pipeline_no_free_tags() -> None:
+    tracker = PearyRequestTracker(PearyProtocol.TAG_MAX)
+    for _ in range(PearyProtocol.TAG_MAX):
+        tracker.encode_request("", b"")
+    with pytest.raises(PearyProtocol.RequestSendError, match="No free request tag"):
+        tracker.encode_request("", b"")
+
+
+def test_peary_protocol_pipeline_abandoned_max() -> None:
+    tracker = PearyRequestTracker(PearyProtocol.TAG_MAX)
+    tracker.stats = PearyStats()
+    for _ in range(PearyRequestTracker.ABANDONED_MAX + 1):
+        tracker.abandon(tracker.encode_request("slow", b"")[0])
+    assert tracker.abandoned == PearyRequestTracker.ABANDONED_MAX
+    for _ in range(PearyProtocol.TAG_MAX - PearyRequestTracker.ABANDONED_MAX - 1):
+        tracker.encode_request("", b"")
+    assert tracker.encode_request("reused", b"")[0] == 1
+    with pytest.raises(PearyProtocol.RequestSendError, match="No free request tag"):
+        tracker.encode_request("", b"")
@@ -8,7 +8,6 @@ from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from socket import socket as socket_type
 
 
 def test_peary_protocol_recv_buffer_oversized(socket_class_context: Callable) -> None:
@@ -16,56 +15,99 @@ def test_peary_protocol_recv_buffer_oversized(socket_class_context: Callable) ->
     with socket_class_context(mock_recv=lambda _: encoded_message) as socket_class:
         assert (
             PearyProtocol(
-                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
-            ).request("alpha", buffer_size=len(encoded_message) + 1)
+                socket_class(),
+                checks=PearyProtocol.Checks.CHECK_NONE,
+                buffer_size=len(encoded_message) + 1,
+            ).request("alpha")
             == b"alpha"
         )
 
 
 def test_peary_protocol_recv_buffer_equalsized(socket_class_context: Callable) -> None:
     encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
-    with socket_class_context(
-        mock_recv=lambda _: encoded_message, mock_select=lambda *_: ([], [], [])
-    ) as socket_class:
+    with socket_class_context(mock_recv=lambda _: encoded_message) as socket_class:
         assert (
             PearyProtocol(
-                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
-            ).request("alpha", buffer_size=len(encoded_message))
+                socket_class(),
+                checks=PearyProtocol.Checks.CHECK_NONE,
+                buffer_size=len(encoded_message),
+            ).request("alpha")
             == b"alpha"
         )
 
 
 def test_peary_protocol_recv_buffer_undersized(socket_class_context: Callable) -> None:
     encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
-    mock_recv_generator = iter(bytes([ii]) for ii in encoded_message)
-    mock_select_generator = iter(range(len(encoded_message)))
+    with socket_class_context(mock_recv=lambda _: encoded_message) as socket_class:
+        assert (
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE, buffer_size=1
+            ).request("alpha")
+            == b"alpha"
+        )
+
 
-    def mock_recv(_: int) -> bytes:
-        return next(mock_recv_generator)
+def test_peary_protocol_recv_buffer_reused(socket_class_context: Callable) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(payload, ii + 1, PearyProtocol.STATUS_OK)
+        for ii, payload in enumerate([b"alpha", b"beta" * 10, b"gamma"])
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE, buffer_size=16
+        )
+        assert protocol.request("") == b"alpha"
+        assert protocol.request("") == b"beta" * 10
+        assert protocol.request("") == b"gamma"
 
-    def mock_select(
-        rlist: list[socket_type], *_: list[socket_type]
-    ) -> tuple[list, ...]:
-        if next(mock_select_generator) < len(encoded_message) - 1:
-            return rlist, [], []
-        else:
-            return [], [], []
 
+def test_peary_protocol_recv_fragmented(socket_class_context: Callable) -> None:
+    encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
+    mock_recv_generator = iter(bytes([ii]) for ii in encoded_message)
     with socket_class_context(
-        mock_recv=mock_recv, mock_select=mock_select
+        mock_recv=lambda _: next(mock_recv_generator)
     ) as socket_class:
         assert (
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
-            ).request("alpha", buffer_size=1)
+            ).request("alpha")
             == b"alpha"
         )
 
 
+def test_peary_protocol_recv_exact_frame(socket_class_context: Callable) -> None:
+    encoded_messages = b"".join(
+        PearyProtocol.encode(payload, ii + 1, PearyProtocol.STATUS_OK)
+        for ii, payload in enumerate([b"alpha", b"beta"])
+    )
+    with socket_class_context(mock_recv=lambda _: encoded_messages) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        assert protocol.request("") == b"alpha"
+        assert protocol.request("") == b"beta"
+
+
 def test_peary_protocol_recv_error(socket_class_context: Callable) -> None:
     with socket_class_context(mock_recv=lambda _: b"") as socket_class:
         with pytest.raises(
-            PearyProtocol.ResponseReceiveError, match="Failed to receive response."
+            PearyProtocol.ResponseReceiveError, match=r"Failed to receive response\."
+        ):
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+            ).request("")
+
+
+def test_peary_protocol_recv_error_partial_frame(
+    socket_class_context: Callable,
+) -> None:
+    encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
+    mock_recv_generator = iter([encoded_message[:-1], b""])
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match=r"Failed to receive response\."
         ):
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
@@ -58,7 +58,7 @@ def test_peary_protocol_request_response_status_error(
 
     with socket_class_context(mock_recv=mock_recv) as socket_class:
         with pytest.raises(
-            PearyProtocol.ResponseStatusError, match="Failed response status 1*"
+            PearyProtocol.ResponseStatusError, match="Failed response status 1"
         ):
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
@@ -92,8 +92,32 @@ def test_peary_protocol_request_response_sequence_error(
     with socket_class_context(mock_recv=mock_recv) as socket_class:
         with pytest.raises(
             PearyProtocol.ResponseSequenceError,
-            match="Recieved out of order repsonse from*",
+            match="Recieved out of order repsonse from",
         ):
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
             ).request("")
+
+
+def test_peary_protocol_request_payload(socket_class_context: Callable) -> None:
+    sent = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(f"{ii}".encode(), ii, PearyProtocol.STATUS_OK)
+        for ii in range(1, 3)
+    )
+
+    def mock_send(data: bytes) -> int:
+        sent.append(data)
+        return len(data)
+
+    with socket_class_context(
+        mock_send=mock_send, mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        payload = PearyProtocol.encode_message("alpha", ["beta"])
+        assert protocol.request_payload("alpha", payload) == b"1"
+        assert protocol.request_payload("alpha", payload) == b"2"
+    assert sent == [
+        PearyProtocol.encode(b"alpha beta", 1, PearyProtocol.STATUS_OK),
+        PearyProtocol.encode(b"alpha beta", 2, PearyProtocol.STATUS_OK),
+    ]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_protocol_request_many_single_write(
+    socket_class_context: Callable,
+) -> None:
+    sent = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(f"{ii}".encode(), ii, PearyProtocol.STATUS_OK)
+        for ii in range(1, 4)
+    )
+
+    def mock_send(data: bytes) -> int:
+        sent.append(data)
+        return len(data)
+
+    with socket_class_context(
+        mock_send=mock_send, mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        assert PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("alpha", ()), ("beta", ("0",)), ("gamma", ("0", "1"))]) == [
+            b"1",
+            b"2",
+            b"3",
+        ]
+    assert sent == [
+        b"".join(
+            [
+                PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK),
+                PearyProtocol.encode(b"beta 0", 2, PearyProtocol.STATUS_OK),
+                PearyProtocol.encode(b"gamma 0 1", 3, PearyProtocol.STATUS_OK),
+            ]
+        )
+    ]
+
+
+def test_peary_protocol_request_many_max_in_flight(
+    socket_class_context: Callable,
+) -> None:
+    events = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, PearyProtocol.STATUS_OK) for ii in range(1, 6)
+    )
+
+    def mock_send(data: bytes) -> int:
+        events.append(f"send {len(data) // 8}")
+        return len(data)
+
+    def mock_recv(_: int) -> bytes:
+        events.append("recv")
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_send=mock_send, mock_recv=mock_recv) as socket_class:
+        assert (
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE, max_in_flight=2
+            ).request_many([("", ())] * 5)
+            == [b""] * 5
+        )
+    assert events == [
+        "send 2",
+        "recv",
+        "send 1",
+        "recv",
+        "send 1",
+        "recv",
+        "send 1",
+        "recv",
+        "recv",
+    ]
+
+
+def test_peary_protocol_request_many_status_error(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, status)
+        for ii, status in ((1, PearyProtocol.STATUS_OK), (2, 1), (3, 0))
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        responses = PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("alpha", ()), ("beta", ()), ("gamma", ())])
+    assert responses[0] == b""
+    assert isinstance(responses[1], PearyProtocol.ResponseStatusError)
+    assert "Failed response status 1 from request ''beta''" in str(responses[1])
+    assert responses[2] == b""
+
+
+def test_peary_protocol_request_many_empty(socket_class_context: Callable) -> None:
+    def mock_send(data: bytes) -> int:  # pragma: no cover
+        raise AssertionError(data)
+
+    with socket_class_context(mock_send=mock_send) as socket_class:
+        assert not PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import socket
 from typing import TYPE_CHECKING
 
 import pytest
@@ -9,6 +10,8 @@ from peary.peary_protocol import PearyProtocol
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from typing_extensions import Buffer
+
 
 def test_peary_protocol_send_okay(socket_class_context: Callable) -> None:
     # pylint: disable-next=unnecessary-lambda
@@ -21,8 +24,86 @@ def test_peary_protocol_send_okay(socket_class_context: Callable) -> None:
 def test_peary_protocol_send_error(socket_class_context: Callable) -> None:
     with socket_class_context(mock_send=lambda _: len(_) - 1) as socket_class:
         with pytest.raises(
-            PearyProtocol.RequestSendError, match="Failed to send request:*"
+            PearyProtocol.RequestSendError, match="Failed to send request:"
         ):
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
             ).request("")
+
+
+def test_peary_protocol_send_partial(socket_class_context: Callable) -> None:
+    sent = []
+
+    def mock_send(data: bytes) -> int:
+        sent.append(data[:3])
+        return len(sent[-1])
+
+    with socket_class_context(mock_send=mock_send) as socket_class:
+        PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE).request(
+            "alpha", "0"
+        )
+    assert all(len(data) <= 3 for data in sent)
+    assert b"".join(sent) == PearyProtocol.encode(b"alpha 0", 1, 0)
+
+
+def test_peary_protocol_send_iov_max(socket_class_context: Callable) -> None:
+    sizes = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, PearyProtocol.STATUS_OK)
+        for ii in range(1, PearyProtocol.IOV_MAX + 2)
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+
+        class MockSocket(socket_class):  # type: ignore[misc, valid-type]
+            def sendmsg(self, buffers: list[Buffer], *args: object) -> int:
+                sizes.append(len(buffers))
+                return int(super().sendmsg(buffers, *args))
+
+        PearyProtocol(
+            MockSocket(),
+            checks=PearyProtocol.Checks.CHECK_NONE,
+            max_in_flight=PearyProtocol.IOV_MAX + 1,
+        ).request_many([("alpha", ())] * (PearyProtocol.IOV_MAX + 1))
+    assert sizes == [PearyProtocol.IOV_MAX, 1]
+
+
+def test_peary_protocol_send_join_max(socket_class_context: Callable) -> None:
+    sizes = []
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, PearyProtocol.STATUS_OK) for ii in (1, 2)
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+
+        class MockSocket(socket_class):  # type: ignore[misc, valid-type]
+            def sendmsg(self, buffers: list[Buffer], *args: object) -> int:
+                sizes.append(len(buffers))
+                return int(super().sendmsg(buffers, *args))
+
+        protocol = PearyProtocol(MockSocket(), checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.request_payload("", b"0" * PearyProtocol.JOIN_MAX)
+        protocol.request_payload("", b"0" * (PearyProtocol.JOIN_MAX + 1))
+    assert sizes == [1, 2]
+
+
+def test_peary_protocol_send_without_sendmsg() -> None:
+    client, server = socket.socketpair()
+
+    class MockSocket:
+        """Socket lacking `sendmsg`, as on Windows."""
+
+        settimeout = client.settimeout
+        sendall = client.sendall
+        recv_into = client.recv_into
+
+    with client, server:
+        server.sendall(PearyProtocol.encode(b"beta", 1, PearyProtocol.STATUS_OK))
+        protocol = PearyProtocol(
+            MockSocket(),  # type: ignore[arg-type]
+            checks=PearyProtocol.Checks.CHECK_NONE,
+        )
+        assert protocol.request("alpha", "0") == b"beta"
+        assert server.recv(64) == PearyProtocol.encode(b"alpha 0", 1, 0)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_protocol_stats_disabled(socket_class_context: Callable) -> None:
+    with socket_class_context() as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        assert protocol.stats is None
+        protocol.request("alpha")
+
+
+def test_peary_protocol_stats_enabled(socket_class_context: Callable) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"1.5", ii, status)
+        for ii, status in ((1, PearyProtocol.STATUS_OK), (2, 1), (3, 0))
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.stats = stats = PearyStats()
+        assert protocol.stats is stats
+        protocol.request("alpha", "0")
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            protocol.request("alpha", "0")
+        protocol.request("beta")
+    snapshot = stats.snapshot()
+    assert snapshot["alpha"].requests == 2
+    assert snapshot["alpha"].errors == 1
+    assert snapshot["alpha"].bytes_sent == 2 * len(
+        PearyProtocol.encode(b"alpha 0", 0, 0)
+    )
+    assert snapshot["alpha"].bytes_received == 2 * len(
+        PearyProtocol.encode(b"1.5", 0, 0)
+    )
+    assert snapshot["alpha"].p99 > 0
+    assert snapshot["beta"].requests == 1
+
+
+def test_peary_protocol_stats_switched(socket_class_context: Callable) -> None:
+    mock_recv_generator = iter(
+        PearyProtocol.encode(b"", ii, PearyProtocol.STATUS_OK) for ii in range(1, 4)
+    )
+    with socket_class_context(
+        mock_recv=lambda _: next(mock_recv_generator)
+    ) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        tag = protocol.send_request("alpha")
+        protocol.stats = stats = PearyStats()
+        protocol.recv_response(tag)
+        protocol.request("beta")
+        protocol.stats = None
+        protocol.request("gamma")
+    assert sorted(stats.snapshot()) == ["beta"]
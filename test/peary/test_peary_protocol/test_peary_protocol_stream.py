@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_capture import PearyCaptureReader, PearyCaptureWriter
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _respond(
+    server: socket.socket,
+    tag: int,
+    payload: bytes = b"",
+    status: int = PearyProtocol.STATUS_OK,
+) -> None:
+    server.sendall(PearyProtocol.encode(payload, tag, status))
+
+
+def _protocol(client: socket.socket, timeout: float = 1) -> PearyProtocol:
+    return PearyProtocol(
+        client, timeout=timeout, checks=PearyProtocol.Checks.CHECK_NONE
+    )
+
+
+def test_peary_protocol_stream_large_payload() -> None:
+    payload = bytes(range(256)) * 8192
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client)
+        protocol.stats = stats = PearyStats()
+        tag = protocol.send_request("name")
+        _respond(server, 1, b"small")
+        sender = threading.Thread(target=_respond, args=(server, 2, payload))
+        sender.start()
+        with protocol.request_stream("dump") as stream:
+            assert stream.size == len(payload)
+            chunks = [bytes(chunk) for chunk in stream]
+        sender.join()
+        assert max(len(chunk) for chunk in chunks) <= stream.chunk_size
+        assert b"".join(chunks) == payload
+        assert protocol.recv_response(tag) == b"small"
+        assert protocol.in_flight == 0
+        assert stats.snapshot()["dump"].requests == 1
+        _respond(server, 3, b"next")
+        assert protocol.request("next") == b"next"
+
+
+def test_peary_protocol_stream_close_early() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client)
+        _respond(server, 1, b"0123456789")
+        _respond(server, 2, b"next")
+        with protocol.request_stream("dump") as stream:
+            assert stream.read(4) == b"0123"
+        assert protocol.request("next") == b"next"
+
+
+def test_peary_protocol_stream_empty_and_failed() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client)
+        _respond(server, 1)
+        stream = protocol.request_stream("empty")
+        assert stream.size == 0
+        assert not stream.read()
+        _respond(server, 2, b"error", status=1)
+        with pytest.raises(PearyProtocol.ResponseStatusError, match="'fail'"):
+            protocol.request_stream("fail")
+        _respond(server, 3, b"next")
+        assert protocol.request("next") == b"next"
+        assert protocol.in_flight == 0
+
+
+def test_peary_protocol_stream_held_and_captured(tmp_path: Path) -> None:
+    client, server = socket.socketpair()
+    with client, server, PearyCaptureWriter(tmp_path / "capture.pcap") as capture:
+        protocol = _protocol(client)
+        tag = protocol.send_request("first")
+        _respond(server, 1, b"first")
+        _respond(server, 2, b"second")
+        assert protocol.request("second") == b"second"
+        assert protocol.stream_response(tag).read() == b"first"
+        protocol.capture = capture
+        _respond(server, 3, b"third")
+        assert protocol.request_stream("third").read() == b"third"
+    with PearyCaptureReader(tmp_path / "capture.pcap") as reader:
+        assert [record.payload for record in reader] == [b"third", b"third"]
+
+
+def test_peary_protocol_stream_timeouts() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client, timeout=0.05)
+        with pytest.raises(TimeoutError, match="'dump'"):
+            protocol.request_stream("dump")
+        assert protocol.abandoned == 1
+        server.sendall(PearyProtocol.encode(b"0123456789", 2, 0)[:-4])
+        stream = protocol.request_stream("dump")
+        assert stream.read(2) == b"01"
+        with pytest.raises(PearyProtocol.ResponseReceiveError, match="Timed out"):
+            stream.read()
+
+
+def test_peary_protocol_stream_closed_connection() -> None:
+    client, server = socket.socketpair()
+    with client:
+        protocol = _protocol(client)
+        tag = protocol.send_request("dump")
+        with server:
+            server.recv(64)
+            server.sendall(PearyProtocol.encode(b"0123456789", 1, 0)[:-4])
+        stream = protocol.stream_response(tag)
+        with pytest.raises(PearyProtocol.ResponseReceiveError, match="Failed"):
+            stream.read()
+
+
+def test_peary_protocol_stream_blocks_requests() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client)
+        held = protocol.send_request("held")
+        waiting = protocol.send_request("waiting")
+        _respond(server, held, b"held")
+        _respond(server, 3, b"0123456789")
+        stream = protocol.request_stream("dump")
+        assert stream.read(2) == b"01"
+        with pytest.raises(PearyProtocol.RequestSendError, match="'dump'"):
+            protocol.request("next")
+        with pytest.raises(PearyProtocol.ResponseSequenceError, match="'dump'"):
+            protocol.recv_response(waiting)
+        assert protocol.recv_response(held) == b"held"
+        stream.close()
+        _respond(server, waiting, b"waiting")
+        assert protocol.recv_response(waiting) == b"waiting"
+        _respond(server, 4, b"next")
+        assert protocol.request("next") == b"next"
+
+
+def test_peary_protocol_stream_payload_timeout() -> None:
+    frame = PearyProtocol.encode(b"0123456789", 1, PearyProtocol.STATUS_OK)
+
+    def _send_slowly() -> None:
+        for delay, part in (
+            (0.1, frame[:4]),
+            (0.05, frame[4:-10]),
+            (0.15, frame[-10:]),
+        ):
+            time.sleep(delay)
+            server.sendall(part)
+
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = _protocol(client, timeout=0.2)
+        sender = threading.Thread(target=_send_slowly)
+        sender.start()
+        stream = protocol.request_stream("dump")
+        assert stream.read() == b"0123456789"
+        sender.join()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import socket
+import time
+
+import pytest
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_stats import PearyStats
+
+
+def _respond(server: socket.socket, tag: int, payload: bytes = b"") -> None:
+    server.sendall(PearyProtocol.encode(payload, tag, PearyProtocol.STATUS_OK))
+
+
+def test_peary_protocol_timeout_late_response() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(
+            client, timeout=0.05, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        protocol.stats = stats = PearyStats()
+        with pytest.raises(TimeoutError, match=r"No response to 'slow' within 0\.05s"):
+            protocol.request("slow")
+        assert protocol.in_flight == 0
+        assert protocol.abandoned == 1
+        _respond(server, 1, b"late")
+        _respond(server, 2, b"fast")
+        assert protocol.request("fast") == b"fast"
+        assert protocol.abandoned == 0
+        assert stats.snapshot()["slow"].requests == 1
+
+
+def test_peary_protocol_timeout_per_message() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(
+            client, timeout=10, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        protocol.timeouts.set("poll", 0.01)
+        start = time.monotonic()
+        with pytest.raises(TimeoutError, match="'poll'"):
+            protocol.request("poll")
+        assert time.monotonic() - start < 5
+
+
+def test_peary_protocol_deadline() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(client, checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.timeouts.set("configure", 0.01)
+        _respond(server, 2, b"second")
+        _respond(server, 1, b"first")
+        with protocol.deadline(10), protocol.deadline(20):
+            assert protocol.request_many([("configure", ()), ("", ())]) == [
+                b"first",
+                b"second",
+            ]
+        with pytest.raises(TimeoutError), protocol.deadline(0):
+            protocol.request("configure")
+        with pytest.raises(TimeoutError, match=r"within 0\.01s"):
+            protocol.request("configure")
+
+
+def test_peary_protocol_timeout_request_many() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(
+            client, timeout=0.05, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        _respond(server, 1)
+        with pytest.raises(TimeoutError, match="'beta'"):
+            protocol.request_many([("alpha", ()), ("beta", ()), ("gamma", ())])
+        assert protocol.in_flight == 0
+        assert protocol.abandoned == 2
+        with pytest.raises(PearyProtocol.ResponseSequenceError):
+            protocol.recv_response(2)
+
+
+def test_peary_protocol_timeout_full_window() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(
+            client,
+            timeout=0.05,
+            checks=PearyProtocol.Checks.CHECK_NONE,
+            max_in_flight=2,
+        )
+        with pytest.raises(TimeoutError, match=r"No response to 'a' within 0\.05s"):
+            protocol.request_many([(msg, ()) for msg in "abcde"])
+        assert protocol.in_flight == 0
+        assert protocol.abandoned == 2
+        _respond(server, 1, b"late")
+        _respond(server, 2, b"late")
+        _respond(server, 3, b"fresh")
+        assert protocol.request("z") == b"fresh"
+
+
+def test_peary_protocol_timeout_adaptive() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(client, checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.timeouts.adaptive = True
+        protocol.timeouts.minimum = 0.05
+        _respond(server, 1)
+        protocol.request("poll")
+        assert protocol.timeouts.timeout("poll") == pytest.approx(0.05)
+        with pytest.raises(TimeoutError, match=r"within 0\.05s"):
+            protocol.request("poll")
+        assert protocol.timeouts.timeout("poll") == pytest.approx(0.1)
+        _respond(server, 2)
+        _respond(server, 3)
+        protocol.request("poll")
+        assert protocol.abandoned == 0
@@ -14,9 +14,7 @@ def test_peary_protocol_version_request_message(socket_class_context: Callable)
 
     class MockProtocol(PearyProtocol):
 
-        def request(
-            self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-        ) -> bytes:
+        def request(self, msg: str, *args: str) -> bytes:  # noqa: ARG002
             assert msg == "protocol_version"
             return b"1"
 
@@ -28,9 +26,7 @@ def test_peary_protocol_version_supported(socket_class_context: Callable) -> Non
 
     class MockProtocol(PearyProtocol):
 
-        def request(
-            self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-        ) -> bytes:
+        def request(self, msg: str, *args: str) -> bytes:  # noqa: ARG002
             return b"1"
 
     with socket_class_context() as socket_class:
@@ -41,9 +37,7 @@ def test_peary_protocol_version_unsupported(socket_class_context: Callable) -> N
 
     class MockProtocol(PearyProtocol):
 
-        def request(
-            self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-        ) -> bytes:
+        def request(self, msg: str, *args: str) -> bytes:  # noqa: ARG002
             return b"0"
 
     with socket_class_context() as socket_class:
@@ -21,9 +21,7 @@ def _mock_proxy() -> Callable:
         class MockPearyProtocol(PearyProtocol):
             """A Mock Peary Protocol."""
 
-            def request(
-                self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
-            ) -> bytes:
+            def request(self, msg: str, *args: str) -> bytes:
                 if req:
                     assert " ".join([msg, *args]) == req
                 if resp:
@@ -15,6 +15,10 @@ def test_peary_proxy_keep_alive(mock_proxy: Callable) -> None:
     assert mock_proxy().keep_alive() == b""
 
 
+def test_peary_proxy_protocol(mock_proxy: Callable) -> None:
+    assert isinstance(mock_proxy().protocol, peary.peary_protocol.PearyProtocol)
+
+
 def test_peary_proxy_add_device_unique_name(mock_proxy: Callable) -> None:
     for name, index in zip(["alpha", "beta"], [b"0", b"1"]):
         assert mock_proxy(req=f"add_device {name}", resp=index).add_device(
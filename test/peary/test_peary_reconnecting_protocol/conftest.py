@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_emulator import PearyEmulator
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(name="emulator")
+def _emulator() -> Generator[tuple[PearyEmulator, int]]:
+    loop = asyncio.new_event_loop()
+    emulator = PearyEmulator()
+    server = loop.run_until_complete(emulator.start("127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    yield emulator, server.sockets[0].getsockname()[1]
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
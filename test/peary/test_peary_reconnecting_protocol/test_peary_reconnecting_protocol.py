@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import socket
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_protocol import PearyProtocol
+from peary.peary_reconnecting_protocol import (
+    PearyReconnectingProtocol,
+    PearyReconnectPolicy,
+)
+
+if TYPE_CHECKING:
+    from peary.peary_emulator import PearyEmulator
+
+
+def _drop(client: PearyClient) -> None:
+    client.socket.shutdown(socket.SHUT_RDWR)
+
+
+def test_peary_reconnect_policy_delays() -> None:
+    policy = PearyReconnectPolicy(attempts=5, delay=0.1, max_delay=0.3)
+    assert list(policy.delays()) == [0, 0.1, 0.2, 0.3, 0.3]
+
+
+def test_peary_reconnecting_protocol_restore(
+    emulator: tuple[PearyEmulator, int],
+) -> None:
+    server, port = emulator
+    client = PearyClient("127.0.0.1", port, protocol_class=PearyReconnectingProtocol)
+    with client as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_voltage("VDD", 1.2)
+        device.switch_on("VDD")
+        device.set_register("reg", 3)
+        _drop(client)
+        assert device.get_register("reg") == 3
+        assert device.index == 1
+        assert device.get_voltage("VDD") == pytest.approx(1.2)
+        assert [d.name for d in server.devices] == ["Caribou", "Caribou"]
+        assert cast("PearyReconnectingProtocol", proxy.protocol).reconnects == 1
+        command = device.compile("get_register", "reg")
+        _drop(client)
+        assert command() == b"3"
+        _drop(client)
+        assert proxy.protocol.request_many([("", ())]) == [b""]
+        assert device.index == 3
+        assert cast("PearyReconnectingProtocol", proxy.protocol).reconnects == 3
+
+
+def test_peary_reconnecting_protocol_without_replay(
+    emulator: tuple[PearyEmulator, int],
+) -> None:
+    _, port = emulator
+    client = PearyClient("127.0.0.1", port, protocol_class=PearyReconnectingProtocol)
+    with client as proxy:
+        assert isinstance(proxy.protocol, PearyReconnectingProtocol)
+        proxy.protocol.policy = PearyReconnectPolicy(replay_settings=False)
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 3)
+        _drop(client)
+        assert device.get_register("reg") == 0
+
+
+def test_peary_reconnecting_protocol_replay_error(
+    emulator: tuple[PearyEmulator, int],
+) -> None:
+    _, port = emulator
+    client = PearyClient("127.0.0.1", port, protocol_class=PearyReconnectingProtocol)
+    with client as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 3)
+        assert proxy.restore(replay_settings=False) == {0: 1}
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            device.restore(5)
+
+
+def test_peary_reconnecting_protocol_failed_attempts(
+    emulator: tuple[PearyEmulator, int],
+) -> None:
+    _, port = emulator
+    attempts: list[int] = []
+
+    def _connect() -> socket.socket:
+        attempts.append(len(attempts))
+        if len(attempts) < 3:
+            raise ConnectionRefusedError
+        return socket.create_connection(("127.0.0.1", port))
+
+    with socket.create_connection(("127.0.0.1", port)) as connection:
+        protocol = PearyReconnectingProtocol(connection)
+        protocol.policy = PearyReconnectPolicy(attempts=3, delay=0)
+        protocol.connect = _connect
+        connection.shutdown(socket.SHUT_RDWR)
+        assert protocol.request("protocol_version") == PearyProtocol.VERSION
+        assert attempts == [0, 1, 2]
+        protocol.policy = PearyReconnectPolicy(attempts=2, delay=0)
+        attempts.clear()
+        with pytest.raises(
+            PearyReconnectingProtocol.ReconnectError, match="after 2 attempts"
+        ):
+            protocol.reconnect()
+        assert attempts == [0, 1]
+
+
+def test_peary_reconnecting_protocol_restore_failure(
+    emulator: tuple[PearyEmulator, int],
+) -> None:
+    _, port = emulator
+    connections: list[socket.socket] = []
+
+    def _connect() -> socket.socket:
+        connections.append(socket.create_connection(("127.0.0.1", port)))
+        return connections[-1]
+
+    def _restore(_: PearyReconnectPolicy) -> None:
+        if len(connections) == 2:
+            connections[1].shutdown(socket.SHUT_RDWR)
+        protocol.request("")
+
+    protocol = PearyReconnectingProtocol(_connect())
+    protocol.connect = _connect
+    protocol.add_restore_callback(_restore)
+    protocol.policy = PearyReconnectPolicy(delay=0)
+    protocol.reconnect()
+    assert len(connections) == 3
+    assert protocol.reconnects == 1
+    for connection in connections:
+        connection.close()
+
+
+def test_peary_reconnecting_protocol_without_connect() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyReconnectingProtocol(
+            client, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        server.close()
+        with pytest.raises(PearyReconnectingProtocol.RECONNECT_ERRORS):
+            protocol.request("")
+        with pytest.raises(
+            PearyReconnectingProtocol.ReconnectError, match="No connect function"
+        ):
+            protocol.reconnect()
+
+
+def test_peary_reconnecting_protocol_timeout() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyReconnectingProtocol(
+            client, timeout=0.01, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        protocol.connect = lambda: client
+        with pytest.raises(TimeoutError):
+            protocol.request("")
+        assert protocol.reconnects == 0
+        assert protocol.abandoned == 1
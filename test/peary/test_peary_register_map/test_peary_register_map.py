@@ -0,0 +1,40 @@
+import sys
+
+import pytest
+
+from peary.peary_register_map import PearyRegisterMap
+
+
+def test_peary_register_map_index() -> None:
+    registers = PearyRegisterMap(["b", "a", "c", "a"])
+    assert list(registers) == ["b", "a", "c"]
+    assert len(registers) == 3
+    assert registers.index("c") == 2
+    assert "a" in registers
+    assert "d" not in registers
+    registers.validate("a", "b")
+    with pytest.raises(
+        PearyRegisterMap.UnknownRegisterError, match="Unknown register: d"
+    ):
+        registers.validate("a", "d")
+
+
+def test_peary_register_map_prefix() -> None:
+    registers = PearyRegisterMap(["th_1", "trim_0", "th_0", "t", "vth"])
+    assert registers.prefix("th_") == ["th_0", "th_1"]
+    assert registers.prefix("t") == ["t", "th_0", "th_1", "trim_0"]
+    assert registers.prefix("x") == []
+    assert registers.prefix("") == ["t", "th_0", "th_1", "trim_0", "vth"]
+
+
+def test_peary_register_map_match() -> None:
+    registers = PearyRegisterMap(["px_1_trim", "px_0_trim", "px_0_mask", "PX_2_trim"])
+    assert registers.match("px_*_trim") == ["px_1_trim", "px_0_trim"]
+    assert registers.match("px_[01]_*") == ["px_1_trim", "px_0_trim", "px_0_mask"]
+
+
+def test_peary_register_map_interned() -> None:
+    suffix = "name"
+    first = PearyRegisterMap([f"long_register_{suffix}"])
+    second = PearyRegisterMap([f"long_register_{suffix}"])
+    assert next(iter(first)) is next(iter(second)) is sys.intern("long_register_name")
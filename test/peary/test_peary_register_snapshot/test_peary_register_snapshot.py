@@ -0,0 +1,29 @@
+import pytest
+
+from peary.peary_register_snapshot import PearyRegisterSnapshot
+
+
+def test_peary_register_snapshot_mapping() -> None:
+    snapshot = PearyRegisterSnapshot({"b": 2, "a": -1})
+    assert list(snapshot) == ["b", "a"]
+    assert len(snapshot) == 2
+    assert snapshot["a"] == -1
+    assert snapshot == {"a": -1, "b": 2}
+    assert repr(snapshot) == "PearyRegisterSnapshot({'b': 2, 'a': -1})"
+    with pytest.raises(KeyError):
+        snapshot["c"]  # pylint: disable=pointless-statement
+
+
+def test_peary_register_snapshot_diff() -> None:
+    snapshot = PearyRegisterSnapshot({"a": 1, "b": 2, "c": 3})
+    assert snapshot.diff({"a": 1, "b": 0}) == {"b": 2, "c": 3}
+    assert not snapshot.diff(snapshot)
+
+
+def test_peary_register_snapshot_json() -> None:
+    snapshot = PearyRegisterSnapshot({"a": 1, "b": 2**40})
+    assert snapshot.to_json() == '{"a":1,"b":1099511627776}'
+    assert PearyRegisterSnapshot.from_json(snapshot.to_json()) == snapshot
+    for text in ("[1]", '{"a":1.5}', '{"a":true}'):
+        with pytest.raises(ValueError, match="Invalid register snapshot"):
+            PearyRegisterSnapshot.from_json(text)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_capture import PearyCaptureReader, PearyCaptureWriter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+
+
+@pytest.fixture(name="capture")
+def _capture(tmp_path: Path) -> Generator[Callable]:
+    readers: list[PearyCaptureReader] = []
+
+    def _create_capture(
+        *records: tuple[PearyCaptureWriter.Direction, int, int, bytes]
+    ) -> PearyCaptureReader:
+        path = tmp_path / f"capture{len(readers)}.pcap"
+        with PearyCaptureWriter(path) as writer:
+            for record in records:
+                writer.write(*record)
+        readers.append(PearyCaptureReader(path))
+        return readers[-1]
+
+    yield _create_capture
+    for reader in readers:
+        reader.close()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_capture import PearyCaptureWriter
+from peary.peary_protocol import PearyProtocol
+from peary.peary_proxy import PearyProxy
+from peary.peary_replay_socket import PearyReplaySocket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SENT = PearyCaptureWriter.Direction.SENT
+RECEIVED = PearyCaptureWriter.Direction.RECEIVED
+
+
+def _protocol(socket: PearyReplaySocket, **kwargs: int) -> PearyProtocol:
+    return PearyProtocol(socket, checks=PearyProtocol.Checks.CHECK_NONE, **kwargs)
+
+
+def test_peary_replay_socket_proxy(capture: Callable) -> None:
+    socket = PearyReplaySocket(
+        capture(
+            (SENT, 7, 0, b"add_device alpha"),
+            (RECEIVED, 7, 0, b"3"),
+            (SENT, 8, 0, b"device.get_voltage 3 PWR_OUT_1"),
+            (RECEIVED, 8, 0, b"1.5"),
+        )
+    )
+    socket.settimeout(1)
+    proxy = PearyProxy(_protocol(socket))
+    device = proxy.add_device("alpha")
+    assert device.index == 3
+    assert device.get_voltage("PWR_OUT_1") == 1.5
+    socket.shutdown(0)
+    socket.close()
+
+
+def test_peary_replay_socket_pipelined(capture: Callable) -> None:
+    protocol = _protocol(
+        PearyReplaySocket(
+            capture(
+                (SENT, 1, 0, b"alpha"),
+                (SENT, 2, 0, b"beta"),
+                (SENT, 3, 0, b"gamma"),
+                (RECEIVED, 2, 0, b"2"),
+                (RECEIVED, 1, 0, b"1"),
+                (RECEIVED, 3, 1, b""),
+            )
+        ),
+        max_in_flight=1,
+    )
+    responses = protocol.request_many([("alpha", ()), ("beta", ()), ("gamma", ())])
+    assert responses[:2] == [b"1", b"2"]
+    assert isinstance(responses[2], PearyProtocol.ResponseStatusError)
+
+
+def test_peary_replay_socket_exhausted(capture: Callable) -> None:
+    protocol = _protocol(
+        PearyReplaySocket(capture((SENT, 1, 0, b"alpha"), (RECEIVED, 1, 0, b"1")))
+    )
+    assert protocol.request("alpha") == b"1"
+    with pytest.raises(
+        PearyReplaySocket.ReplayMismatchError,
+        match="Capture has no request for b'beta'",
+    ):
+        protocol.request("beta")
+
+
+def test_peary_replay_socket_missing_response(capture: Callable) -> None:
+    protocol = _protocol(PearyReplaySocket(capture((SENT, 1, 0, b"alpha"))))
+    with pytest.raises(PearyProtocol.ResponseReceiveError):
+        protocol.request("alpha")
+
+
+def test_peary_replay_socket_mismatch(capture: Callable) -> None:
+    records = ((SENT, 1, 0, b"alpha"), (RECEIVED, 1, 0, b"1"))
+    with pytest.raises(
+        PearyReplaySocket.ReplayMismatchError,
+        match="Sent request b'beta' != recorded b'alpha'",
+    ):
+        _protocol(PearyReplaySocket(capture(*records))).request("beta")
+    assert (
+        _protocol(PearyReplaySocket(capture(*records), strict=False)).request("beta")
+        == b"1"
+    )
@@ -0,0 +1,37 @@
+from peary.peary_shadow import PearyRegisterShadow, PearyShadowStats
+
+
+def test_peary_shadow_lookup() -> None:
+    shadow = PearyRegisterShadow()
+    assert shadow.stats == (0, 0, 0)
+    assert shadow.stats.hit_rate == 0
+    assert shadow.lookup("reg") is None
+    shadow.record("reg", 0)
+    assert shadow.lookup("reg") == 0
+    assert shadow.lookup("reg") == 0
+    assert shadow.stats == PearyShadowStats(hits=2, misses=1, entries=1)
+    assert shadow.stats.hit_rate == 2 / 3
+    shadow.reset_stats()
+    assert shadow.stats == (0, 0, 1)
+
+
+def test_peary_shadow_volatile() -> None:
+    shadow = PearyRegisterShadow(volatile=["status"])
+    shadow.record("status", 1)
+    shadow.record("reg", 2)
+    shadow.record("counter", 3)
+    assert shadow.lookup("status") is None
+    shadow.mark_volatile("counter")
+    assert shadow.volatile == {"status", "counter"}
+    assert shadow.lookup("counter") is None
+    assert shadow.lookup("reg") == 2
+
+
+def test_peary_shadow_invalidate() -> None:
+    shadow = PearyRegisterShadow()
+    for i, name in enumerate(["a", "b", "c"]):
+        shadow.record(name, i)
+    shadow.invalidate("a", "missing")
+    assert shadow.stats.entries == 2
+    shadow.invalidate()
+    assert shadow.stats.entries == 0
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_stats import PearyCommandStats, PearyLatencyHistogram, PearyStats
+
+
+def test_peary_latency_histogram_empty() -> None:
+    histogram = PearyLatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.mean == 0.0
+    assert histogram.max == 0.0
+    assert histogram.percentile(50) == 0.0
+
+
+def test_peary_latency_histogram_percentiles() -> None:
+    histogram = PearyLatencyHistogram()
+    for _ in range(99):
+        histogram.add(1e-3)
+    histogram.add(1.0)
+    assert histogram.count == 100
+    assert histogram.mean == pytest.approx((99 * 1e-3 + 1.0) / 100)
+    assert histogram.max == 1.0
+    assert 1e-3 <= histogram.percentile(50) <= 1e-3 * 2 ** (1 / 8)
+    assert 1e-3 <= histogram.percentile(99) <= 1e-3 * 2 ** (1 / 8)
+    assert histogram.percentile(100) == 1.0
+
+
+def test_peary_latency_histogram_out_of_range() -> None:
+    histogram = PearyLatencyHistogram()
+    histogram.add(0.0)
+    assert histogram.percentile(100) == 0.0
+    histogram.add(1e6)
+    assert histogram.percentile(100) == pytest.approx(
+        PearyLatencyHistogram.MIN_LATENCY * 2**PearyLatencyHistogram.OCTAVES, rel=0.1
+    )
+
+
+def test_peary_latency_histogram_reset() -> None:
+    histogram = PearyLatencyHistogram()
+    histogram.add(1e-3)
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.max == 0.0
+    assert histogram.percentile(99) == 0.0
+
+
+def test_peary_command_stats_summary() -> None:
+    stats = PearyCommandStats()
+    stats.record(10, 20, 1e-3, failed=False)
+    stats.record(10, 8, 1e-3, failed=True)
+    summary = stats.summary(2.0)
+    assert summary.requests == 2
+    assert summary.errors == 1
+    assert summary.bytes_sent == 20
+    assert summary.bytes_received == 28
+    assert summary.rate == 1.0
+    assert summary.mean == pytest.approx(1e-3)
+    assert summary.p50 == summary.p99 == summary.max == pytest.approx(1e-3)
+    assert stats.summary(0.0).rate == 0.0
+
+
+def test_peary_stats_snapshot() -> None:
+    stats = PearyStats()
+    stats.record("alpha", 10, 12, 1e-3)
+    stats.record("alpha", 10, 12, 2e-3, failed=True)
+    stats.record("beta", 8, 8, 1e-3)
+    snapshot = stats.snapshot()
+    assert sorted(snapshot) == ["alpha", "beta"]
+    assert snapshot["alpha"].requests == 2
+    assert snapshot["alpha"].errors == 1
+    assert snapshot["alpha"].bytes_sent == 20
+    assert snapshot["beta"].requests == 1
+    assert snapshot["beta"].rate > 0
+    assert stats.elapsed > 0
+
+
+def test_peary_stats_reset() -> None:
+    stats = PearyStats()
+    stats.record("alpha", 10, 12, 1e-3)
+    stats.reset()
+    assert not stats.snapshot()
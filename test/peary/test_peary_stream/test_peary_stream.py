@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from peary.peary_stream import PearyResponseStream
+
+
+def test_peary_response_stream_chunks() -> None:
+    stream = PearyResponseStream.from_payload(b"0123456789")
+    stream.chunk_size = 4
+    assert stream.size == 10
+    assert [bytes(chunk) for chunk in stream] == [b"0123", b"4567", b"89"]
+    assert not stream.remaining
+    assert not stream.read()
+
+
+def test_peary_response_stream_read() -> None:
+    completed: list[bool] = []
+    with PearyResponseStream(
+        10,
+        PearyResponseStream.from_payload(b"0123456789").readinto,
+        lambda: completed.append(True),
+    ) as stream:
+        assert stream.read(3) == b"012"
+        buffer = bytearray(4)
+        assert stream.readinto(buffer) == 4
+        assert buffer == b"3456"
+        assert stream.read() == b"789"
+        assert stream.readinto(buffer) == 0
+    stream.close()
+    assert completed == [True]
+
+
+def test_peary_response_stream_close() -> None:
+    completed: list[bool] = []
+    stream = PearyResponseStream(
+        10,
+        PearyResponseStream.from_payload(b"0123456789").readinto,
+        lambda: completed.append(True),
+    )
+    stream.chunk_size = 3
+    assert stream.read(1) == b"0"
+    stream.close()
+    assert not stream.remaining
+    assert completed == [True]
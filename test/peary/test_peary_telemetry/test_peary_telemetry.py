@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import math
+import socket
+import threading
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_device import PearyDevice
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_telemetry import PearyTelemetrySampler, PearyTelemetryStats
+from peary.peary_transport import PearyInProcessTransport
+
+
+def _emulated_device() -> PearyDevice:
+    client = PearyClient(PearyInProcessTransport(PearyEmulator()))
+    proxy = client.__enter__()  # pylint: disable=unnecessary-dunder-call
+    device = proxy.add_device("Caribou")
+    device.set_voltage("VDD", 1.2)
+    device.set_current("VDD", 0.5)
+    device.switch_on("VDD")
+    return device
+
+
+def test_peary_telemetry_sample() -> None:
+    device = _emulated_device()
+    channels = [("voltage", "VDD"), ("current", "VDD"), ("voltage", "VDD")]
+    sampler = PearyTelemetrySampler(device, channels, capacity=4)
+    assert sampler.channels == channels[:2]
+    assert sampler.capacity == 4
+    assert sampler.stats() == dict.fromkeys(channels)
+    for voltage in (1.0, 1.1, 1.2, 1.3, 1.4, 1.5):
+        device.set_voltage("VDD", voltage)
+        sampler.sample()
+    assert sampler.cycles == 6
+    snapshot = sampler.snapshot()
+    assert len(snapshot.timestamps) == 4
+    assert list(snapshot.timestamps) == sorted(snapshot.timestamps)
+    assert list(snapshot.values["voltage", "VDD"]) == [1.2, 1.3, 1.4, 1.5]
+    stats = sampler.stats()["voltage", "VDD"]
+    assert stats is not None
+    assert stats.samples == 4
+    assert stats.last == 1.5
+    assert stats.minimum == 1.2
+    assert stats.maximum == 1.5
+    assert stats.mean == pytest.approx(1.35)
+    assert sampler.stats(window=0)["current", "VDD"] == PearyTelemetryStats(
+        1, 0, 0.5, 0.0, 0.5, 0.5, 0.5
+    )
+
+
+def test_peary_telemetry_errors() -> None:
+    device = _emulated_device()
+    sampler = PearyTelemetrySampler(device, [("voltage", "VDD"), ("current", "a b")])
+    sampler.sample()
+    sampler.sample()
+    assert sampler.errors == 2
+    assert math.isnan(sampler.snapshot().values["current", "a b"][0])
+    assert sampler.stats()["current", "a b"] is None
+    stats = sampler.stats()["voltage", "VDD"]
+    assert stats is not None
+    assert stats.failed == 0
+    with pytest.raises(ValueError, match="Unknown channel kinds: \\['power'\\]"):
+        PearyTelemetrySampler(device, [("power", "VDD")])
+    with pytest.raises(ValueError, match="Invalid capacity: 0"):
+        PearyTelemetrySampler(device, [], capacity=0)
+
+
+def test_peary_telemetry_run() -> None:
+    sampler = PearyTelemetrySampler(_emulated_device(), [("voltage", "VDD")], rate=1000)
+    sampler.run(cycles=5)
+    assert sampler.cycles == 5
+    sampler.rate = 1e9
+    sampler.run(cycles=3)
+    assert sampler.overruns > 0
+    sampler.rate = 1.0
+    sampler.stop()
+    sampler.run()
+    assert sampler.cycles == 9
+    thread = threading.Thread(target=sampler.run)
+    thread.start()
+    sampler.stop()
+    thread.join()
+    assert sampler.cycles in {10, 11}
+
+
+def test_peary_telemetry_invalid_rate() -> None:
+    device = _emulated_device()
+    with pytest.raises(ValueError, match="Invalid rate: 0"):
+        PearyTelemetrySampler(device, [("voltage", "VDD")], rate=0)
+    sampler = PearyTelemetrySampler(device, [("voltage", "VDD")])
+    with pytest.raises(ValueError, match="Invalid rate: -1"):
+        sampler.rate = -1
+    assert sampler.rate == 10
+
+
+def test_peary_telemetry_concurrent_snapshots() -> None:
+    sampler = PearyTelemetrySampler(
+        _emulated_device(), [("voltage", "VDD")], rate=1e6, capacity=16
+    )
+    thread = threading.Thread(target=sampler.run, args=(2000,))
+    thread.start()
+    snapshots = [sampler.snapshot() for _ in range(500)]
+    thread.join()
+    assert all(
+        len(snapshot.timestamps) == len(snapshot.values["voltage", "VDD"])
+        for snapshot in snapshots
+    )
+
+
+def test_peary_telemetry_timeout() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        protocol = PearyProtocol(
+            client, timeout=0.01, checks=PearyProtocol.Checks.CHECK_NONE
+        )
+        sampler = PearyTelemetrySampler(
+            PearyDevice(0, protocol), [("voltage", "VDD"), ("current", "VDD")]
+        )
+        sampler.run(cycles=2)
+        assert sampler.cycles == 2
+        assert sampler.errors == 4
+        assert sampler.stats() == dict.fromkeys(sampler.channels)
+
+
+def test_peary_telemetry_unparsable() -> None:
+    client, server = socket.socketpair()
+    with client, server:
+        server.sendall(PearyProtocol.encode(b"high", 1, PearyProtocol.STATUS_OK))
+        server.sendall(PearyProtocol.encode(b"0.5", 2, PearyProtocol.STATUS_OK))
+        protocol = PearyProtocol(client, checks=PearyProtocol.Checks.CHECK_NONE)
+        sampler = PearyTelemetrySampler(
+            PearyDevice(0, protocol), [("voltage", "VDD"), ("current", "VDD")]
+        )
+        sampler.sample()
+        assert sampler.errors == 1
+        assert math.isnan(sampler.snapshot().values["voltage", "VDD"][0])
+        assert sampler.snapshot().values["current", "VDD"][0] == 0.5
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_protocol import PearyProtocol
+from peary.peary_threaded_protocol import PearyThreadedProtocol
+
+if TYPE_CHECKING:
+    from peary.peary_device import PearyDevice
+
+
+def _recv_request(server: socket.socket) -> tuple[int, bytes]:
+    prefix = server.recv(PearyProtocol.STRUCT_PREFIX.size, socket.MSG_WAITALL)
+    length, tag, _ = PearyProtocol.STRUCT_PREFIX.unpack(prefix)
+    size = length - PearyProtocol.STRUCT_HEADER.size
+    return tag, server.recv(size, socket.MSG_WAITALL) if size else b""
+
+
+def test_peary_threaded_protocol_shared_client(emulator_port: int) -> None:
+    def _configure(device: PearyDevice, thread: int) -> list[int]:
+        values = []
+        for value in range(50):
+            device.set_register(f"reg{thread}", value)
+            values.append(device.get_register(f"reg{thread}"))
+        return values
+
+    with PearyClient(
+        "127.0.0.1", emulator_port, protocol_class=PearyThreadedProtocol
+    ) as proxy:
+        device = proxy.add_device("Caribou")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(_configure, [device] * 8, range(8))
+            assert list(results) == [list(range(50))] * 8
+        assert proxy.protocol.in_flight == 0
+
+
+def test_peary_threaded_protocol_client_exit(emulator_port: int) -> None:
+    threads = set(threading.enumerate())
+    with PearyClient(
+        "127.0.0.1", emulator_port, protocol_class=PearyThreadedProtocol
+    ) as proxy:
+        proxy.keep_alive()
+        (reader,) = set(threading.enumerate()) - threads
+        assert reader.name == "peary-reader"
+    assert not reader.is_alive()
+
+
+def test_peary_threaded_protocol_window(emulator_port: int) -> None:
+    with socket.create_connection(("127.0.0.1", emulator_port)) as connection:
+        protocol = PearyThreadedProtocol(connection, max_in_flight=2)
+        requests = [("protocol_version", ())] * 5 + [("unknown", ())]
+        results = protocol.request_many(requests)
+        assert results[:5] == [PearyProtocol.VERSION] * 5
+        assert isinstance(results[5], PearyProtocol.ResponseStatusError)
+        tags = [protocol.send_request("") for _ in range(3)]
+        assert [protocol.recv_response(tag) for tag in reversed(tags)] == [b""] * 3
+        protocol.close()
+
+
+def test_peary_threaded_protocol_timeout(
+    socket_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    client, server = socket_pair
+    protocol = PearyThreadedProtocol(
+        client, timeout=0.05, checks=PearyProtocol.Checks.CHECK_NONE, max_in_flight=1
+    )
+    tag = protocol.send_request("first")
+    with pytest.raises(TimeoutError, match="Timed out"):
+        protocol.send_request("second")
+    with pytest.raises(TimeoutError, match="No response to 'first'"):
+        protocol.recv_response(tag)
+    assert protocol.abandoned == 1
+    second = protocol.send_request("second")
+    assert _recv_request(server) == (tag, b"first")
+    assert _recv_request(server) == (second, b"second")
+    server.sendall(PearyProtocol.encode(b"late", tag, PearyProtocol.STATUS_OK))
+    server.sendall(PearyProtocol.encode(b"2", second, PearyProtocol.STATUS_OK))
+    assert protocol.recv_response(second) == b"2"
+    assert protocol.abandoned == 0
+    with pytest.raises(TimeoutError):
+        protocol.request_many([("third", ())])
+    assert protocol.in_flight == 0
+    assert protocol.abandoned == 1
+    protocol.close()
+
+
+def test_peary_threaded_protocol_connection_closed(
+    socket_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    client, server = socket_pair
+    protocol = PearyThreadedProtocol(client, checks=PearyProtocol.Checks.CHECK_NONE)
+    tag = protocol.send_request("")
+    server.shutdown(socket.SHUT_WR)
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ):
+        protocol.recv_response(tag)
+
+
+def test_peary_threaded_protocol_duplicate_response(
+    socket_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    client, server = socket_pair
+    protocol = PearyThreadedProtocol(client, checks=PearyProtocol.Checks.CHECK_NONE)
+    first = protocol.send_request("")
+    second = protocol.send_request("")
+    server.sendall(PearyProtocol.encode(b"", first, 0) * 2)
+    with pytest.raises(PearyProtocol.ResponseReceiveError) as error:
+        protocol.recv_response(second)
+    assert isinstance(error.value.__cause__, PearyProtocol.ResponseSequenceError)
+
+
+def test_peary_threaded_protocol_version(
+    socket_pair: tuple[socket.socket, socket.socket],
+) -> None:
+    client, server = socket_pair
+
+    def _respond() -> None:
+        tag, _ = _recv_request(server)
+        server.sendall(PearyProtocol.encode(b"0", tag, 0))
+
+    responder = threading.Thread(target=_respond)
+    responder.start()
+    with pytest.raises(PearyProtocol.VersionError):
+        PearyThreadedProtocol(client)
+    responder.join()
+
+
+def test_peary_threaded_protocol_stream(emulator_port: int) -> None:
+    with PearyClient(
+        "127.0.0.1", emulator_port, protocol_class=PearyThreadedProtocol
+    ) as proxy:
+        device = proxy.add_device("Caribou")
+        stream = proxy.protocol.request_stream(
+            "device.car_i2c_read", str(device.index), "0", "0", "0", "4"
+        )
+        stream.chunk_size = 2
+        assert [bytes(chunk) for chunk in stream] == [b"0 ", b"0 ", b"0 ", b"0"]
+        assert device.get_register("reg") == 0
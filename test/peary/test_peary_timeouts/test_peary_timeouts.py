@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_timeouts import PearyTimeouts
+
+
+def test_peary_timeouts_default() -> None:
+    timeouts = PearyTimeouts(2)
+    assert timeouts.default == 2
+    assert timeouts.timeout("alpha") == 2
+    timeouts.observe("alpha", 0.001)
+    assert timeouts.timeout("alpha") == 2
+    timeouts.expire("alpha")
+    assert timeouts.timeout("alpha") == 2
+
+
+def test_peary_timeouts_set() -> None:
+    timeouts = PearyTimeouts()
+    timeouts.adaptive = True
+    timeouts.observe("alpha", 0.001)
+    timeouts.set("alpha", 30)
+    assert timeouts.timeout("alpha") == 30
+    assert timeouts.timeout("beta") == 1
+    timeouts.set("alpha", None)
+    timeouts.set("beta", None)
+    assert timeouts.timeout("alpha") == timeouts.minimum
+
+
+def test_peary_timeouts_adaptive() -> None:
+    timeouts = PearyTimeouts()
+    timeouts.adaptive = True
+    timeouts.minimum = 0
+    assert timeouts.estimate("alpha") is None
+    timeouts.observe("alpha", 1.0)
+    assert timeouts.timeout("alpha") == pytest.approx(3.0)
+    timeouts.observe("alpha", 1.0)
+    assert timeouts.timeout("alpha") == pytest.approx(2.5)
+    timeouts.observe("alpha", 3.0)
+    assert timeouts.timeout("alpha") == pytest.approx(1.25 + 4 * 0.78125)
+    timeouts.maximum = 2
+    assert timeouts.timeout("alpha") == 2
+
+
+def test_peary_timeouts_expire() -> None:
+    timeouts = PearyTimeouts(0.5)
+    timeouts.adaptive = True
+    timeouts.expire("alpha")
+    assert timeouts.timeout("alpha") == 1
+    timeouts.expire("alpha")
+    assert timeouts.timeout("alpha") == 2
+    timeouts.maximum = 3
+    timeouts.expire("alpha")
+    assert timeouts.timeout("alpha") == 3
+    timeouts.observe("alpha", 0.001)
+    assert timeouts.timeout("alpha") == timeouts.minimum
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_emulator import PearyEmulator
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+@pytest.fixture(name="unix_emulator")
+def _unix_emulator(tmp_path: Path) -> Generator[str]:
+    path = str(tmp_path / "peary.sock")
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(PearyEmulator().start_unix(path))
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    yield path
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    loop.close()
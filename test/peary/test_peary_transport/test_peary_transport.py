@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import socket
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_client_pool import PearyClientPool
+from peary.peary_emulator import PearyEmulator
+from peary.peary_protocol import PearyProtocol
+from peary.peary_reconnecting_protocol import PearyReconnectingProtocol
+from peary.peary_transport import (
+    PearyInProcessSocket,
+    PearyInProcessTransport,
+    PearyKeepalive,
+    PearyTcpTransport,
+    PearyUnixTransport,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_peary_tcp_transport_options() -> None:
+    transport = PearyTcpTransport("127.0.0.1", 4000)
+    transport.keepalive = PearyKeepalive(idle=30, interval=2, probes=4)
+    assert transport.address == ("127.0.0.1", 4000)
+    assert str(transport) == "host 127.0.0.1 using port 4000"
+    with transport.create_socket() as sock:
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        if hasattr(socket, "TCP_KEEPIDLE"):  # pragma: no branch
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+    transport.nodelay = False
+    transport.keepalive = None
+    with transport.create_socket() as sock:
+        assert not sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        assert not sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+
+def test_peary_unix_transport(unix_emulator: str) -> None:
+    transport = PearyUnixTransport(unix_emulator)
+    assert transport.address == unix_emulator
+    assert str(transport) == f"unix socket {unix_emulator}"
+    client = PearyClient(transport)
+    assert client.transport is transport
+    with client as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 3)
+        assert device.get_register("reg") == 3
+
+
+def test_peary_unix_transport_connect_error(tmp_path: Path) -> None:
+    with pytest.raises(PearyClient.PearySockerError, match="unix socket"):
+        _connect(PearyClient(PearyUnixTransport(tmp_path / "missing.sock")))
+
+
+def test_peary_in_process_transport() -> None:
+    emulator = PearyEmulator()
+    transport = PearyInProcessTransport(emulator)
+    assert not transport.address
+    assert str(transport) == "in-process emulator"
+    with PearyClient(transport) as proxy:
+        device = proxy.add_device("Caribou")
+        with device.batch() as batch:
+            batch.set_register("reg", 3)
+            value = batch.get_register("reg")
+        assert value.result() == 3
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            proxy.protocol.request("device.get_register", "5", "reg")
+    assert [d.name for d in emulator.devices] == ["Caribou"]
+
+
+def test_peary_in_process_socket() -> None:
+    sock = PearyInProcessSocket(PearyEmulator())
+    frame = PearyProtocol.encode(b"protocol_version", 1, 0)
+    with pytest.raises(BrokenPipeError):
+        sock.sendmsg([frame])
+    sock.connect("")
+    buffer = bytearray(64)
+    with pytest.raises(TimeoutError):
+        sock.recv_into(buffer)
+    assert sock.sendmsg([frame[:5], frame[5:]]) == len(frame)
+    size = sock.recv_into(buffer)
+    assert PearyProtocol.decode(bytes(buffer[:size])).payload == PearyProtocol.VERSION
+    sock.sendmsg([frame])
+    sock.shutdown(socket.SHUT_RDWR)
+    assert sock.recv_into(buffer) == 0
+
+
+def test_peary_in_process_transport_reconnect() -> None:
+    emulator = PearyEmulator()
+    client = PearyClient(
+        PearyInProcessTransport(emulator), protocol_class=PearyReconnectingProtocol
+    )
+    with client as proxy:
+        device = proxy.add_device("Caribou")
+        device.set_register("reg", 3)
+        client.socket.shutdown(socket.SHUT_RDWR)
+        assert device.get_register("reg") == 3
+        assert device.index == 1
+
+
+def test_peary_in_process_transport_pool() -> None:
+    emulator = PearyEmulator()
+    with PearyClientPool(PearyInProcessTransport(emulator), size=2) as pool:
+        with pool.acquire() as first, pool.acquire() as second:
+            first.add_device("Caribou")
+            second.add_device("Caribou")
+        assert len(pool.connections) == 2
+    assert len(emulator.devices) == 2
+
+
+def _connect(client: PearyClient) -> None:
+    with client:
+        pass  # pragma: no cover